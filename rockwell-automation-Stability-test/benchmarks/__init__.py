@@ -0,0 +1,4 @@
+"""
+Benchmarks of the framework itself (page object helpers, waits, logging, screenshots),
+run offline against local pages so the numbers do not include production latency.
+"""
@@ -0,0 +1,368 @@
+"""
+Locator performance analyzer.
+
+Times every class-level locator of the page objects inside the browser, flags the ones that are
+ambiguous, brittle or expensive, and proposes shorter equivalent CSS selectors (or relative
+XPaths) with the lookup cost before and after. Pages come from saved DOM snapshots (e.g. the
+page sources kept by --flight-recorder) or from the local stand-in.
+Results are written to reports/benchmarks/locators_<timestamp>.json.
+
+    python -m benchmarks.locators --standin
+    python -m benchmarks.locators --dom "reports/screenshots/ftdspprod003/flight_*/*.html"
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import pathlib
+import pkgutil
+import re
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+import pages
+from benchmarks.overhead import OUTPUT_DIR, _measure
+from pages.base_page import BasePage
+from standin import StandInServer
+from utils.driver_factory import DriverFactory
+
+STRATEGIES = {By.ID, By.XPATH, By.CSS_SELECTOR, By.NAME, By.CLASS_NAME, By.TAG_NAME, By.LINK_TEXT,
+              By.PARTIAL_LINK_TEXT}
+# Locators longer than this break on any layout change
+MAX_LOCATOR_LENGTH = 100
+# Child combinators from which a CSS selector is considered a hard-coded path
+MAX_CSS_DEPTH = 6
+# Ancestors inspected when looking for an anchor for a shorter selector
+ANCESTOR_DEPTH = 8
+# Ids generated by Angular Material/CDK (mat-input-0, mat-mdc-dialog-3) change between sessions
+GENERATED_ID = re.compile(r"-\d+$")
+# Classes that describe a transient state rather than the element
+STATE_CLASS = re.compile(r"^(ng-|cdk-.*focused|mat-focused|mat-mdc-focus|mat-ripple)|--(active|selected|focused|"
+                         r"hover|disabled|expanded|checked)$")
+STABLE_ATTRIBUTES = ("data-testid", "data-test", "data-qa", "data-cy", "name", "formcontrolname", "aria-label",
+                     "placeholder", "title")
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.S | re.I)
+STANDIN_SCREENS = ("", "login", "ide")
+
+LOCATE_ALL_JS = """
+function locateAll(by, value) {
+    var result;
+    switch (by) {
+        case 'xpath':
+            result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        case 'id': result = document.querySelectorAll('[id="' + value + '"]'); break;
+        case 'name': result = document.getElementsByName(value); break;
+        case 'class name': result = document.getElementsByClassName(value); break;
+        case 'tag name': result = document.getElementsByTagName(value); break;
+        case 'link text':
+        case 'partial link text':
+            result = Array.prototype.filter.call(document.getElementsByTagName('a'), function (link) {
+                var text = link.textContent.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+            break;
+        default: result = document.querySelectorAll(value);
+    }
+    return Array.prototype.slice.call(result);
+}
+"""
+
+# Number of matches and mean evaluation time of one lookup, measured without WebDriver round trips
+LOOKUP_JS = LOCATE_ALL_JS + """
+var by = arguments[0], value = arguments[1], iterations = arguments[2];
+var count;
+try { count = locateAll(by, value).length; } catch (e) { return {error: String(e)}; }
+var start = performance.now();
+for (var i = 0; i < iterations; i++) locateAll(by, value);
+return {count: count, ms: (performance.now() - start) / iterations};
+"""
+
+# Tag, attributes, position among same-tag siblings and short own text of the first match and its ancestors
+DESCRIBE_JS = LOCATE_ALL_JS + """
+var chain = [];
+var node = locateAll(arguments[0], arguments[1])[0];
+for (; node && node !== document.documentElement && chain.length <= arguments[2]; node = node.parentElement) {
+    var attributes = {};
+    for (var i = 0; i < node.attributes.length; i++) attributes[node.attributes[i].name] = node.attributes[i].value;
+    var sameTag = 0, index = 0;
+    for (var sibling = node.parentElement.firstElementChild; sibling; sibling = sibling.nextElementSibling) {
+        if (sibling.tagName === node.tagName) {
+            sameTag++;
+            if (sibling === node) index = sameTag;
+        }
+    }
+    var text = node.children.length ? '' : node.textContent.trim();
+    chain.push({tag: node.tagName.toLowerCase(), attributes: attributes, index: index, same_tag: sameTag,
+                text: text.length <= 40 ? text : ''});
+}
+return chain;
+"""
+
+# For each candidate [by, value]: true if it matches exactly the element the original locator finds
+VERIFY_JS = LOCATE_ALL_JS + """
+var target = locateAll(arguments[0], arguments[1])[0];
+return arguments[2].map(function (candidate) {
+    try {
+        var nodes = locateAll(candidate[0], candidate[1]);
+        return nodes.length === 1 && nodes[0] === target;
+    } catch (e) {
+        return false;
+    }
+});
+"""
+
+
+def page_classes():
+    """
+    Page object classes of the pages package (every BasePage subclass).
+    """
+    for module in pkgutil.iter_modules(pages.__path__):
+        importlib.import_module(f"pages.{module.name}")
+    found, pending = [], [BasePage]
+    while pending:
+        klass = pending.pop()
+        found.append(klass)
+        pending.extend(klass.__subclasses__())
+    return sorted(found, key=lambda klass: klass.__name__)
+
+
+def class_locators(classes):
+    """
+    Locators declared as class attributes, grouped by value (several names may share one).
+
+    Returns:
+        list: {"page", "names", "by", "value"} in declaration order
+    """
+    grouped = {}
+    for klass in classes:
+        for name, value in vars(klass).items():
+            if (isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES
+                    and isinstance(value[1], str)):
+                entry = grouped.setdefault(value, {"page": klass.__name__, "names": [], "by": value[0],
+                                                   "value": value[1]})
+                entry["names"].append(name)
+    return list(grouped.values())
+
+
+def locator_flags(by, value):
+    """
+    Static problems of a locator: hard-coded paths, excessive length and generated ids.
+    """
+    flags = []
+    if (by == By.XPATH and value.startswith("/") and not value.startswith("//")) or \
+            (by == By.CSS_SELECTOR and value.count(">") >= MAX_CSS_DEPTH):
+        flags.append("absolute_path")
+    if len(value) > MAX_LOCATOR_LENGTH:
+        flags.append("long")
+    ids = [value] if by == By.ID else re.findall(r"#([\w-]+)", value) + re.findall(r"@id=[\"']([^\"']+)", value)
+    if by in (By.ID, By.CSS_SELECTOR, By.XPATH) and any(GENERATED_ID.search(element_id) for element_id in ids):
+        flags.append("generated_id")
+    return flags
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _is_identifier(value):
+    return bool(re.fullmatch(r"-?[_a-zA-Z][\w-]*", value))
+
+
+def _own_selectors(node):
+    """
+    CSS selectors that may identify a node on their own, most stable first.
+    """
+    tag, attributes = node["tag"], node["attributes"]
+    selectors = []
+    element_id = attributes.get("id")
+    if element_id and not GENERATED_ID.search(element_id):
+        selectors.append(f"#{element_id}" if _is_identifier(element_id) else f"[id={_css_string(element_id)}]")
+    for attribute in STABLE_ATTRIBUTES:
+        if attributes.get(attribute):
+            selectors.append(f"{tag}[{attribute}={_css_string(attributes[attribute])}]")
+    classes = [name for name in attributes.get("class", "").split()
+               if _is_identifier(name) and not STATE_CLASS.search(name)]
+    selectors.extend(f"{tag}.{name}" for name in classes)
+    if len(classes) > 1:
+        selectors.append(tag + "".join(f".{name}" for name in classes))
+    return selectors
+
+
+def suggest_locators(chain):
+    """
+    Candidate replacements for a locator, most stable first: the element's own id, attributes or
+    classes, its text, a descendant of a stable ancestor and, last, a short positional path from
+    the nearest anchorable ancestor. Candidates still have to be verified in the browser.
+
+    Args:
+        chain (list): Element and ancestors as returned by DESCRIBE_JS
+
+    Returns:
+        list: (By, value) candidates without duplicates
+    """
+    target = chain[0]
+    own = _own_selectors(target)
+    candidates = [(By.CSS_SELECTOR, selector) for selector in own]
+    if target["text"] and '"' not in target["text"]:
+        candidates.append((By.XPATH, f'//{target["tag"]}[normalize-space()="{target["text"]}"]'))
+
+    tails = own + [target["tag"]]
+    for ancestor in chain[1:]:
+        for anchor in _own_selectors(ancestor):
+            candidates.extend((By.CSS_SELECTOR, f"{anchor} {tail}") for tail in tails)
+
+    path = []
+    for node in chain:
+        if path:
+            candidates.extend((By.CSS_SELECTOR, f"{anchor} > {' > '.join(reversed(path))}")
+                              for anchor in _own_selectors(node))
+        path.append(node["tag"] + (f":nth-of-type({node['index']})" if node["same_tag"] > 1 else ""))
+    return list(dict.fromkeys(candidates))
+
+
+def _cost(driver, by, value, iterations, find_runs):
+    """
+    In-browser evaluation time of one lookup and median find_elements round trip, in milliseconds.
+    """
+    lookup = driver.execute_script(LOOKUP_JS, by, value, iterations)
+    find = _measure(lambda: driver.find_elements(by, value), find_runs, warmup=1)
+    return {"eval_ms": round(lookup["ms"], 4), "find_ms": round(statistics.median(find) * 1000, 3)}
+
+
+def analyze(driver, sources, iterations=200, find_runs=10, slow_ms=0.1):
+    """
+    Evaluates every class-level locator on the first source page where it matches.
+
+    Args:
+        driver: WebDriver used to load the pages
+        sources (list): (label, url) of the pages to load, in order
+        iterations (int, optional): Lookups per in-browser timing
+        find_runs (int, optional): find_elements calls per round-trip timing
+        slow_ms (float, optional): In-browser time per lookup from which a locator is flagged as slow
+
+    Returns:
+        list: One result per locator with its flags, cost and suggested replacement
+    """
+    locators = class_locators(page_classes())
+    results = {}
+    for label, url in sources:
+        driver.get(url)
+        for locator in locators:
+            key = (locator["by"], locator["value"])
+            if key in results:
+                continue
+            lookup = driver.execute_script(LOOKUP_JS, locator["by"], locator["value"], 1)
+            if lookup.get("error") or not lookup["count"]:
+                continue
+            results[key] = _analyze_locator(driver, locator, label, lookup["count"], iterations, find_runs,
+                                            slow_ms)
+
+    report = []
+    for locator in locators:
+        key = (locator["by"], locator["value"])
+        report.append(results.get(key) or dict(locator, source=None, matches=0,
+                                               flags=locator_flags(*key) + ["not_found"]))
+    return report
+
+
+def _analyze_locator(driver, locator, source, matches, iterations, find_runs, slow_ms):
+    by, value = locator["by"], locator["value"]
+    result = dict(locator, source=source, matches=matches, flags=locator_flags(by, value))
+    result["before"] = _cost(driver, by, value, iterations, find_runs)
+    if matches > 1:
+        result["flags"].append("ambiguous")
+    if result["before"]["eval_ms"] > slow_ms:
+        result["flags"].append("slow")
+    if not result["flags"]:
+        return result
+
+    chain = driver.execute_script(DESCRIBE_JS, by, value, ANCESTOR_DEPTH)
+    candidates = suggest_locators(chain)
+    valid = driver.execute_script(VERIFY_JS, by, value, [list(candidate) for candidate in candidates])
+    replacements = [candidate for candidate, ok in zip(candidates, valid) if ok]
+    if replacements:
+        suggestion = replacements[0]
+        result["suggestion"] = dict({"by": suggestion[0], "value": suggestion[1]},
+                                    **_cost(driver, *suggestion, iterations, find_runs))
+        result["alternatives"] = [{"by": alternative[0], "value": alternative[1]} for alternative in replacements[1:4]]
+    return result
+
+
+def _dom_sources(patterns, workdir):
+    """
+    Copies the saved DOM snapshots without their scripts (they would try to boot the app) and
+    returns them as file:// pages.
+    """
+    sources = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, encoding="utf-8") as snapshot:
+                html = SCRIPT_TAG.sub("", snapshot.read())
+            static_copy = os.path.join(workdir, f"{len(sources):03d}_{os.path.basename(path)}")
+            with open(static_copy, "w", encoding="utf-8") as output:
+                output.write(html)
+            sources.append((path, pathlib.Path(static_copy).as_uri()))
+    return sources
+
+
+def print_report(report):
+    flagged = [result for result in report if result["flags"]]
+    print(f"{len(report)} locators, {len(flagged)} flagged")
+    for result in flagged:
+        print(f"\n{result['page']}.{'/'.join(result['names'])} [{', '.join(result['flags'])}]")
+        print(f"  {result['by']}: {result['value'][:120]}{'...' if len(result['value']) > 120 else ''}")
+        if "before" in result:
+            print(f"  before: {result['before']['eval_ms']:.4f} ms in browser, "
+                  f"{result['before']['find_ms']:.2f} ms find_elements ({result['matches']} matches)")
+        if "suggestion" in result:
+            suggestion = result["suggestion"]
+            print(f"  suggest {suggestion['by']}: {suggestion['value']}")
+            print(f"  after:  {suggestion['eval_ms']:.4f} ms in browser, {suggestion['find_ms']:.2f} ms find_elements")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times page object locators and suggests shorter equivalents.")
+    parser.add_argument("--standin", action="store_true", help="Analyze the pages of the local stand-in")
+    parser.add_argument("--dom", nargs="+", default=[], metavar="PATTERN",
+                        help="Saved DOM snapshots (.html files or glob patterns)")
+    parser.add_argument("--iterations", type=int, default=200, help="Lookups per in-browser timing")
+    parser.add_argument("--find-runs", type=int, default=10, help="find_elements calls per round-trip timing")
+    parser.add_argument("--slow-ms", type=float, default=0.1, help="In-browser ms per lookup flagged as slow")
+    parser.add_argument("--output", help="Results file (default: reports/benchmarks/locators_<timestamp>.json)")
+    args = parser.parse_args(argv)
+    if not args.standin and not args.dom:
+        parser.error("give --standin and/or --dom")
+
+    server = StandInServer(port=0).start() if args.standin else None
+    driver = DriverFactory.get_driver("chrome")
+    try:
+        with tempfile.TemporaryDirectory(prefix="locators_") as workdir:
+            sources = _dom_sources(args.dom, workdir)
+            if server:
+                sources += [(f"standin/{screen}", urljoin(server.url, screen)) for screen in STANDIN_SCREENS]
+            report = analyze(driver, sources, args.iterations, args.find_runs, args.slow_ms)
+    finally:
+        driver.quit()
+        if server:
+            server.stop()
+
+    print_report(report)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output = args.output or os.path.join(OUTPUT_DIR, f"locators_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"\nLocator report: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
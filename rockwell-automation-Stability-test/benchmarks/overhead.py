@@ -0,0 +1,281 @@
+"""
+Framework overhead benchmark.
+
+Measures what BasePage adds on top of plain Selenium for each action, the logger throughput and
+the end-to-end wall time of LoginPage.complete_test against the local stand-in with zero latency.
+Results are written to reports/benchmarks/overhead_<timestamp>_<commit>.json.
+
+    python -m benchmarks.overhead
+    python -m benchmarks.overhead --iterations 50 --e2e-runs 5
+    python -m benchmarks.overhead --compare reports/benchmarks/a.json reports/benchmarks/b.json
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import selenium
+from selenium.webdriver.common.by import By
+
+from config.config import REPORTS_DIR, SCREENSHOTS_DIR
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from standin import StandInServer
+from utils.driver_factory import DriverFactory
+from utils.logger import logger, get_output_handlers, flush_logs
+from utils.screenshots import screenshot_writer
+from utils.step_timer import StepTimer
+from utils.timing_store import percentile
+
+BENCH_PAGE = pathlib.Path(__file__).with_name("bench_page.html")
+BENCH_INPUT = (By.ID, "benchInput")
+BENCH_BUTTON = (By.ID, "benchButton")
+OUTPUT_DIR = os.path.join(REPORTS_DIR, "benchmarks")
+
+
+def _stats(samples):
+    """
+    Summary of a list of durations in seconds, reported in milliseconds.
+    """
+    return {
+        "n": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+    }
+
+
+def _measure(action, iterations, warmup=3):
+    for _ in range(warmup):
+        action()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class _QuietConsole:
+    """
+    Points the logger's console handlers at /dev/null while benchmarking, so the terminal
+    does not skew the numbers; formatting and file writes still happen.
+    """
+
+    def __enter__(self):
+        self._devnull = open(os.devnull, "w")
+        self._streams = {}
+        for handler in get_output_handlers():
+            if type(handler) is logging.StreamHandler:
+                self._streams[handler] = handler.setStream(self._devnull)
+        return self
+
+    def __exit__(self, *exc):
+        for handler, stream in self._streams.items():
+            handler.setStream(stream)
+        self._devnull.close()
+
+
+def bench_actions(driver, iterations):
+    """
+    Times each BasePage helper against the equivalent plain Selenium calls on a static page.
+
+    Returns:
+        dict: Per action, framework and raw statistics, overhead and WebDriver commands per call
+    """
+    page = BasePage(driver, BENCH_PAGE.parent.as_uri() + "/")
+    page.open(BENCH_PAGE.name)
+    screenshot_dir = tempfile.mkdtemp(prefix="benchmark_")
+
+    actions = {
+        "find_element": (
+            lambda: page.find_element(BENCH_INPUT),
+            lambda: driver.find_element(*BENCH_INPUT),
+        ),
+        "click_element": (
+            lambda: page.click_element(BENCH_BUTTON),
+            lambda: driver.find_element(*BENCH_BUTTON).click(),
+        ),
+        "input_text": (
+            lambda: page.input_text(BENCH_INPUT, "benchmark"),
+            lambda: _raw_input(driver, "benchmark"),
+        ),
+        "take_screenshot": (
+            lambda: page.take_screenshot("benchmark"),
+            lambda: driver.save_screenshot(os.path.join(screenshot_dir, "raw.png")),
+        ),
+    }
+
+    results = {}
+    for name, (framework_action, raw_action) in actions.items():
+        # Fewer screenshots: each one is an order of magnitude slower than the other actions
+        count = max(3, iterations // 5) if name == "take_screenshot" else iterations
+        commands_before = page.timer.command_count
+        framework = _measure(framework_action, count)
+        framework_commands = (page.timer.command_count - commands_before) / (count + 3)
+        commands_before = page.timer.command_count
+        raw = _measure(raw_action, count)
+        raw_commands = (page.timer.command_count - commands_before) / (count + 3)
+        results[name] = {
+            "framework": _stats(framework),
+            "raw": _stats(raw),
+            "overhead_ms": round((statistics.median(framework) - statistics.median(raw)) * 1000, 3),
+            "commands_per_call": {"framework": framework_commands, "raw": raw_commands},
+        }
+
+    screenshot_writer.flush()
+    for path in glob.glob(os.path.join(SCREENSHOTS_DIR, "*", "benchmark_*.*")):
+        os.remove(path)
+    for path in glob.glob(os.path.join(screenshot_dir, "*")):
+        os.remove(path)
+    os.rmdir(screenshot_dir)
+    return results
+
+
+def _raw_input(driver, text):
+    element = driver.find_element(*BENCH_INPUT)
+    element.clear()
+    element.send_keys(text)
+
+
+def bench_logger(messages):
+    """
+    Measures how many framework log records per second the test thread can emit, and how long
+    the configured handlers take to write them all (the same in synchronous mode).
+    """
+    flush_logs()
+    start = time.perf_counter()
+    for index in range(messages):
+        logger.info("Benchmark log message %s: element %s='%s'", index, By.ID, "benchInput")
+    emitted = time.perf_counter() - start
+    flush_logs()
+    written = time.perf_counter() - start
+    return {
+        "messages": messages,
+        "seconds": round(emitted, 4),
+        "messages_per_second": round(messages / emitted, 1),
+        "us_per_message": round(emitted / messages * 1e6, 2),
+        "written_seconds": round(written, 4),
+    }
+
+
+def bench_complete_test(driver, runs):
+    """
+    End-to-end wall time of LoginPage.complete_test against the stand-in with zero latency:
+    everything measured is browser and framework time.
+    """
+    server = StandInServer(port=0).start()
+    durations, steps = [], {}
+    try:
+        for _ in range(runs):
+            driver.delete_all_cookies()
+            start = time.perf_counter()
+            page = LoginPage(driver, server.url)
+            page.complete_test("benchmark@example.com", "benchmark")
+            durations.append(time.perf_counter() - start)
+            for record in page.timer.records:
+                if record["kind"] == "step":
+                    steps.setdefault(record["name"], []).append(record["duration"])
+            StepTimer.release(driver)
+    finally:
+        server.stop()
+    return {
+        "wall_time": _stats(durations),
+        "steps_p50_s": {name: round(percentile(values, 50), 3) for name, values in steps.items()},
+    }
+
+
+def run(iterations, log_messages, e2e_runs, output=None):
+    """
+    Runs every benchmark on a fresh headless Chrome and writes the results to JSON.
+
+    Returns:
+        str: Path of the results file
+    """
+    driver = DriverFactory.get_driver("chrome")
+    try:
+        with _QuietConsole():
+            results = {
+                "commit": _commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "selenium": selenium.__version__,
+                "browser": driver.capabilities.get("browserVersion"),
+                "iterations": iterations,
+                "actions": bench_actions(driver, iterations),
+                "logger": bench_logger(log_messages),
+            }
+            StepTimer.release(driver)
+            if e2e_runs:
+                results["complete_test"] = bench_complete_test(driver, e2e_runs)
+    finally:
+        driver.quit()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output = output or os.path.join(
+        OUTPUT_DIR, f"overhead_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{results['commit']}.json")
+    with open(output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    return output
+
+
+def compare(baseline_path, candidate_path):
+    """
+    Prints the change of each median between two result files.
+    """
+    with open(baseline_path) as baseline_file, open(candidate_path) as candidate_file:
+        baseline, candidate = json.load(baseline_file), json.load(candidate_file)
+    print(f"{baseline['commit']} -> {candidate['commit']}")
+
+    def line(label, before, after, unit):
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"  {label:<32} {before:>10.2f} {after:>10.2f} {unit:<5} {change:+7.1f}%")
+
+    for name, result in candidate["actions"].items():
+        if name in baseline["actions"]:
+            line(f"{name} (framework p50)", baseline["actions"][name]["framework"]["p50_ms"],
+                 result["framework"]["p50_ms"], "ms")
+            line(f"{name} (overhead)", baseline["actions"][name]["overhead_ms"], result["overhead_ms"], "ms")
+    line("logger", baseline["logger"]["messages_per_second"], candidate["logger"]["messages_per_second"], "msg/s")
+    if "complete_test" in baseline and "complete_test" in candidate:
+        line("complete_test (p50)", baseline["complete_test"]["wall_time"]["p50_ms"] / 1000,
+             candidate["complete_test"]["wall_time"]["p50_ms"] / 1000, "s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of the framework overhead on top of Selenium.")
+    parser.add_argument("--iterations", type=int, default=30, help="Calls per action (default: %(default)s)")
+    parser.add_argument("--log-messages", type=int, default=5000, help="Records for the logger benchmark")
+    parser.add_argument("--e2e-runs", type=int, default=3, help="complete_test runs against the stand-in (0 skips)")
+    parser.add_argument("--output", help="Results file (default: reports/benchmarks/overhead_<ts>_<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"),
+                        help="Compare two results files instead of running")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+    print(f"Benchmark results: {run(args.iterations, args.log_messages, args.e2e_runs, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,61 +1,156 @@
-"""
-Archivo de configuración global para el framework de automatización.
-Contiene variables y configuraciones utilizadas en todo el proyecto.
-"""
-import os
-from dotenv import load_dotenv
-'''
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.containerservice import ContainerServiceClient
-from azure.mgmt.resource import ResourceManagementClient
-
-#ID de suscripción de Azure
-subscription_id = '3912f235-0a8c-4af2-8ca4-95f2e457cf4a'
-    # Configurar las credenciales utilizando DefaultAzureCredential
-credentials = DefaultAzureCredential()
-    # Cliente para interactuar con los recursos de Azure
-resource_client = ResourceManagementClient(credentials, subscription_id)
-    # Cliente para interactuar con los servicios de contenedor de Azure
-aks_client = ContainerServiceClient(credentials, subscription_id)
-    # Obtener la lista de clústeres AKS
-clusters = aks_client.managed_clusters.list()
-Nombre = []
-    # Mostrar información sobre cada clúster
-for cluster in clusters:    
-    Nombre.append(cluster.name)
-
-    # Cerrar sesiones
-aks_client.close()
-resource_client.close()
-'''
-
-# Carga variables de entorno a mi entorno virtual 
-load_dotenv()
-
-# URL base del 
-BASE_URLS = [
-    f"https://ftdspprod{str(i).zfill(3)}.ftds.rockwellautomation.com/"
-    for i in range(1, 31)  # Genera URLs de produccion del 001 al 020
-]
-# URL base por defecto (la primera en la lista)
-DEFAULT_BASE_URL = BASE_URLS[-1]
-# Timeouts globales (en segundos)
-DEFAULT_TIMEOUT = 120
-IMPLICIT_WAIT = 5
-PAGE_LOAD_TIMEOUT = 10
-
-# Configuración de navegador por defecto
-DEFAULT_BROWSER = "chrome"
-
-# Rutas de directorios
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
-SCREENSHOTS_DIR = os.path.join(REPORTS_DIR, "screenshots")
-
-# Credenciales
-TEST_USERNAME = os.getenv("TEST_USERNAME","")
-TEST_PASSWORD = os.getenv("TEST_PASSWORD","")
-
-# Asegura que los directorios necesarios existen
-os.makedirs(REPORTS_DIR, exist_ok=True)
+"""
+Archivo de configuración global para el framework de automatización.
+Contiene variables y configuraciones utilizadas en todo el proyecto.
+"""
+import os
+from dotenv import load_dotenv
+'''
+from azure.identity import DefaultAzureCredential
+from azure.mgmt.containerservice import ContainerServiceClient
+from azure.mgmt.resource import ResourceManagementClient
+
+#ID de suscripción de Azure
+subscription_id = '3912f235-0a8c-4af2-8ca4-95f2e457cf4a'
+    # Configurar las credenciales utilizando DefaultAzureCredential
+credentials = DefaultAzureCredential()
+    # Cliente para interactuar con los recursos de Azure
+resource_client = ResourceManagementClient(credentials, subscription_id)
+    # Cliente para interactuar con los servicios de contenedor de Azure
+aks_client = ContainerServiceClient(credentials, subscription_id)
+    # Obtener la lista de clústeres AKS
+clusters = aks_client.managed_clusters.list()
+Nombre = []
+    # Mostrar información sobre cada clúster
+for cluster in clusters:    
+    Nombre.append(cluster.name)
+
+    # Cerrar sesiones
+aks_client.close()
+resource_client.close()
+'''
+
+# Carga variables de entorno a mi entorno virtual 
+load_dotenv()
+
+# URL base del 
+BASE_URLS = [
+    f"https://ftdspprod{str(i).zfill(3)}.ftds.rockwellautomation.com/"
+    for i in range(1, 31)  # Genera URLs de produccion del 001 al 020
+]
+# URL base por defecto (la primera en la lista)
+DEFAULT_BASE_URL = BASE_URLS[-1]
+# Timeouts globales (en segundos)
+DEFAULT_TIMEOUT = 120
+IMPLICIT_WAIT = 5
+PAGE_LOAD_TIMEOUT = 10
+# Límite de execute_async_script; las esperas por MutationObserver se trocean por debajo de este valor
+SCRIPT_TIMEOUT = 30
+# Espera de "app en reposo": sin fetch/XHR pendientes ni nodos/textos nuevos en el DOM durante la ventana de silencio.
+# El máximo es el sleep fijo de 6 s al que sustituye: si la app no se calma antes, se sigue como antes
+SETTLE_QUIET_WINDOW = float(os.getenv("SETTLE_QUIET_WINDOW", "1.0"))
+SETTLE_TIMEOUT = float(os.getenv("SETTLE_TIMEOUT", "6"))
+# Peticiones abiertas más tiempo que esto (long polling) no impiden el reposo
+SETTLE_MAX_REQUEST_AGE = float(os.getenv("SETTLE_MAX_REQUEST_AGE", "5"))
+# Caché de elementos por page object: reutiliza el WebElement de la última espera/búsqueda del localizador
+ELEMENT_CACHE = os.getenv("ELEMENT_CACHE", "true").lower() == "true"
+
+# Instrumentación opcional (activable también desde la línea de comandos de pytest)
+COLLECT_PERF_METRICS = os.getenv("COLLECT_PERF_METRICS", "false").lower() == "true"
+CAPTURE_HAR = os.getenv("CAPTURE_HAR", "false").lower() == "true"
+PROFILE_COMMANDS = os.getenv("PROFILE_COMMANDS", "false").lower() == "true"
+# Flight recorder (--flight-recorder): últimas N capturas/DOM en memoria, se escriben solo si algo falla
+FLIGHT_RECORDER = os.getenv("FLIGHT_RECORDER", "false").lower() == "true"
+FLIGHT_RECORDER_SIZE = int(os.getenv("FLIGHT_RECORDER_SIZE", "5"))
+FLIGHT_RECORDER_DOM = os.getenv("FLIGHT_RECORDER_DOM", "true").lower() == "true"
+# Screencast CDP (--screencast, solo Chrome): pocos fotogramas por segundo, JPEG de baja calidad
+SCREENCAST = os.getenv("SCREENCAST", "false").lower() == "true"
+SCREENCAST_FPS = float(os.getenv("SCREENCAST_FPS", "2"))
+SCREENCAST_QUALITY = int(os.getenv("SCREENCAST_QUALITY", "40"))
+SCREENCAST_MAX_WIDTH = int(os.getenv("SCREENCAST_MAX_WIDTH", "960"))
+
+# Logging: en modo asíncrono el formateo y la escritura se hacen en un hilo de fondo
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+# Nivel de la consola (el fichero de log siempre registra DEBUG)
+LOG_CONSOLE_LEVEL = os.getenv("LOG_CONSOLE_LEVEL", "DEBUG").upper()
+# Log estructurado events_<timestamp>.jsonl: rotación por tamaño, segmentos antiguos comprimidos con gzip
+LOG_JSON = os.getenv("LOG_JSON", "true").lower() == "true"
+LOG_JSON_MAX_BYTES = int(os.getenv("LOG_JSON_MAX_BYTES", str(20 * 1024 * 1024)))
+LOG_JSON_BACKUPS = int(os.getenv("LOG_JSON_BACKUPS", "10"))
+
+# Configuración de navegador por defecto
+DEFAULT_BROWSER = "chrome"
+
+# Ejecución paralela (--workers / --max-browsers)
+# Presupuesto aproximado que consume cada Chrome headless con el IDE cargado
+MAX_BROWSERS = int(os.getenv("MAX_BROWSERS", "1"))
+BROWSER_CPU_COST = float(os.getenv("BROWSER_CPU_COST", "1"))
+BROWSER_MEMORY_MB = int(os.getenv("BROWSER_MEMORY_MB", "1024"))
+
+# Pool de navegadores pre-lanzados (--pool-size / --pool-max-uses)
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+DRIVER_POOL_MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "10"))
+
+# Rutas de directorios
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
+SCREENSHOTS_DIR = os.path.join(REPORTS_DIR, "screenshots")
+# Capturas: se escriben en segundo plano; formato png|jpeg|webp y escala < 1 requieren Pillow
+SCREENSHOT_ASYNC = os.getenv("SCREENSHOT_ASYNC", "true").lower() == "true"
+SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")
+SCREENSHOT_SCALE = float(os.getenv("SCREENSHOT_SCALE", "1"))
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+SCREENSHOT_WORKERS = int(os.getenv("SCREENSHOT_WORKERS", "2"))
+# Histórico de duraciones por paso (SQLite) al que añaden todas las ejecuciones
+TIMINGS_DB = os.getenv("TIMINGS_DB", os.path.join(REPORTS_DIR, "timings.sqlite3"))
+
+# Detección de regresiones de latencia al final de la sesión (--latency-regression off|warn|fail)
+# Cada paso se compara con la mediana/MAD de las últimas ejecuciones correctas del mismo servidor
+LATENCY_REGRESSION = os.getenv("LATENCY_REGRESSION", "warn")
+REGRESSION_BASELINE_RUNS = int(os.getenv("REGRESSION_BASELINE_RUNS", "20"))
+REGRESSION_MIN_SAMPLES = int(os.getenv("REGRESSION_MIN_SAMPLES", "5"))
+REGRESSION_WARN_SCORE = float(os.getenv("REGRESSION_WARN_SCORE", "3.5"))
+REGRESSION_FAIL_SCORE = float(os.getenv("REGRESSION_FAIL_SCORE", "6"))
+# Además de ser estadísticamente significativa, la ralentización debe ser apreciable
+REGRESSION_MIN_RATIO = float(os.getenv("REGRESSION_MIN_RATIO", "1.5"))
+REGRESSION_MIN_DELTA = float(os.getenv("REGRESSION_MIN_DELTA", "2"))
+
+# Stand-in local de FT Design Studio (--standin): JSON con latencia/fallos por endpoint
+# Puerto fijo para que el histórico de tiempos agrupe las ejecuciones bajo el mismo servidor (0 = libre)
+STANDIN_PORT = int(os.getenv("STANDIN_PORT", "8765"))
+STANDIN_CONFIG = os.getenv("STANDIN_CONFIG")
+
+# Comprobación previa de cada servidor antes de lanzar navegadores (--preflight off|skip|fail):
+# DNS, conexión TCP/TLS, tiempo hasta el primer byte y código HTTP, todos los servidores a la vez
+PREFLIGHT = os.getenv("PREFLIGHT", "fail")
+PREFLIGHT_TIMEOUT = float(os.getenv("PREFLIGHT_TIMEOUT", "10"))
+# Los resultados se reutilizan durante este tiempo (p. ej. por los procesos de --workers)
+PREFLIGHT_CACHE_TTL = float(os.getenv("PREFLIGHT_CACHE_TTL", "60"))
+PREFLIGHT_CACHE = os.getenv("PREFLIGHT_CACHE", os.path.join(REPORTS_DIR, "preflight.json"))
+
+# Modo soak (--iterations / --duration / --interval): el flujo se repite contra los servidores seleccionados
+# Tendencias sobre las últimas SOAK_WINDOW iteraciones de cada servidor
+SOAK_WINDOW = int(os.getenv("SOAK_WINDOW", "20"))
+# La sesión falla si algún servidor queda por debajo de esta tasa de éxito
+SOAK_MIN_SUCCESS_RATE = float(os.getenv("SOAK_MIN_SUCCESS_RATE", "0.95"))
+
+# Modo carga (--users / --ramp-up / --hold): K usuarios virtuales a la vez contra un solo servidor
+# CSV con "email,password" por línea: una cuenta distinta por usuario virtual
+LOAD_CREDENTIALS = os.getenv("LOAD_CREDENTIALS")
+# Pausa de cada usuario virtual entre dos iteraciones (segundos)
+LOAD_THINK_TIME = float(os.getenv("LOAD_THINK_TIME", "0"))
+
+# Reutilización de la sesión autenticada (--reuse-session): cookies y storage por servidor y usuario.
+# Fuera de reports/ porque contiene tokens de sesión y CI sube reports/ como artefactos
+REUSE_SESSION = os.getenv("REUSE_SESSION", "false").lower() == "true"
+SESSION_CACHE_DIR = os.getenv("SESSION_CACHE_DIR", os.path.join(PROJECT_ROOT, ".sessions"))
+SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "8"))
+# Espera única para comprobar si la sesión restaurada abre el IDE o el formulario de login
+SESSION_CHECK_TIMEOUT = int(os.getenv("SESSION_CHECK_TIMEOUT", "30"))
+
+# Credenciales
+TEST_USERNAME = os.getenv("TEST_USERNAME","")
+TEST_PASSWORD = os.getenv("TEST_PASSWORD","")
+
+# Asegura que los directorios necesarios existen
+os.makedirs(REPORTS_DIR, exist_ok=True)
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
\ No newline at end of file
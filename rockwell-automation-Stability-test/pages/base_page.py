@@ -1,243 +1,371 @@
-"""
-Clase base para todos los page objects.
-Contiene métodos comunes utilizados en múltiples páginas.
-"""
-
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.remote.webelement import WebElement
-from typing import List, Tuple, Optional
-import time
-from datetime import datetime
-import os
-import re
-from config.config import SCREENSHOTS_DIR
-
-from config.config import DEFAULT_TIMEOUT
-from utils.logger import logger
-
-
-class BasePage:
-    """
-    Clase base que todas las page objects deben heredar.
-    Proporciona métodos comunes para interactuar con elementos de la página.
-    """
-    
-    def __init__(self, driver, base_url=None):
-        """
-        Inicializa el page object.
-        
-        Args:
-            driver: Instancia del WebDriver
-            base_url (str, optional): URL base del sitio
-        """
-        #parametros 
-        self.driver = driver
-        self.base_url = base_url
-    
-    def open(self, url_path=""):
-        """
-        Abre una URL específica, combinándola con la URL base.
-        
-        Args:
-            url_path (str, optional): Ruta a añadir a la URL base
-        """
-        full_url = f"{self.base_url}{url_path}" if self.base_url else url_path
-        logger.info(f"Navegando a: {full_url}")
-        self.driver.get(full_url)
-    
-    def find_element(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
-        """
-        Encuentra un elemento utilizando un localizador específico y espera hasta que esté presente.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador (By.ID, "id_value")
-            timeout (int, optional): Tiempo máximo de espera en segundos
-            
-        Returns:
-            WebElement: Elemento encontrado
-            
-        Raises:
-            TimeoutException: Si el elemento no se encuentra en el tiempo especificado
-        """
-        try:
-            logger.debug(f"Buscando elemento: {locator[0]}='{locator[1]}'")
-            start_time = time.time()
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            elapsed_time = time.time() - start_time
-            logger.debug(f"Elemento encontrado en {elapsed_time:.2f} segundos: {locator[0]}='{locator[1]}'")
-            return element
-        except TimeoutException:
-            logger.error(f"⚠️ NO SE ENCONTRÓ el elemento {locator[0]}='{locator[1]}' después de {timeout} segundos")
-            self.take_screenshot(f"error_find_{locator[1].replace(':', '_')}")
-            raise
-    
-    def is_element_present(self, locator: Tuple[str, str], timeout=5) -> bool:
-        """
-        Verifica si un elemento está presente en la página.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            timeout (int, optional): Tiempo máximo de espera en segundos
-            
-        Returns:
-            bool: True si el elemento está presente, False en caso contrario
-        """
-        try:
-            self.find_element(locator, timeout)
-            return True
-        except (TimeoutException, NoSuchElementException):
-            return False
-    
-    def click_element(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT):
-        """
-        Encuentra un elemento y hace clic en él.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            timeout (int, optional): Tiempo máximo de espera en segundos
-        """
-        element = self.find_element(locator, timeout)
-        logger.info(f"👆 Haciendo clic en elemento: {locator[0]}='{locator[1]}'")
-        try:
-            element.click()
-            logger.debug(f"Clic realizado exitosamente en: {locator[0]}='{locator[1]}'")
-        except Exception as e:
-            logger.error(f"⚠️ Error al hacer clic en {locator[0]}='{locator[1]}': {e}")
-            self.take_screenshot(f"error_click_{locator[1].replace(':', '_')}")
-            raise
-    
-    def input_text(self, locator: Tuple[str, str], text: str, timeout=DEFAULT_TIMEOUT):
-        """
-        Encuentra un elemento e introduce texto en él.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            text (str): Texto a introducir
-            timeout (int, optional): Tiempo máximo de espera en segundos
-        """
-        element = self.find_element(locator, timeout)
-        # No mostramos el texto completo si es una contraseña
-        display_text = "********" if "password" in str(locator).lower() else text
-        logger.info(f"⌨️ Introduciendo texto en elemento {locator[0]}='{locator[1]}': '{display_text}'")
-        try:
-            element.clear()
-            element.send_keys(text)
-            logger.debug(f"Texto introducido exitosamente en: {locator[0]}='{locator[1]}'")
-        except Exception as e:
-            logger.error(f"⚠️ Error al introducir texto en {locator[0]}='{locator[1]}': {e}")
-            self.take_screenshot(f"error_input_{locator[1].replace(':', '_')}")
-            raise
-    
-    def get_text(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> str:
-        """
-        Obtiene el texto de un elemento.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            timeout (int, optional): Tiempo máximo de espera en segundos
-            
-        Returns:
-            str: Texto del elemento
-        """
-        element = self.find_element(locator, timeout)
-        return element.text
-    
-    def wait_for_element_visible(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
-        """
-        Espera hasta que un elemento sea visible en la página.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            timeout (int, optional): Tiempo máximo de espera en segundos
-            
-        Returns:
-            WebElement: Elemento visible
-            
-        Raises:
-            TimeoutException: Si el elemento no es visible en el tiempo especificado
-        """
-        try:
-            logger.debug(f"Esperando a que el elemento sea visible: {locator}")
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            return element
-        except TimeoutException:
-            logger.error(f"El elemento {locator} no fue visible después de {timeout} segundos")
-            self.take_screenshot(f"error_visibility_{locator[1].replace(':', '_')}")
-            raise
-    
-    def wait_for_element_clickable(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
-        """
-        Espera hasta que un elemento sea clickable en la página.
-        
-        Args:
-            locator (tuple): Tuple que contiene el tipo y valor del localizador
-            timeout (int, optional): Tiempo máximo de espera en segundos
-            
-        Returns:
-            WebElement: Elemento clickable
-            
-        Raises:
-            TimeoutException: Si el elemento no es clickable en el tiempo especificado
-        """
-        try:
-            logger.debug(f"Esperando a que el elemento sea clickable: {locator}")
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            return element
-        except TimeoutException:
-            logger.error(f"El elemento {locator} no fue clickable después de {timeout} segundos")
-            self.take_screenshot(f"error_clickable_{locator[1].replace(':', '_')}")
-            raise
-    
-    def take_screenshot(self, name: str):
-        """
-        Toma una captura de pantalla del estado actual del navegador.
-        Organiza las capturas en carpetas según la URL base.
-        
-        Args:
-            name (str): Nombre para el archivo de captura
-        """
-        
-        
-        # Obtener la URL actual para determinar el servidor
-        current_url = self.driver.current_url
-        
-        # Extraer el identificador del servidor (ftdspprod001, ftdspprod002, etc.)
-        server_match = re.search(r'ftdspprod\d{3}', current_url)
-        server_id = server_match.group(0) if server_match else "unknown_server"
-        
-        # Crear directorio específico para este servidor
-        server_screenshots_dir = os.path.join(SCREENSHOTS_DIR, server_id)
-        os.makedirs(server_screenshots_dir, exist_ok=True)
-        
-        # Generar nombre de archivo con timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{server_screenshots_dir}/{name}_{timestamp}.png"
-        
-        logger.info(f"Tomando captura de pantalla: {filename}")
-        self.driver.save_screenshot(filename)
-    
-    def get_page_title(self) -> str:
-        """
-        Obtiene el título de la página actual.
-        
-        Returns:
-            str: Título de la página
-        """
-        return self.driver.title
-    
-    def get_page_url(self) -> str:
-        """
-        Obtiene la URL actual.
-        
-        Returns:
-            str: URL actual
-        """
+"""
+Clase base para todos los page objects.
+Contiene métodos comunes utilizados en múltiples páginas.
+"""
+
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        ElementNotInteractableException, ElementClickInterceptedException)
+from selenium.webdriver.remote.webelement import WebElement
+from typing import Dict, List, Tuple, Optional
+import time
+from datetime import datetime
+import os
+import re
+from config.config import SCREENSHOTS_DIR
+
+from config.config import DEFAULT_TIMEOUT, ELEMENT_CACHE
+from utils.logger import logger
+from utils.screenshots import screenshot_writer
+from utils.step_timer import StepTimer, timed_action
+from utils.waits import (wait_for_element_state, wait_for_first_element_state, query_elements_state,
+                         wait_for_elements_state)
+
+
+class BasePage:
+    """
+    Clase base que todas las page objects deben heredar.
+    Proporciona métodos comunes para interactuar con elementos de la página.
+    """
+    
+    def __init__(self, driver, base_url=None):
+        """
+        Inicializa el page object.
+        
+        Args:
+            driver: Instancia del WebDriver
+            base_url (str, optional): URL base del sitio
+        """
+        #parametros 
+        self.driver = driver
+        self.base_url = base_url
+        # Timer compartido por todas las páginas que usan este driver
+        self.timer = StepTimer.for_driver(driver, base_url)
+        # Elementos ya resueltos por localizador; se vacía al navegar o tras un clic o escritura (pueden navegar)
+        # y se re-busca si quedan obsoletos
+        self._elements = {}
+    
+    @timed_action
+    def open(self, url_path=""):
+        """
+        Abre una URL específica, combinándola con la URL base.
+        
+        Args:
+            url_path (str, optional): Ruta a añadir a la URL base
+        """
+        full_url = f"{self.base_url}{url_path}" if self.base_url else url_path
+        logger.info("Navegando a: %s", full_url)
+        self._elements.clear()
+        self.driver.get(full_url)
+        self.timer.navigated(full_url)
+    
+    @timed_action
+    def find_element(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
+        """
+        Encuentra un elemento utilizando un localizador específico y espera hasta que esté presente.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador (By.ID, "id_value")
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            WebElement: Elemento encontrado
+            
+        Raises:
+            TimeoutException: Si el elemento no se encuentra en el tiempo especificado
+        """
+        try:
+            logger.debug("Buscando elemento: %s='%s'", locator[0], locator[1])
+            start_time = time.time()
+            element = wait_for_element_state(self.driver, locator, "present", timeout)
+            elapsed_time = time.time() - start_time
+            logger.debug("Elemento encontrado en %.2f segundos: %s='%s'", elapsed_time, locator[0], locator[1])
+            return self._remember(locator, element)
+        except TimeoutException:
+            logger.error("⚠️ NO SE ENCONTRÓ el elemento %s='%s' después de %s segundos", locator[0], locator[1], timeout)
+            self.take_screenshot(f"error_find_{locator[1].replace(':', '_')}")
+            raise
+    
+    @timed_action
+    def is_element_present(self, locator: Tuple[str, str], timeout=5) -> bool:
+        """
+        Verifica si un elemento está presente en la página.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            bool: True si el elemento está presente, False en caso contrario
+        """
+        try:
+            self.find_element(locator, timeout)
+            return True
+        except (TimeoutException, NoSuchElementException):
+            return False
+    
+    @timed_action
+    def click_element(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT):
+        """
+        Encuentra un elemento y hace clic en él.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int, optional): Tiempo máximo de espera en segundos
+        """
+        logger.info("👆 Haciendo clic en elemento: %s='%s'", locator[0], locator[1])
+        try:
+            self._with_element(locator, timeout, lambda element: element.click(), navigates=True)
+            logger.debug("Clic realizado exitosamente en: %s='%s'", locator[0], locator[1])
+        except TimeoutException:
+            # find_element ya registró el error y tomó la captura
+            raise
+        except Exception as e:
+            logger.error("⚠️ Error al hacer clic en %s='%s': %s", locator[0], locator[1], e)
+            self.take_screenshot(f"error_click_{locator[1].replace(':', '_')}")
+            raise
+    
+    @timed_action
+    def input_text(self, locator: Tuple[str, str], text: str, timeout=DEFAULT_TIMEOUT):
+        """
+        Encuentra un elemento e introduce texto en él.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            text (str): Texto a introducir
+            timeout (int, optional): Tiempo máximo de espera en segundos
+        """
+        # No mostramos el texto completo si es una contraseña
+        display_text = "********" if "password" in str(locator).lower() else text
+        logger.info("⌨️ Introduciendo texto en elemento %s='%s': '%s'", locator[0], locator[1], display_text)
+        
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        
+        try:
+            self._with_element(locator, timeout, type_text, navigates=True)
+            logger.debug("Texto introducido exitosamente en: %s='%s'", locator[0], locator[1])
+        except TimeoutException:
+            # find_element ya registró el error y tomó la captura
+            raise
+        except Exception as e:
+            logger.error("⚠️ Error al introducir texto en %s='%s': %s", locator[0], locator[1], e)
+            self.take_screenshot(f"error_input_{locator[1].replace(':', '_')}")
+            raise
+    
+    @timed_action
+    def get_text(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> str:
+        """
+        Obtiene el texto de un elemento.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            str: Texto del elemento
+        """
+        return self._with_element(locator, timeout, lambda element: element.text)
+    
+    @timed_action
+    def wait_for_element_visible(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
+        """
+        Espera hasta que un elemento sea visible en la página.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            WebElement: Elemento visible
+            
+        Raises:
+            TimeoutException: Si el elemento no es visible en el tiempo especificado
+        """
+        try:
+            logger.debug("Esperando a que el elemento sea visible: %s", locator)
+            element = wait_for_element_state(self.driver, locator, "visible", timeout)
+            return self._remember(locator, element)
+        except TimeoutException:
+            logger.error("El elemento %s no fue visible después de %s segundos", locator, timeout)
+            self.take_screenshot(f"error_visibility_{locator[1].replace(':', '_')}")
+            raise
+    
+    @timed_action
+    def wait_for_element_clickable(self, locator: Tuple[str, str], timeout=DEFAULT_TIMEOUT) -> WebElement:
+        """
+        Espera hasta que un elemento sea clickable en la página.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            WebElement: Elemento clickable
+            
+        Raises:
+            TimeoutException: Si el elemento no es clickable en el tiempo especificado
+        """
+        try:
+            logger.debug("Esperando a que el elemento sea clickable: %s", locator)
+            element = wait_for_element_state(self.driver, locator, "clickable", timeout)
+            return self._remember(locator, element)
+        except TimeoutException:
+            logger.error("El elemento %s no fue clickable después de %s segundos", locator, timeout)
+            self.take_screenshot(f"error_clickable_{locator[1].replace(':', '_')}")
+            raise
+    
+    @timed_action
+    def get_elements_state(self, locator_states: Dict[Tuple[str, str], str]) -> Dict[Tuple[str, str], Optional[WebElement]]:
+        """
+        Consulta el estado de varios elementos en una sola llamada al navegador.
+        
+        Args:
+            locator_states (dict): Localizador -> estado esperado ("present", "visible" o "clickable")
+            
+        Returns:
+            dict: Localizador -> WebElement si cumple el estado, None en caso contrario
+        """
+        return query_elements_state(self.driver, locator_states)
+    
+    @timed_action
+    def wait_for_elements(self, locator_states: Dict[Tuple[str, str], str], timeout=DEFAULT_TIMEOUT) -> Dict[Tuple[str, str], WebElement]:
+        """
+        Espera hasta que todos los elementos alcancen su estado, con un único round trip por sondeo.
+        
+        Args:
+            locator_states (dict): Localizador -> estado esperado ("present", "visible" o "clickable")
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            dict: Localizador -> WebElement en el estado solicitado
+            
+        Raises:
+            TimeoutException: Si algún elemento no alcanza su estado en el tiempo especificado
+        """
+        try:
+            logger.debug("Esperando %s elementos: %s", len(locator_states), list(locator_states.values()))
+            elements = wait_for_elements_state(self.driver, locator_states, timeout)
+            for locator, element in elements.items():
+                self._remember(locator, element)
+            return elements
+        except TimeoutException as e:
+            logger.error("⚠️ %s", e.msg)
+            self.take_screenshot("error_wait_for_elements")
+            raise
+    
+    @timed_action
+    def wait_for_first(self, locator_states: Dict[Tuple[str, str], str], timeout=DEFAULT_TIMEOUT) -> Tuple[Tuple[str, str], WebElement]:
+        """
+        Espera a la vez a varios elementos alternativos y devuelve el primero que alcanza su estado.
+        Un elemento opcional que no aparece no obliga a agotar su timeout antes de probar el siguiente.
+        
+        Args:
+            locator_states (dict): Localizador -> estado esperado, en orden de preferencia
+            timeout (int, optional): Tiempo máximo de espera en segundos
+            
+        Returns:
+            tuple: (localizador ganador, WebElement)
+            
+        Raises:
+            TimeoutException: Si ningún elemento alcanza su estado en el tiempo especificado
+        """
+        candidates = list(locator_states.items())
+        try:
+            logger.debug("Esperando al primero de: %s", [locator for locator, _ in candidates])
+            start_time = time.time()
+            index, element = wait_for_first_element_state(self.driver, candidates, timeout)
+            winner = candidates[index][0]
+            logger.debug("Elemento %s='%s' encontrado primero en %.2f segundos", winner[0], winner[1], time.time() - start_time)
+            return winner, self._remember(winner, element)
+        except TimeoutException as e:
+            logger.error("⚠️ %s", e.msg)
+            self.take_screenshot("error_wait_for_first")
+            raise
+    
+    def _remember(self, locator: Tuple[str, str], element: WebElement) -> WebElement:
+        """
+        Guarda el elemento resuelto para que la siguiente acción sobre el localizador no lo vuelva a buscar.
+        """
+        if ELEMENT_CACHE:
+            self._elements[locator] = element
+        return element
+    
+    def _with_element(self, locator: Tuple[str, str], timeout, action, navigates=False):
+        """
+        Ejecuta action(elemento) sobre el elemento en caché del localizador, o lo busca si no lo hay.
+        Si el elemento en caché ya no sirve (re-render, navegación, otro nodo con el mismo localizador tapándolo),
+        se busca de nuevo y se reintenta antes de propagar el error.
+        
+        Args:
+            locator (tuple): Tuple que contiene el tipo y valor del localizador
+            timeout (int): Tiempo máximo de espera si hay que buscar el elemento
+            action (callable): Función que recibe el WebElement
+            navigates (bool, optional): La acción puede cambiar de documento (clic, Enter); vacía la caché después
+            
+        Returns:
+            El resultado de action
+        """
+        element = self._elements.get(locator)
+        try:
+            if element is not None:
+                try:
+                    return action(element)
+                except (StaleElementReferenceException, NoSuchElementException,
+                        ElementNotInteractableException, ElementClickInterceptedException) as e:
+                    # Según el driver, una referencia de un documento anterior es "stale" o "no such element";
+                    # "not interactable"/"click intercepted" puede ser un nodo sustituido que sigue en el DOM oculto
+                    logger.debug("Elemento en caché no utilizable (%s), buscando de nuevo: %s='%s'",
+                                 type(e).__name__, locator[0], locator[1])
+                    self._elements.pop(locator, None)
+            return action(self.find_element(locator, timeout))
+        finally:
+            if navigates:
+                # Ningún elemento resuelto antes de un posible cambio de documento se reutiliza
+                self._elements.clear()
+    
+    @timed_action
+    def take_screenshot(self, name: str):
+        """
+        Toma una captura de pantalla del estado actual del navegador.
+        Organiza las capturas en carpetas según la URL base.
+        
+        Args:
+            name (str): Nombre para el archivo de captura
+        """
+        
+        
+        # Obtener la URL actual para determinar el servidor
+        current_url = self.driver.current_url
+        
+        # Extraer el identificador del servidor (ftdspprod001, ftdspprod002, etc.)
+        server_match = re.search(r'ftdspprod\d{3}', current_url)
+        server_id = server_match.group(0) if server_match else "unknown_server"
+        
+        # Directorio específico para este servidor (lo crea el escritor de capturas)
+        server_screenshots_dir = os.path.join(SCREENSHOTS_DIR, server_id)
+        
+        # Generar nombre de archivo con timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Solo la captura en el navegador bloquea el test; la codificación y escritura van en segundo plano
+        filename = screenshot_writer.capture(self.driver, server_screenshots_dir, f"{name}_{timestamp}")
+        logger.info("Tomando captura de pantalla: %s", filename)
+    
+    def get_page_title(self) -> str:
+        """
+        Obtiene el título de la página actual.
+        
+        Returns:
+            str: Título de la página
+        """
+        return self.driver.title
+    
+    def get_page_url(self) -> str:
+        """
+        Obtiene la URL actual.
+        
+        Returns:
+            str: URL actual
+        """
         return self.driver.current_url
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Local stand-in of the FT Design Studio web app.
+Serves pages with the same DOM structure and ids as the LoginPage locators, with configurable
+latency and failures per endpoint, so the full flow can run offline against localhost.
+"""
+from standin.server import EndpointBehavior, StandInServer, load_behaviors
+
+__all__ = ["EndpointBehavior", "StandInServer", "load_behaviors"]
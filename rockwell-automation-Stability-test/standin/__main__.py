@@ -0,0 +1,48 @@
+"""
+Runs the FT Design Studio stand-in from the command line:
+
+    python -m standin --port 8765
+    python -m standin --port 8765 --latency "*=0.2" --latency /api/copilot=3 --failure-rate /api/push=0.1
+    python -m standin --config standin.json
+"""
+import argparse
+
+from config.config import STANDIN_PORT
+from standin.server import StandInServer, load_behaviors
+
+
+def _endpoint_value(text):
+    endpoint, _, value = text.rpartition("=")
+    if not endpoint:
+        raise argparse.ArgumentTypeError(f"Expected <path>=<number>, got '{text}'")
+    return endpoint, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in of the FT Design Studio web app.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=STANDIN_PORT)
+    parser.add_argument("--config", help="JSON file with latency/jitter/failure_rate/status per path")
+    parser.add_argument("--latency", type=_endpoint_value, action="append", default=[],
+                        metavar="PATH=SECONDS", help="Response delay for a path ('*' for all)")
+    parser.add_argument("--jitter", type=_endpoint_value, action="append", default=[],
+                        metavar="PATH=SECONDS", help="Random +/- variation of the delay")
+    parser.add_argument("--failure-rate", type=_endpoint_value, action="append", default=[],
+                        metavar="PATH=RATE", help="Fraction of requests answered with an error (0-1)")
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for setting in ("latency", "jitter", "failure_rate"):
+        for endpoint, value in getattr(args, setting):
+            overrides.setdefault(endpoint, {})[setting] = value
+
+    server = StandInServer(args.host, args.port, load_behaviors(args.config, overrides))
+    print(f"FT Design Studio stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+HTTP server of the FT Design Studio stand-in.
+
+Routes:
+    GET  /          SSO page (SIGN_IN_WITH_SSO_BUTTON); redirects to /ide with a valid session cookie
+    GET  /login     Email and password forms
+    GET  /ide       IDE: project dialogs, Copilot, device add dialog and VCS toolbar
+    POST /api/<x>   Backend calls made by the pages (session, identify, login, projects,
+                    gitlab, copilot, devices, deploy, commit, push)
+
+Latency and failures are configured per path; "*" applies to every path without its own entry.
+"""
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from selenium.webdriver.common.by import By
+
+from pages.login_page import LoginPage
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+SCREENS = {"/": "sso", "/login": "login", "/ide": "ide"}
+SUPPORTED_STRATEGIES = (By.ID, By.XPATH, By.CSS_SELECTOR)
+# Cookie set by POST /api/login, so a restored session skips the SSO page like the real app
+SESSION_COOKIE = "standin_session"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>FactoryTalk Design Studio (stand-in)</title></head>
+<body>
+<script>window.RA_SCREEN = {screen}; window.RA_LOCATORS = {locators};</script>
+<script src="/static/app.js"></script>
+</body>
+</html>
+"""
+
+
+@dataclass
+class EndpointBehavior:
+    """
+    Simulated behaviour of one path.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    status: int = 500
+
+    def delay(self) -> float:
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def fails(self) -> bool:
+        return random.random() < self.failure_rate
+
+
+def page_locators(page_class=LoginPage) -> Dict[str, list]:
+    """
+    Returns the locators declared on a page object class, keyed by attribute name.
+    Text-based XPaths (contains(text(), ...)) are left out: the stand-in pages write those by hand.
+    """
+    locators = {}
+    for klass in reversed(page_class.__mro__):
+        for name, value in vars(klass).items():
+            if (isinstance(value, tuple) and len(value) == 2 and value[0] in SUPPORTED_STRATEGIES
+                    and not (value[0] == By.XPATH and not value[1].startswith("/html/"))):
+                locators[name] = list(value)
+    return locators
+
+
+def load_behaviors(path: Optional[str] = None, overrides: Optional[Dict[str, dict]] = None) -> Dict[str, EndpointBehavior]:
+    """
+    Reads endpoint behaviours from a JSON file such as
+    {"*": {"latency": 0.2}, "/api/copilot": {"latency": 3, "jitter": 1, "failure_rate": 0.05}}.
+
+    Args:
+        path (str, optional): JSON file to read
+        overrides (dict, optional): Settings applied on top of the file, same format
+
+    Returns:
+        dict: EndpointBehavior per path
+    """
+    settings = {}
+    if path:
+        with open(path) as config_file:
+            settings = json.load(config_file)
+    for endpoint, values in (overrides or {}).items():
+        settings.setdefault(endpoint, {}).update(values)
+    return {endpoint: EndpointBehavior(**values) for endpoint, values in settings.items()}
+
+
+class StandInServer:
+    """
+    Threaded HTTP server running the stand-in app in the background.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, behaviors=None, page_class=LoginPage):
+        """
+        Args:
+            host (str, optional): Interface to listen on
+            port (int, optional): Port to listen on; 0 picks a free one
+            behaviors (dict, optional): EndpointBehavior per path ("*" for the default)
+            page_class (type, optional): Page object whose locators the pages reproduce
+        """
+        self.behaviors = behaviors or {}
+        self.locators = page_locators(page_class)
+        self.sessions = set()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def has_session(self, cookie_header: Optional[str]) -> bool:
+        cookie = SimpleCookie(cookie_header or "")
+        return SESSION_COOKIE in cookie and cookie[SESSION_COOKIE].value in self.sessions
+
+    def behavior(self, path: str) -> EndpointBehavior:
+        return self.behaviors.get(path) or self.behaviors.get("*") or EndpointBehavior()
+
+    def start(self):
+        """
+        Starts serving in a daemon thread.
+
+        Returns:
+            StandInServer: Returns self for method chaining
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/" and server.has_session(self.headers.get("Cookie")):
+                    self.send_response(302)
+                    self.send_header("Location", "/ide")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif path in SCREENS:
+                    body = PAGE_TEMPLATE.format(screen=json.dumps(SCREENS[path]),
+                                                locators=json.dumps(server.locators)).encode()
+                    self._respond(path, body, "text/html; charset=utf-8")
+                elif path == "/static/app.js":
+                    with open(os.path.join(STATIC_DIR, "app.js"), "rb") as script:
+                        self._respond(path, script.read(), "application/javascript")
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                path = self.path.split("?", 1)[0]
+                if not path.startswith("/api/"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                headers = {}
+                if path == "/api/login":
+                    token = uuid.uuid4().hex
+                    server.sessions.add(token)
+                    headers["Set-Cookie"] = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"
+                self._respond(path, json.dumps({"ok": True}).encode(), "application/json", headers)
+
+            def _respond(self, path, body, content_type, headers=None):
+                behavior = server.behavior(path)
+                time.sleep(behavior.delay())
+                if behavior.fails():
+                    body, content_type = json.dumps({"ok": False, "error": "injected failure"}).encode(), "application/json"
+                    self.send_response(behavior.status)
+                else:
+                    self.send_response(200)
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep the test console readable; requests are visible in HAR captures if needed
+                pass
+
+        return Handler
+
+    def describe(self) -> dict:
+        """
+        Returns the configured behaviours, for logging.
+        """
+        return {endpoint: asdict(behavior) for endpoint, behavior in self.behaviors.items()}
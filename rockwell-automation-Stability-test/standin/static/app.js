@@ -0,0 +1,285 @@
+/*
+ * Stand-in of the FT Design Studio web app.
+ * The DOM is built from the page object locators (window.RA_LOCATORS, served by standin/server.py),
+ * so every absolute XPath, CSS path and id used by LoginPage resolves here as it does in production.
+ * Each user action that hits the backend goes through api(), whose latency and failures are
+ * configured per endpoint on the server.
+ */
+(function () {
+    'use strict';
+
+    var L = window.RA_LOCATORS;
+    var SHELL = '/html/body/app-root';
+    var DIALOG = '/html/body/div[1]/div[2]/div/mat-dialog-container';
+    // Dialogs located by CSS id (#mat-mdc-dialog-N) live in their own overlay pane
+    var CSS_DIALOG_PANE = '/html/body/div[1]/div[3]/div';
+    var EXPLORER = '/html/body/app-root/ra-ide-title-bar/div/ra-ui-product-header/div/mat-sidenav-container/' +
+        'mat-sidenav-content/ra-ide-app-shell/div/section[2]/div[1]/div[1]/ra-ide-panel[1]/div/' +
+        'ra-ide-dock-panel-multi-group/section/ra-ide-panel/div/ra-ide-dock-panel-group/section/' +
+        'ra-ide-dock-panel-inner/ra-ide-dock-panel/div/ra-ide-tool-panel/div[2]/ra-ide-panel/div/ra-ide-explorer-outlet';
+    var STATUS_BAR = '/html/body/app-root/ra-ide-title-bar/div/ra-ui-product-header/div/mat-sidenav-container/' +
+        'mat-sidenav-content/ra-ide-app-shell/div/section[4]';
+
+    // ---------------------------------------------------------------- DOM builders
+
+    function childrenByTag(node, tag) {
+        return Array.prototype.filter.call(node.children, function (child) {
+            return child.tagName.toLowerCase() === tag;
+        });
+    }
+
+    // Creates (or reuses) every element of an absolute XPath such as /html/body/div[2]/span[1]
+    function buildXPath(path) {
+        var node = document.body;
+        path.replace(/^\/html\/body\/?/, '').split('/').forEach(function (segment) {
+            if (!segment) return;
+            var match = /^([\w-]+)(?:\[(\d+)\])?$/.exec(segment);
+            if (!match) throw new Error('Unsupported XPath segment: ' + segment);
+            var tag = match[1], index = match[2] ? parseInt(match[2], 10) : 1;
+            var same = childrenByTag(node, tag);
+            while (same.length < index) same.push(node.appendChild(document.createElement(tag)));
+            node = same[index - 1];
+        });
+        return node;
+    }
+
+    // Creates (or reuses) every element of a child-combinator CSS path starting at an #id
+    function buildCss(selector, root) {
+        var parts = selector.split(/\s*>\s*/);
+        var node = root || document.getElementById(parts[0].slice(1));
+        if (!node) throw new Error('Root of ' + selector + ' does not exist');
+        parts.slice(1).forEach(function (compound) {
+            var match = /^([\w-]+)((?:\.[\w-]+)*)(?::nth-child\((\d+)\))?$/.exec(compound);
+            if (!match) throw new Error('Unsupported CSS compound: ' + compound);
+            var tag = match[1], classes = match[2].split('.').filter(Boolean);
+            var child;
+            if (match[3]) {
+                var index = parseInt(match[3], 10);
+                while (node.children.length < index) node.appendChild(document.createElement(tag));
+                child = node.children[index - 1];
+            } else {
+                child = childrenByTag(node, tag).filter(function (candidate) {
+                    return classes.every(function (name) { return candidate.classList.contains(name); });
+                })[0] || node.appendChild(document.createElement(tag));
+            }
+            classes.forEach(function (name) { child.classList.add(name); });
+            node = child;
+        });
+        return node;
+    }
+
+    function find(name) {
+        var locator = L[name];
+        if (locator[0] === 'id') return document.getElementById(locator[1]);
+        if (locator[0] === 'css selector') return document.querySelector(locator[1]);
+        return document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+
+    // Builds the element of a locator and gives the leaf something to render
+    function build(name, root) {
+        var locator = L[name];
+        var leaf = locator[0] === 'css selector' ? buildCss(locator[1], root) : buildXPath(locator[1]);
+        var tag = leaf.tagName.toLowerCase();
+        if (tag !== 'input' && tag !== 'textarea' && !leaf.textContent) {
+            leaf.textContent = name.replace(/_/g, ' ').toLowerCase();
+        }
+        return leaf;
+    }
+
+    function on(name, handler) {
+        find(name).addEventListener('click', handler);
+    }
+
+    function show(node, visible) {
+        node.style.display = visible ? '' : 'none';
+    }
+
+    function openDialog(names) {
+        names.forEach(function (name) { build(name); });
+    }
+
+    function closeDialog() {
+        var dialog = document.evaluate(DIALOG, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (dialog) dialog.remove();
+    }
+
+    function openCssDialog(id, names) {
+        var container = document.createElement('mat-dialog-container');
+        container.id = id;
+        buildXPath(CSS_DIALOG_PANE).appendChild(container);
+        names.forEach(function (name) { build(name, container); });
+        return container;
+    }
+
+    function closeCssDialog(id) {
+        var dialog = document.getElementById(id);
+        if (dialog) dialog.remove();
+    }
+
+    // ---------------------------------------------------------------- backend
+
+    function api(endpoint) {
+        return fetch('/api/' + endpoint, {method: 'POST'}).then(function (response) {
+            if (!response.ok) throw new Error(endpoint + ' failed with HTTP ' + response.status);
+            return response.json();
+        }).catch(function (error) {
+            var toast = document.getElementById('pe-err-message');
+            if (!toast) {
+                toast = document.body.appendChild(document.createElement('div'));
+                toast.id = 'pe-err-message';
+            }
+            toast.textContent = error.message;
+            throw error;
+        });
+    }
+
+    // ---------------------------------------------------------------- screens
+
+    function ssoScreen() {
+        var button = build('SIGN_IN_WITH_SSO_BUTTON');
+        button.textContent = 'Sign in with SSO';
+        button.type = 'button';
+        button.addEventListener('click', function () { location.href = '/login'; });
+    }
+
+    function loginScreen() {
+        var form = document.body.appendChild(document.createElement('form'));
+        form.innerHTML =
+            '<section id="emailSection">' +
+            '  <label for="emailInput">Email Address</label><input id="emailInput" type="email">' +
+            '  <button id="continueBtn" type="button">CONTINUE</button>' +
+            '</section>' +
+            '<section id="passwordSection" style="display: none">' +
+            '  <label for="passwordInput">Enter Password</label><input id="passwordInput" type="password">' +
+            '  <button id="togglePassword" type="button">Show</button>' +
+            '  <button id="signInBtn" type="button">SIGN IN</button>' +
+            '  <button id="goBackBtn" type="button">GO BACK</button>' +
+            '</section>';
+        var emailSection = document.getElementById('emailSection');
+        var passwordSection = document.getElementById('passwordSection');
+        var password = document.getElementById('passwordInput');
+
+        document.getElementById('continueBtn').addEventListener('click', function () {
+            api('identify').then(function () {
+                show(emailSection, false);
+                show(passwordSection, true);
+            });
+        });
+        document.getElementById('togglePassword').addEventListener('click', function () {
+            password.type = password.type === 'password' ? 'text' : 'password';
+        });
+        document.getElementById('goBackBtn').addEventListener('click', function () {
+            show(passwordSection, false);
+            show(emailSection, true);
+        });
+        document.getElementById('signInBtn').addEventListener('click', function () {
+            api('login').then(function () { location.href = '/ide'; });
+        });
+    }
+
+    function ideScreen() {
+        // Overlay container first so it is /html/body/div[1] as in the Angular app
+        buildXPath('/html/body/div[1]').className = 'cdk-overlay-container';
+        var shell = buildXPath(SHELL + '/ra-ide-title-bar/div/ra-ui-product-header');
+        shell.id = 'contextProductHeader';
+        buildXPath(STATUS_BAR).classList.add('ra-ide-app-shell__status-bar', 'ng-star-inserted');
+        buildXPath(STATUS_BAR + '/ra-ide-status-bar/section/div[3]')
+            .classList.add('ra-ide-status-bar__slot', 'ra-ide-status-bar__slot--global');
+        buildXPath(STATUS_BAR + '/ra-ide-status-bar/section/div[3]/ra-ide-status-bar-item[1]/div/span/span[2]')
+            .classList.add('ra-ide-status-bar-item__content', 'ra-ide-status-bar-item__content--text', 'body-2',
+                           'ng-star-inserted');
+
+        // Every app shell element exists from the start; the ones that depend on the backend stay hidden
+        Object.keys(L).forEach(function (name) {
+            if (L[name][0] === 'xpath' && L[name][1].indexOf(SHELL + '/') === 0) build(name);
+        });
+        build('GITLAB_CHECK');
+        var status = find('LOCALCHANGE');
+        ['SAVED', 'SoCreated', 'BACKPLANE', 'CONTROLSHOWN'].forEach(function (name) { show(find(name), false); });
+        show(status, false);
+        show(buildXPath(EXPLORER + '/div[2]'), false);
+        show(document.body.querySelector('app-root'), false);
+
+        api('session').then(function () {
+            openCssDialog('mat-mdc-dialog-0', ['NEW_PROJECT_BUTTON']);
+            on('NEW_PROJECT_BUTTON', newProject);
+        });
+
+        function newProject() {
+            closeCssDialog('mat-mdc-dialog-0');
+            var dialog = openCssDialog('mat-mdc-dialog-1', ['CREATE_PROJECT_BUTTON']);
+            var name = dialog.querySelector('ra-extensible-dialog > div').appendChild(document.createElement('input'));
+            name.id = L.TEXT_INPUT_PROJECT[1];
+            on('CREATE_PROJECT_BUTTON', function () {
+                api('projects').then(function () {
+                    closeCssDialog('mat-mdc-dialog-1');
+                    show(document.body.querySelector('app-root'), true);
+                    show(find('SAVED'), true);
+                    openCssDialog('mat-mdc-dialog-3', ['DISMISS_BUTTON']);
+                    on('DISMISS_BUTTON', function () {
+                        closeCssDialog('mat-mdc-dialog-3');
+                        api('gitlab').then(function () {
+                            status.textContent = 'Local changes available';
+                            show(status, true);
+                        });
+                    });
+                });
+            });
+        }
+
+        on('SendCOPILOT', function () {
+            if (!find('COPILOT').value) return;
+            api('copilot').then(function () { show(find('SoCreated'), true); });
+        });
+
+        on('DEVICEVIEW', function () {
+            show(buildXPath(EXPLORER + '/div[1]'), false);
+            show(buildXPath(EXPLORER + '/div[2]'), true);
+        });
+        on('EXPLORERVIEW', function () {
+            show(buildXPath(EXPLORER + '/div[2]'), false);
+            show(buildXPath(EXPLORER + '/div[1]'), true);
+        });
+
+        on('NEWDEVICE', function () {
+            openDialog(['SELCONTROLLERS', 'CHECKBOX', 'CONTINUECONTROL']);
+            find('CHECKBOX').type = 'checkbox';
+            on('CONTINUECONTROL', function () {
+                if (!find('CHECKBOX').checked) return;
+                show(find('SELCONTROLLERS').closest('ra-device-selection-page'), false);
+                show(find('CONTINUECONTROL'), false);
+                openDialog(['TIPENAME', 'FINISH_BUTTON']);
+                on('FINISH_BUTTON', function () {
+                    if (!find('TIPENAME').value) return;
+                    api('devices').then(function () {
+                        closeDialog();
+                        show(find('BACKPLANE'), true);
+                    });
+                });
+            });
+        });
+
+        on('DEPLOYBUTTON', function () {
+            api('deploy').then(function () { show(find('CONTROLSHOWN'), true); });
+        });
+
+        on('COMMIT', function () {
+            openDialog(['TIPECOMMIT', 'COMMITBUTTON']);
+            on('COMMITBUTTON', function () {
+                if (!find('TIPECOMMIT').value) return;
+                api('commit').then(closeDialog);
+            });
+        });
+
+        on('PUSHBUTTON', function () {
+            api('push').then(function () {
+                openDialog(['CLOSETAB']);
+                find('CLOSETAB').textContent = '×';
+                on('CLOSETAB', closeDialog);
+            });
+        });
+    }
+
+    var screens = {sso: ssoScreen, login: loginScreen, ide: ideScreen};
+    screens[window.RA_SCREEN]();
+})();
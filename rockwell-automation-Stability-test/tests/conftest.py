@@ -1,233 +1,812 @@
-"""
-tomamos las capturas si falla
-Configuración y fixtures de pytest para el framework de automatización.
-Este archivo se carga automáticamente por pytest.
-"""
-import re
-from datetime import datetime
-import pytest
-import os
-import datetime
-from selenium.webdriver.remote.webdriver import WebDriver
-
-# Assuming BASE_URLS, SCREENSHOTS_DIR etc. are correctly defined in config.config
-from config.config import DEFAULT_BROWSER, DEFAULT_TIMEOUT, BASE_URLS, SCREENSHOTS_DIR
-from utils.driver_factory import DriverFactory
-from utils.logger import logger, setup_logger # Ensure setup_logger is imported if used directly
-
-# --- Global logger instance ---
-# It's generally better practice to configure the logger within fixtures or tests
-# where the context (like base_url) is known, rather than relying on a mutable global.
-# However, keeping the original structure for now.
-# logger = setup_logger() # Initial setup (might be overwritten in setup fixture)
-
-
-def pytest_addoption(parser):
-    """
-    Agrega opciones de línea de comandos para pytest.
-    """
-    parser.addoption(
-        "--url-index",
-        action="store",
-        default=None, # Default to None if not provided
-        type=str,     # Read as string initially to handle potential non-integer input gracefully
-        help="Índice de la URL a probar (e.g., 1-20). Si no se especifica, se usará la URL predeterminada."
-    )
-    parser.addoption(
-        "--all-urls",
-        action="store_true",
-        default=False,
-        help="Ejecutar pruebas en todas las URLs disponibles."
-    )
-
-def pytest_generate_tests(metafunc):
-    """
-    Genera casos de prueba dinámicamente basados en las opciones de pytest.
-    Handles --url-index and --all-urls flags.
-    """
-    # Check if the test function requests the 'base_url' fixture and isn't already parameterized
-    if "base_url" in metafunc.fixturenames and not hasattr(metafunc.function, "parametrize"):
-        url_index_str = metafunc.config.getoption("url_index")
-        all_urls_flag = metafunc.config.getoption("all_urls")
-
-        target_urls = []
-
-        if all_urls_flag:
-            # If --all-urls is set, use all URLs from BASE_URLS
-            target_urls = BASE_URLS
-            print(f"Running tests on all {len(target_urls)} URLs.") # Debug print
-        elif url_index_str is not None:
-            # If --url-index is provided, try to use that specific index
-            try:
-                # Convert the input string to an integer
-                url_index = int(url_index_str)
-                # Validate if the 1-based index is within the valid range
-                if 1 <= url_index <= len(BASE_URLS):
-                    # --- Correction ---
-                    # Subtract 1 from the user's 1-based index to get the 0-based list index
-                    actual_index = url_index - 1
-                    target_urls = [BASE_URLS[actual_index]]
-                    print(f"Running test on URL index {url_index}: {target_urls[0]}") # Debug print
-                    # --- End Correction ---
-                else:
-                    # Fail the test setup if the index is out of range
-                    pytest.fail(
-                        f"Invalid --url-index: {url_index}. "
-                        f"Must be an integer between 1 and {len(BASE_URLS)}."
-                    )
-            except ValueError:
-                # Fail the test setup if the input cannot be converted to an integer
-                pytest.fail(
-                    f"Invalid --url-index: '{url_index_str}'. Must be an integer."
-                )
-        else:
-            # Default behavior: If neither --all-urls nor --url-index is provided, use the first URL
-            if BASE_URLS:
-                target_urls = [BASE_URLS[0]]
-                print(f"No specific URL index provided. Running test on default URL: {target_urls[0]}") # Debug print
-            else:
-                pytest.fail("BASE_URLS list is empty in config.config. Cannot determine default URL.")
-
-        # Parameterize the test function with the selected URL(s)
-        if target_urls:
-            metafunc.parametrize("base_url", target_urls)
-        else:
-            # This case should ideally be caught by previous checks, but as a safeguard:
-            pytest.fail("Could not determine which URL(s) to run the test against.")
-
-
-@pytest.fixture(scope="function")
-def driver(request): # Pass request to access metafunc config if needed, though not used here directly now
-    """
-    Fixture que proporciona una instancia del WebDriver para cada función de test.
-
-    Yields:
-        WebDriver: Instancia del WebDriver configurada.
-    """
-    # Note: Logger setup is moved to the 'setup' fixture where 'base_url' is available
-    print(f"Initializing browser: {DEFAULT_BROWSER}") # Use print for basic fixture info
-
-    # Create WebDriver instance using the factory
-    try:
-        browser_driver = DriverFactory.get_driver(DEFAULT_BROWSER)
-    except Exception as e:
-        pytest.fail(f"Failed to initialize WebDriver ({DEFAULT_BROWSER}): {e}")
-        return # Ensure no further execution if driver fails
-
-    # Yield the driver to the test function
-    yield browser_driver
-
-    # --- Teardown ---
-    # Quit the browser after the test function completes
-    print("Closing browser.") # Use print for basic fixture info
-    browser_driver.quit()
-
-
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Hook para procesar el resultado de cada test y capturar screenshots en caso de fallos.
-    """
-    # Execute all other hooks to obtain the report object
-    outcome = yield
-    rep = outcome.get_result()
-
-    # We only look at the 'call' phase results and only if the test failed
-    if rep.when == "call" and rep.failed:
-        try:
-            # Attempt to retrieve the driver instance from the test item's function arguments
-            # 'driver' fixture should be used in the test for this to work
-            driver_instance = item.funcargs.get("driver")
-            if driver_instance:
-                # Get base_url info if available to include in the filename
-                base_url = item.funcargs.get("base_url", "unknown_url")
-                # Try to extract a server identifier (e.g., ftdspprod001)
-                server_match = re.search(r'ftdspprod\d{3}', base_url)
-                url_id = server_match.group(0) if server_match else base_url.split("//")[-1].split(".")[0]
-
-                # Construct a meaningful screenshot name
-                screenshot_name = f"FAILED_{item.name}_{url_id}"
-                take_screenshot(driver_instance, screenshot_name)
-            else:
-                # Log if driver instance wasn't found (e.g., test failed during setup before driver was available)
-                print(f"Screenshot skipped for {item.name}: Driver instance not found in funcargs.") # Use print in hook
-        except Exception as e:
-            print(f"Error capturing screenshot for {item.name}: {e}") # Use print in hook
-
-
-def take_screenshot(driver: WebDriver, name: str):
-    """
-    Captura un screenshot del navegador actual y lo guarda en una carpeta organizada por servidor.
-
-    Args:
-        driver (WebDriver): Instancia del WebDriver.
-        name (str): Nombre base para el archivo de captura (sin extensión).
-    """
-    try:
-        # Get current URL to determine the server ID for folder organization
-        current_url = driver.current_url
-        server_match = re.search(r'ftdspprod\d{3}', current_url)
-        # Use a more generic fallback if the specific pattern isn't found
-        server_id = server_match.group(0) if server_match else current_url.split("//")[-1].split(".")[0].replace('.', '_')
-
-        # Create a subdirectory for the specific server if it doesn't exist
-        server_screenshots_dir = os.path.join(SCREENSHOTS_DIR, server_id)
-        os.makedirs(server_screenshots_dir, exist_ok=True)
-
-        # Generate filename with timestamp to avoid overwrites
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        # Sanitize the name part (replace characters invalid in filenames)
-        safe_name = re.sub(r'[<>:"/\\|?*\[\]]', '_', name)
-        filename = os.path.join(server_screenshots_dir, f"{safe_name}_{timestamp}.png")
-
-        print(f"Capturing screenshot: {filename}") # Use print
-        success = driver.save_screenshot(filename)
-        if not success:
-             print(f"Warning: driver.save_screenshot returned False for {filename}")
-    except Exception as e:
-        print(f"Failed to capture screenshot '{name}': {e}") # Use print
-
-
-@pytest.fixture(scope="function")
-def setup(driver, base_url):
-    """
-    Fixture que configura el driver navegando a una URL base específica antes de cada test.
-    También configura el logger para usar un archivo específico para esa URL.
-
-    Args:
-        driver: Instancia del WebDriver (desde el fixture 'driver').
-        base_url: URL base a la que se navegará (proporcionada por pytest_generate_tests).
-
-    Returns:
-        tuple: (WebDriver, str) - El driver configurado y la URL base utilizada.
-    """
-    # --- Logger Reconfiguration ---
-    # Extract a unique identifier from the base_url for logging purposes
-    server_match = re.search(r'ftdspprod\d{3}', base_url)
-    url_id = server_match.group(0) if server_match else base_url.split("//")[-1].split(".")[0].replace('.', '_')
-
-    # Get a logger instance configured specifically for this URL/server ID
-    # This ensures logs for different parallel runs (if using xdist) go to separate files
-    test_logger = setup_logger(url_id)
-
-    test_logger.info("="*30 + f" TEST SETUP ({url_id}) " + "="*30)
-    test_logger.info(f"  Browser: {DEFAULT_BROWSER}")
-    test_logger.info(f"  Target URL: {base_url}")
-    test_logger.info(f"  Server ID: {url_id}")
-    test_logger.info(f"  Default Timeout: {DEFAULT_TIMEOUT}s")
-
-    test_logger.info(f"Navigating to base URL: {base_url}")
-    try:
-        driver.get(base_url)
-        test_logger.info("Navigation successful.")
-        # Optional: Add a wait for page load complete here if needed
-        # from utils.waits import wait_for_page_load
-        # wait_for_page_load(driver)
-    except Exception as e:
-        test_logger.error(f"Failed to navigate to {base_url}: {e}")
-        # Capture screenshot immediately if navigation fails
-        take_screenshot(driver, f"ERROR_NAVIGATE_{url_id}")
-        pytest.fail(f"Setup failed: Could not navigate to {base_url}. Error: {e}")
-
-    # Return the configured driver and the base URL to the test function
-    return driver, base_url
+"""
+tomamos las capturas si falla
+Configuración y fixtures de pytest para el framework de automatización.
+Este archivo se carga automáticamente por pytest.
+"""
+import logging
+import re
+import sys
+from datetime import datetime
+import pytest
+import os
+import datetime
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Assuming BASE_URLS, SCREENSHOTS_DIR etc. are correctly defined in config.config
+from config.config import (DEFAULT_BROWSER, DEFAULT_TIMEOUT, BASE_URLS, SCREENSHOTS_DIR, MAX_BROWSERS,
+                           DRIVER_POOL_SIZE, DRIVER_POOL_MAX_USES, COLLECT_PERF_METRICS,
+                           CAPTURE_HAR, PROFILE_COMMANDS, FLIGHT_RECORDER, SCREENCAST, REUSE_SESSION,
+                           LATENCY_REGRESSION, LOG_CONSOLE_LEVEL, STANDIN_PORT, STANDIN_CONFIG, PREFLIGHT,
+                           TEST_USERNAME, TEST_PASSWORD, SOAK_WINDOW, LOAD_CREDENTIALS)
+from utils.driver_factory import DriverPool
+from utils.logger import (logger, setup_logger, get_server_id, set_console_level, flush_logs,
+                          get_output_handlers) # Ensure setup_logger is imported if used directly
+from utils.screenshots import screenshot_writer
+from utils.session_cache import set_session_reuse
+from utils.step_timer import StepTimer
+from utils.perf_collector import PerformanceCollector
+from utils.har_recorder import HarRecorder
+from utils.command_profiler import CommandProfiler
+from utils.flight_recorder import FlightRecorder
+from utils.screencast import ScreencastRecorder
+from utils.timing_store import TimingStore, TimingStoreRecorder
+from utils.regression import check_run
+from utils.preflight import check_servers
+from utils.soak import SoakRunner, parse_duration, failing_servers, write_summary
+from utils.load import LoadRunner, load_credentials, standin_credentials, write_summary as write_load_summary
+from standin import StandInServer, load_behaviors
+from utils.parallel_runner import parse_url_indexes, max_workers_for_budget, run_parallel, strip_options
+
+# --- Global logger instance ---
+# It's generally better practice to configure the logger within fixtures or tests
+# where the context (like base_url) is known, rather than relying on a mutable global.
+# However, keeping the original structure for now.
+# logger = setup_logger() # Initial setup (might be overwritten in setup fixture)
+
+# Timing store, runs of this session (StepTimer.run_id) and the latency regressions found in them
+run_ids_key = pytest.StashKey[list]()
+timing_store_key = pytest.StashKey[TimingStore]()
+regressions_key = pytest.StashKey[list]()
+standin_key = pytest.StashKey[StandInServer]()
+# Flight recorder of each test (item stash), written when the test fails
+flight_recorder_key = pytest.StashKey[FlightRecorder]()
+# Pre-flight result of each selected server (config stash) and of the unreachable server of a test (item stash)
+preflight_key = pytest.StashKey[dict]()
+unreachable_key = pytest.StashKey[object]()
+
+
+def pytest_addoption(parser):
+    """
+    Agrega opciones de línea de comandos para pytest.
+    """
+    parser.addoption(
+        "--url-index",
+        action="store",
+        default=None, # Default to None if not provided
+        type=str,     # Read as string initially to handle potential non-integer input gracefully
+        help="Índice(s) de la URL a probar: un número (3), un rango (1-5) o una lista (1-5,9,12). "
+             "Si no se especifica, se usará la URL predeterminada."
+    )
+    parser.addoption(
+        "--all-urls",
+        action="store_true",
+        default=False,
+        help="Ejecutar pruebas en todas las URLs disponibles."
+    )
+    parser.addoption(
+        "--workers",
+        "--max-browsers",
+        dest="workers",
+        action="store",
+        default=MAX_BROWSERS,
+        type=int,
+        help="Número máximo de servidores (navegadores) probados en paralelo. "
+             "Se limita automáticamente al presupuesto de CPU/RAM de la máquina."
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        default=DRIVER_POOL_SIZE,
+        type=int,
+        help="Navegadores pre-lanzados que se mantienen listos en el pool."
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        action="store",
+        default=DRIVER_POOL_MAX_USES,
+        type=int,
+        help="Usos tras los cuales un navegador del pool se cierra y se reemplaza."
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=COLLECT_PERF_METRICS,
+        help="Guardar Navigation/Resource Timing, LCP, CLS y long tasks por servidor y paso."
+    )
+    parser.addoption(
+        "--har",
+        action="store_true",
+        default=CAPTURE_HAR,
+        help="Capturar el tráfico de red (CDP) en un HAR por servidor y test. Solo Chrome."
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=PROFILE_COMMANDS,
+        help="Contar y cronometrar cada comando WebDriver por paso (round trips, HTTP, esperas)."
+    )
+    parser.addoption(
+        "--flight-recorder",
+        action="store_true",
+        default=FLIGHT_RECORDER,
+        help="Guardar en memoria las últimas capturas y DOM de cada paso y escribirlas solo si falla el test."
+    )
+    parser.addoption(
+        "--screencast",
+        action="store_true",
+        default=SCREENCAST,
+        help="Grabar la pantalla de cada test a pocos fotogramas por segundo (CDP, solo Chrome)."
+    )
+    parser.addoption(
+        "--reuse-session",
+        action="store_true",
+        default=REUSE_SESSION,
+        help="Reutilizar la sesión guardada de cada servidor y usuario y saltar el login SSO si sigue siendo válida."
+    )
+    parser.addoption(
+        "--preflight",
+        action="store",
+        default=PREFLIGHT,
+        choices=["off", "skip", "fail"],
+        help="Comprobar DNS, TCP/TLS, TTFB y estado HTTP de todos los servidores a la vez antes de lanzar "
+             "navegadores, y saltar (skip) o fallar al instante (fail) los tests de los servidores caídos."
+    )
+    parser.addoption(
+        "--iterations",
+        action="store",
+        default=None,
+        type=int,
+        help="Modo soak: repetir el flujo N rondas contra los servidores seleccionados."
+    )
+    parser.addoption(
+        "--duration",
+        action="store",
+        default=None,
+        type=parse_duration,
+        help="Modo soak: repetir el flujo durante este tiempo (p. ej. 90m, 8h). "
+             "Con --iterations, termina lo que ocurra primero."
+    )
+    parser.addoption(
+        "--interval",
+        action="store",
+        default="0",
+        type=parse_duration,
+        help="Modo soak: tiempo mínimo entre el inicio de dos rondas (p. ej. 5m)."
+    )
+    parser.addoption(
+        "--users",
+        action="store",
+        default=None,
+        type=int,
+        help="Modo carga: K usuarios virtuales ejecutando el flujo a la vez contra un solo servidor, "
+             "cada uno con su navegador y su cuenta."
+    )
+    parser.addoption(
+        "--ramp-up",
+        action="store",
+        default="0",
+        type=parse_duration,
+        help="Modo carga: tiempo en el que se van incorporando los usuarios virtuales (p. ej. 5m)."
+    )
+    parser.addoption(
+        "--hold",
+        action="store",
+        default="0",
+        type=parse_duration,
+        help="Modo carga: tiempo que se mantienen todos los usuarios tras el ramp-up (p. ej. 15m)."
+    )
+    parser.addoption(
+        "--credentials",
+        action="store",
+        default=LOAD_CREDENTIALS,
+        help="Modo carga: CSV con una cuenta \"email,password\" por usuario virtual "
+             "(con --standin se generan si no se indica)."
+    )
+    parser.addoption(
+        "--latency-regression",
+        action="store",
+        default=LATENCY_REGRESSION,
+        choices=["off", "warn", "fail"],
+        help="Al final de la sesión, comparar cada paso con el histórico del servidor y "
+             "avisar (warn) o fallar la sesión (fail) ante ralentizaciones significativas."
+    )
+    parser.addoption(
+        "--console-log-level",
+        action="store",
+        default=LOG_CONSOLE_LEVEL,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        type=str.upper,
+        help="Nivel de detalle del log en consola (el fichero siempre registra DEBUG)."
+    )
+    parser.addoption(
+        "--base-url",
+        action="store",
+        default=None,
+        help="URL a probar en lugar de los servidores ftdspprod (p. ej. un stand-in local)."
+    )
+    parser.addoption(
+        "--standin",
+        action="store_true",
+        default=False,
+        help="Levantar el stand-in local de FT Design Studio y probar contra él (sin red)."
+    )
+    parser.addoption(
+        "--standin-config",
+        action="store",
+        default=STANDIN_CONFIG,
+        help="JSON con latencia/fallos por endpoint del stand-in, p. ej. "
+             '{"*": {"latency": 0.2}, "/api/copilot": {"latency": 3, "failure_rate": 0.1}}.'
+    )
+
+
+def pytest_configure(config):
+    """
+    Aplica el nivel de log de consola y la reutilización de sesiones, y arranca el stand-in local
+    cuando se pide --standin (usándolo como URL base de la sesión).
+    """
+    set_console_level(config.getoption("console_log_level"))
+    set_session_reuse(config.getoption("reuse_session"))
+    if config.getoption("standin", False):
+        server = StandInServer(port=STANDIN_PORT,
+                               behaviors=load_behaviors(config.getoption("standin_config"))).start()
+        config.stash[standin_key] = server
+        config.option.base_url = server.url
+
+
+def pytest_unconfigure(config):
+    # Pending screenshots must be on disk before CI collects the artifacts
+    screenshot_writer.close()
+    server = config.stash.get(standin_key, None)
+    if server:
+        server.stop()
+
+def pytest_generate_tests(metafunc):
+    """
+    Genera casos de prueba dinámicamente basados en las opciones de pytest.
+    Handles --url-index and --all-urls flags.
+    """
+    # Check if the test function requests the 'base_url' fixture and isn't already parameterized
+    if "base_url" in metafunc.fixturenames and not hasattr(metafunc.function, "parametrize"):
+        url_index_str = metafunc.config.getoption("url_index")
+        all_urls_flag = metafunc.config.getoption("all_urls")
+        base_url_option = metafunc.config.getoption("base_url")
+
+        target_urls = []
+
+        if base_url_option:
+            # An explicit URL (or the local stand-in) replaces the ftdspprod selection
+            target_urls = [base_url_option]
+            print(f"Running test on {base_url_option}") # Debug print
+        elif all_urls_flag:
+            # If --all-urls is set, use all URLs from BASE_URLS
+            target_urls = BASE_URLS
+            print(f"Running tests on all {len(target_urls)} URLs.") # Debug print
+        elif url_index_str is not None:
+            # If --url-index is provided, accept a single index, ranges and lists (e.g. 1-5,9,12)
+            try:
+                url_indexes = parse_url_indexes(url_index_str, len(BASE_URLS))
+            except ValueError as e:
+                # Fail the test setup if the specification cannot be parsed or is out of range
+                pytest.fail(
+                    f"Invalid --url-index: '{url_index_str}'. {e} "
+                    f"Use integers between 1 and {len(BASE_URLS)}, ranges (1-5) or lists (1-5,9,12)."
+                )
+            # Subtract 1 from the user's 1-based indexes to get the 0-based list indexes
+            target_urls = [BASE_URLS[index - 1] for index in url_indexes]
+            print(f"Running test on URL index(es) {url_index_str}: {', '.join(target_urls)}") # Debug print
+        else:
+            # Default behavior: If neither --all-urls nor --url-index is provided, use the first URL
+            if BASE_URLS:
+                target_urls = [BASE_URLS[0]]
+                print(f"No specific URL index provided. Running test on default URL: {target_urls[0]}") # Debug print
+            else:
+                pytest.fail("BASE_URLS list is empty in config.config. Cannot determine default URL.")
+
+        # Parameterize the test function with the selected URL(s)
+        if target_urls:
+            metafunc.parametrize("base_url", target_urls)
+        else:
+            # This case should ideally be caught by previous checks, but as a safeguard:
+            pytest.fail("Could not determine which URL(s) to run the test against.")
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Comprueba a la vez todos los servidores seleccionados antes de que se cree ningún WebDriver
+    y marca los tests de los servidores caídos (DNS, conexión, TLS, timeout o HTTP 5xx).
+    """
+    mode = config.getoption("preflight")
+    if mode == "off" or config.option.collectonly:
+        return
+    urls = []
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        url = callspec.params.get("base_url") if callspec else None
+        if url and url not in urls:
+            urls.append(url)
+    if not urls:
+        return
+
+    results = check_servers(urls)
+    config.stash[preflight_key] = results
+    fresh = [record for result in results.values() if not result.cached for record in result.step_records()]
+    if fresh:
+        try:
+            TimingStore().add_steps(fresh)
+        except Exception as e:
+            logger.warning("Could not record pre-flight timings: %s", e)
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        result = results.get(callspec.params.get("base_url")) if callspec else None
+        if result is not None and not result.healthy:
+            item.stash[unreachable_key] = result
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Salta o falla los tests de un servidor que no pasó la comprobación previa, antes de
+    pedir un navegador al pool.
+    """
+    result = item.stash.get(unreachable_key, None)
+    if result is None:
+        return
+    message = f"Pre-flight: {result.server} unreachable: {result.describe()}"
+    if item.config.getoption("preflight") == "skip":
+        pytest.skip(message)
+    pytest.fail(message, pytrace=False)
+
+
+def pytest_runtestloop(session):
+    """
+    Sustituye la ejecución normal de los tests por el modo paralelo (--workers > 1), el modo
+    carga (--users) o el modo soak (--iterations / --duration). Con --workers y soak, cada
+    proceso hijo hace el soak de su servidor.
+    """
+    if session.config.option.collectonly:
+        return None
+    return _run_fleet(session) or _run_load(session) or _run_soak(session)
+
+
+def _selected_urls(session):
+    urls = []
+    for item in session.items:
+        callspec = getattr(item, "callspec", None)
+        url = callspec.params.get("base_url") if callspec else None
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+def _console_to_terminal():
+    # The console handler keeps the stream it was created with, which pytest was capturing
+    for handler in get_output_handlers():
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(sys.stderr)
+
+
+def _run_fleet(session):
+    """
+    Ejecuta los servidores seleccionados en procesos paralelos cuando se pide --workers > 1.
+    Cada proceso hijo prueba un único servidor con su propio navegador y su propio log;
+    el proceso principal solo reparte el trabajo y resume los resultados.
+    Los servidores que no pasaron la comprobación previa no reciben proceso.
+    """
+    config = session.config
+    requested_workers = config.getoption("workers")
+    if requested_workers <= 1:
+        return None
+
+    url_indexes = []
+    unreachable = {}
+    for item in session.items:
+        callspec = getattr(item, "callspec", None)
+        url = callspec.params.get("base_url") if callspec else None
+        if unreachable_key in item.stash:
+            unreachable[url] = item.stash[unreachable_key]
+        elif url in BASE_URLS and BASE_URLS.index(url) + 1 not in url_indexes:
+            url_indexes.append(BASE_URLS.index(url) + 1)
+    if len(url_indexes) <= 1:
+        # Nothing to parallelize; run in-process as usual (unreachable servers end at setup)
+        return None
+
+    workers = min(max_workers_for_budget(requested_workers), len(url_indexes))
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if workers < requested_workers:
+        reporter.write_line(f"Requested {requested_workers} workers, using {workers} to stay within the CPU/RAM budget.")
+    reporter.write_line(f"Running {len(url_indexes)} servers on {workers} parallel workers.")
+
+    # Forward the original invocation to each worker, except the server selection and parallel options
+    worker_args = strip_options(
+        list(config.invocation_params.args),
+        options_with_value=["--url-index", "--workers", "--max-browsers"],
+        flags=["--all-urls"],
+    )
+
+    def report_progress(result):
+        status = "PASSED" if result.passed else f"FAILED (exit code {result.returncode})"
+        reporter.write_line(f"[{get_server_id(result.url)}] {status} in {result.duration:.1f}s")
+
+    fleet_started = datetime.datetime.now()
+    results = run_parallel(url_indexes, workers, worker_args, on_result=report_progress)
+
+    reporter.section("parallel fleet run")
+    for result in results:
+        status = "PASSED" if result.passed else "FAILED"
+        reporter.write_line(f"{status:7} #{result.url_index:<3} {result.url}  {result.duration:8.1f}s  {result.output_file}")
+    # Servers that failed the pre-flight check never got a worker
+    preflight_status = "SKIPPED" if config.getoption("preflight") == "skip" else "FAILED"
+    for url, probe in unreachable.items():
+        reporter.write_line(f"{preflight_status:7} #{BASE_URLS.index(url) + 1 if url in BASE_URLS else '-':<3} {url}  "
+                            f"pre-flight: {probe.describe()}")
+    session.testsfailed = sum(1 for result in results if not result.passed)
+    if preflight_status == "FAILED":
+        session.testsfailed += len(unreachable)
+
+    if config.getoption("latency_regression") != "off":
+        # Cada hijo comprueba sus propias ejecuciones; se recogen aquí del histórico compartido
+        # para que pytest_sessionfinish las compruebe y el resumen de este proceso las muestre
+        store = TimingStore()
+        servers = {get_server_id(BASE_URLS[index - 1]) for index in url_indexes}
+        config.stash[timing_store_key] = store
+        config.stash[run_ids_key] = _fleet_run_ids(store, servers, fleet_started)
+    return True
+
+
+def _fleet_run_ids(store, servers, since):
+    """
+    Ejecuciones (run_id) que los procesos hijos registraron en el histórico desde `since`.
+
+    Args:
+        store (TimingStore): Histórico compartido por todos los procesos
+        servers (set): Identificadores de los servidores de la flota
+        since (datetime): Inicio de la ejecución en paralelo
+
+    Returns:
+        list: run_id de cada ejecución, por orden de inicio
+    """
+    run_ids = []
+    for server, _, _, _, _, run_id in store.durations(since=since):
+        if server in servers and run_id not in run_ids:
+            run_ids.append(run_id)
+    return run_ids
+
+
+def _run_soak(session):
+    """
+    Modo soak (--iterations / --duration): repite el flujo de login contra los servidores
+    seleccionados en lugar de ejecutar cada test una vez. No pasa por los informes de pytest
+    por iteración, así que la memoria se mantiene estable durante miles de iteraciones; el
+    resultado son tendencias de éxito y latencia por servidor (reports/soak/).
+    """
+    config = session.config
+    iterations, duration = config.getoption("iterations"), config.getoption("duration")
+    if not (iterations or duration):
+        return None
+    if not TEST_USERNAME or not TEST_PASSWORD:
+        raise pytest.UsageError("Soak mode needs TEST_USERNAME and TEST_PASSWORD")
+
+    urls = _selected_urls(session)
+    pool = DriverPool(DEFAULT_BROWSER, size=config.getoption("pool_size"),
+                      max_uses=config.getoption("pool_max_uses")).start()
+    runner = SoakRunner(pool, urls, TEST_USERNAME, TEST_PASSWORD, iterations=iterations, duration=duration,
+                        interval=config.getoption("interval"), store=TimingStore(),
+                        preflight=config.getoption("preflight"),
+                        flight_recorder=config.getoption("flight_recorder"))
+    # Show the progress live instead of capturing hours of output
+    capture = config.pluginmanager.getplugin("capturemanager")
+    with capture.global_and_fixture_disabled():
+        _console_to_terminal()
+        try:
+            trends = runner.run()
+        finally:
+            pool.close()
+            flush_logs()
+
+    def seconds(value):
+        return f"{value:.1f}s" if value is not None else "-"
+
+    failing = failing_servers(trends)
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    reporter.section("soak trends")
+    reporter.write_line(f"{'server':<16} {'iterations':>10} {'success':>8} {'last ' + str(SOAK_WINDOW):>8} "
+                        f"{'p50 first -> last':>20} {'p95 first -> last':>20}")
+    for trend in trends.values():
+        first, last = trend.first_window or {}, trend.rolling()
+        reporter.write_line(
+            f"{trend.server:<16} {trend.iterations:>10} {(trend.success_rate or 0) * 100:>7.1f}% "
+            f"{(last['success_rate'] or 0) * 100:>7.1f}% "
+            f"{seconds(first.get('p50')) + ' -> ' + seconds(last['p50']):>20} "
+            f"{seconds(first.get('p95')) + ' -> ' + seconds(last['p95']):>20}",
+            red=trend in failing)
+    reporter.write_line(f"Iterations: {runner.output_file}")
+    reporter.write_line(f"Summary: {write_summary(trends, runner.output_file)}")
+    # Below SOAK_MIN_SUCCESS_RATE a server counts as a failure of the session
+    session.testsfailed = len(failing)
+    return True
+
+
+def _run_load(session):
+    """
+    Modo carga (--users K): K usuarios virtuales ejecutan el flujo a la vez contra un solo
+    servidor, con ramp-up y hold. Los pasos no se añaden al histórico de tiempos para no
+    contaminar la referencia de regresiones; el resultado es la latencia por paso y la tasa
+    de error por nivel de concurrencia (reports/load/).
+    """
+    config = session.config
+    users = config.getoption("users")
+    if not users:
+        return None
+    if config.getoption("iterations") or config.getoption("duration"):
+        raise pytest.UsageError("Load mode (--users) cannot be combined with soak mode (--iterations / --duration)")
+    urls = _selected_urls(session)
+    if len(urls) != 1:
+        raise pytest.UsageError("Load mode runs against one server: select it with --url-index, --base-url or --standin")
+    if config.getoption("credentials"):
+        credentials = load_credentials(config.getoption("credentials"))
+    elif standin_key in config.stash:
+        credentials = standin_credentials(users)
+    else:
+        credentials = [(TEST_USERNAME, TEST_PASSWORD)] if TEST_USERNAME and TEST_PASSWORD else []
+    if len(credentials) < users:
+        raise pytest.UsageError(f"{users} virtual users need {users} accounts, only {len(credentials)} available "
+                                f"(use --credentials or LOAD_CREDENTIALS)")
+    probe = config.stash.get(preflight_key, {}).get(urls[0])
+    if probe is not None and not probe.healthy:
+        raise pytest.UsageError(f"Pre-flight: {probe.server} unreachable: {probe.describe()}")
+
+    # One browser per virtual user, all launched up front
+    pool = DriverPool(DEFAULT_BROWSER, size=users, max_uses=config.getoption("pool_max_uses")).start()
+    runner = LoadRunner(pool, urls[0], credentials, users, ramp_up=config.getoption("ramp_up"),
+                        hold=config.getoption("hold"))
+    capture = config.pluginmanager.getplugin("capturemanager")
+    with capture.global_and_fixture_disabled():
+        _console_to_terminal()
+        try:
+            stats = runner.run()
+        finally:
+            pool.close()
+            flush_logs()
+
+    def seconds(value):
+        return f"{value:.1f}s" if value is not None else "-"
+
+    summary = stats.summary()
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    reporter.section(f"load by concurrency level ({runner.server_id})")
+    reporter.write_line(f"{'users':>5}  {'step':<24} {'n':>5} {'errors':>7} {'p50':>8} {'p95':>8}")
+    for level in summary:
+        rows = [("flow", level["flow"])] + list(level["steps"].items())
+        for name, row in rows:
+            reporter.write_line(f"{level['users']:>5}  {name:<24} {row['n']:>5} {row['error_rate'] * 100:>6.1f}% "
+                                f"{seconds(row['p50']):>8} {seconds(row['p95']):>8}",
+                                red=row["errors"] > 0, bold=name == "flow")
+    if runner.stopped_users:
+        reporter.write_line(f"{runner.stopped_users} virtual user(s) stopped: no browser available", red=True)
+    reporter.write_line(f"Iterations: {runner.output_file}")
+    reporter.write_line(f"Summary: {write_load_summary(stats, runner.output_file)}")
+    session.testsfailed = sum(level["flow"]["errors"] for level in summary) + runner.stopped_users
+    return True
+
+
+@pytest.fixture(scope="session")
+def timing_store(request):
+    """
+    Fixture de sesión con el histórico de duraciones por paso (reports/timings.sqlite3).
+
+    Returns:
+        TimingStore: Almacén al que cada test añade sus pasos.
+    """
+    store = TimingStore()
+    request.config.stash[timing_store_key] = store
+    return store
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Compara los pasos de cada ejecución de la sesión con el histórico de su servidor.
+    Con --latency-regression=fail, una ralentización significativa hace fallar la sesión
+    aunque todos los tests hayan pasado.
+    """
+    mode = session.config.getoption("latency_regression")
+    store = session.config.stash.get(timing_store_key, None)
+    if mode == "off" or store is None:
+        return
+
+    regressions = []
+    for run_id in session.config.stash.get(run_ids_key, []):
+        try:
+            regressions.extend(check_run(store, run_id))
+        except Exception as e:
+            logger.warning("Latency regression check failed for %s: %s", run_id, e)
+    session.config.stash[regressions_key] = regressions
+
+    for regression in regressions:
+        logger.warning("🐢 Latency regression: %s", regression)
+    if mode == "fail" and any(regression.severity == "fail" for regression in regressions):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Añade al resumen de pytest las regresiones de latencia detectadas.
+    """
+    regressions = config.stash.get(regressions_key, [])
+    if not regressions:
+        return
+    terminalreporter.section("latency regressions")
+    for regression in regressions:
+        terminalreporter.write_line(str(regression), red=regression.severity == "fail",
+                                    yellow=regression.severity == "warn")
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Fixture de sesión con el pool de navegadores pre-lanzados.
+    Los navegadores se lanzan en segundo plano al inicio de la sesión y se cierran al final.
+
+    Yields:
+        DriverPool: Pool del que los tests toman prestado su navegador.
+    """
+    pool = DriverPool(
+        DEFAULT_BROWSER,
+        size=request.config.getoption("pool_size"),
+        max_uses=request.config.getoption("pool_max_uses"),
+        performance_logging=request.config.getoption("har"),
+    ).start()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    """
+    Fixture que presta una instancia del WebDriver del pool para cada función de test.
+
+    Yields:
+        WebDriver: Instancia del WebDriver configurada.
+    """
+    # Note: Logger setup is moved to the 'setup' fixture where 'base_url' is available
+    print(f"Leasing browser from pool: {DEFAULT_BROWSER}") # Use print for basic fixture info
+
+    try:
+        browser_driver = driver_pool.acquire()
+    except Exception as e:
+        pytest.fail(f"Failed to initialize WebDriver ({DEFAULT_BROWSER}): {e}")
+        return # Ensure no further execution if driver fails
+
+    # Yield the driver to the test function
+    yield browser_driver
+
+    # --- Teardown ---
+    # Write the step timings of this test before the browser is reused by another one
+    StepTimer.release(browser_driver)
+    # Return the browser to the pool; it is recycled instead of reused if the test failed
+    report = getattr(request.node, "rep_call", None)
+    failed = report is None or report.failed
+    print("Returning browser to pool.") # Use print for basic fixture info
+    driver_pool.release(browser_driver, failed=failed)
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Hook para procesar el resultado de cada test y capturar screenshots en caso de fallos.
+    """
+    # Execute all other hooks to obtain the report object
+    outcome = yield
+    rep = outcome.get_result()
+    # Keep the report on the item so fixtures can check the outcome during teardown
+    setattr(item, f"rep_{rep.when}", rep)
+
+    # Lead-up to a failure in any phase, written before the browser is released
+    if rep.failed and flight_recorder_key in item.stash:
+        item.stash[flight_recorder_key].dump(f"test {rep.when} failed")
+
+    # We only look at the 'call' phase results and only if the test failed
+    if rep.when == "call" and rep.failed:
+        try:
+            # Attempt to retrieve the driver instance from the test item's function arguments
+            # 'driver' fixture should be used in the test for this to work
+            driver_instance = item.funcargs.get("driver")
+            if driver_instance:
+                # Get base_url info if available to include in the filename
+                base_url = item.funcargs.get("base_url", "unknown_url")
+                # Try to extract a server identifier (e.g., ftdspprod001)
+                server_match = re.search(r'ftdspprod\d{3}', base_url)
+                url_id = server_match.group(0) if server_match else base_url.split("//")[-1].split(".")[0]
+
+                # Construct a meaningful screenshot name
+                screenshot_name = f"FAILED_{item.name}_{url_id}"
+                take_screenshot(driver_instance, screenshot_name)
+            else:
+                # Log if driver instance wasn't found (e.g., test failed during setup before driver was available)
+                print(f"Screenshot skipped for {item.name}: Driver instance not found in funcargs.") # Use print in hook
+        except Exception as e:
+            print(f"Error capturing screenshot for {item.name}: {e}") # Use print in hook
+
+
+def take_screenshot(driver: WebDriver, name: str):
+    """
+    Captura un screenshot del navegador actual y lo guarda en una carpeta organizada por servidor.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver.
+        name (str): Nombre base para el archivo de captura (sin extensión).
+    """
+    try:
+        # Get current URL to determine the server ID for folder organization
+        current_url = driver.current_url
+        server_match = re.search(r'ftdspprod\d{3}', current_url)
+        # Use a more generic fallback if the specific pattern isn't found
+        server_id = server_match.group(0) if server_match else current_url.split("//")[-1].split(".")[0].replace('.', '_')
+
+        # Subdirectory for the specific server (created by the screenshot writer)
+        server_screenshots_dir = os.path.join(SCREENSHOTS_DIR, server_id)
+
+        # Generate filename with timestamp to avoid overwrites
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Sanitize the name part (replace characters invalid in filenames)
+        safe_name = re.sub(r'[<>:"/\\|?*\[\]]', '_', name)
+
+        # Only the browser-side grab blocks; encoding and writing happen in the background
+        filename = screenshot_writer.capture(driver, server_screenshots_dir, f"{safe_name}_{timestamp}")
+        print(f"Capturing screenshot: {filename}") # Use print
+    except Exception as e:
+        print(f"Failed to capture screenshot '{name}': {e}") # Use print
+
+
+@pytest.fixture(scope="function")
+def setup(request, driver, base_url, timing_store):
+    """
+    Fixture que configura el driver navegando a una URL base específica antes de cada test.
+    También configura el logger para usar un archivo específico para esa URL.
+
+    Args:
+        request: Objeto request de pytest (para leer las opciones de línea de comandos).
+        driver: Instancia del WebDriver (desde el fixture 'driver').
+        base_url: URL base a la que se navegará (proporcionada por pytest_generate_tests).
+        timing_store: Histórico de duraciones (desde el fixture 'timing_store').
+
+    Returns:
+        tuple: (WebDriver, str) - El driver configurado y la URL base utilizada.
+    """
+    # --- Logger Reconfiguration ---
+    # Extract a unique identifier from the base_url for logging purposes
+    url_id = get_server_id(base_url)
+
+    # Get a logger instance configured specifically for this URL/server ID
+    # This ensures logs for different parallel runs (if using xdist) go to separate files
+    test_logger = setup_logger(url_id)
+
+    test_logger.info("="*30 + f" TEST SETUP ({url_id}) " + "="*30)
+    test_logger.info("  Browser: %s", DEFAULT_BROWSER)
+    test_logger.info("  Target URL: %s", base_url)
+    test_logger.info("  Server ID: %s", url_id)
+    test_logger.info("  Default Timeout: %ss", DEFAULT_TIMEOUT)
+
+    # Step timer for this test; page objects created with this driver share it
+    timer = StepTimer.for_driver(driver, base_url)
+    timer.add_listener(TimingStoreRecorder(timing_store))
+    request.config.stash.setdefault(run_ids_key, []).append(timer.run_id)
+    if request.config.getoption("perf_metrics"):
+        timer.add_listener(PerformanceCollector(driver, url_id))
+    if request.config.getoption("har"):
+        timer.add_listener(HarRecorder(driver, url_id, request.node.originalname))
+    if request.config.getoption("profile_commands"):
+        timer.add_listener(CommandProfiler(driver, timer))
+    if request.config.getoption("flight_recorder"):
+        recorder = FlightRecorder(driver, url_id, request.node.name)
+        request.node.stash[flight_recorder_key] = recorder
+        timer.add_listener(recorder)
+    if request.config.getoption("screencast"):
+        timer.add_listener(ScreencastRecorder(driver, timer, request.node.name).start())
+
+    test_logger.info("Navigating to base URL: %s", base_url)
+    try:
+        driver.get(base_url)
+        test_logger.info("Navigation successful.")
+        timer.navigated(base_url)
+        # Optional: Add a wait for page load complete here if needed
+        # from utils.waits import wait_for_page_load
+        # wait_for_page_load(driver)
+    except Exception as e:
+        test_logger.error("Failed to navigate to %s: %s", base_url, e)
+        # Capture screenshot immediately if navigation fails
+        take_screenshot(driver, f"ERROR_NAVIGATE_{url_id}")
+        pytest.fail(f"Setup failed: Could not navigate to {base_url}. Error: {e}")
+
+    # Return the configured driver and the base URL to the test function
+    return driver, base_url
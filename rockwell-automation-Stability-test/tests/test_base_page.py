@@ -0,0 +1,110 @@
+"""
+Tests of the BasePage element cache against the local stand-in app (real browser from the 'driver' fixture).
+Element lookups are counted by wrapping the wait used by BasePage, so a test can tell a cached element from
+a new search.
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages import base_page
+from pages.base_page import BasePage
+from standin import StandInServer
+
+EMAIL_INPUT = (By.ID, "emailInput")
+CONTINUE_BUTTON = (By.ID, "continueBtn")
+
+
+@pytest.fixture(scope="module")
+def standin():
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """
+    Locators searched in the DOM by BasePage, in order.
+    """
+    searched = []
+    wait = base_page.wait_for_element_state
+
+    def counting_wait(driver, locator, *args, **kwargs):
+        searched.append(locator)
+        return wait(driver, locator, *args, **kwargs)
+
+    monkeypatch.setattr(base_page, "wait_for_element_state", counting_wait)
+    return searched
+
+
+@pytest.fixture
+def page(driver, standin, lookups):
+    page = BasePage(driver, standin.url)
+    page.open("login")
+    return page
+
+
+def _value(driver, locator):
+    return driver.find_element(*locator).get_attribute("value")
+
+
+def test_action_reuses_the_element_found_by_the_wait(page, lookups):
+    page.wait_for_element_visible(EMAIL_INPUT)
+    page.input_text(EMAIL_INPUT, "user@example.com")
+
+    assert lookups == [EMAIL_INPUT]
+    assert _value(page.driver, EMAIL_INPUT) == "user@example.com"
+
+
+def test_stale_element_is_found_again(page, lookups):
+    page.wait_for_element_visible(EMAIL_INPUT)
+    # Re-render: the cached node leaves the DOM and an identical one takes its place
+    page.driver.execute_script("var el = document.getElementById('emailInput'); el.replaceWith(el.cloneNode(true));")
+
+    page.input_text(EMAIL_INPUT, "user@example.com")
+
+    assert lookups == [EMAIL_INPUT, EMAIL_INPUT]
+    assert _value(page.driver, EMAIL_INPUT) == "user@example.com"
+
+
+def test_navigation_empties_the_cache(page, lookups):
+    page.wait_for_element_visible(EMAIL_INPUT)
+    page.open("login")
+
+    page.input_text(EMAIL_INPUT, "user@example.com")
+
+    assert lookups == [EMAIL_INPUT, EMAIL_INPUT]
+
+
+def test_every_action_searches_without_the_cache(page, lookups, monkeypatch):
+    monkeypatch.setattr(base_page, "ELEMENT_CACHE", False)
+
+    page.wait_for_element_visible(EMAIL_INPUT)
+    page.get_text(CONTINUE_BUTTON)
+    page.get_text(CONTINUE_BUTTON)
+
+    assert lookups == [EMAIL_INPUT, CONTINUE_BUTTON, CONTINUE_BUTTON]
+
+
+def test_element_that_cannot_be_clicked_is_found_again(page, lookups):
+    page.wait_for_element_clickable(CONTINUE_BUTTON)
+    # Re-render that leaves the cached node hidden in the DOM, behind a new button with the same id
+    page.driver.execute_script(
+        "var old = document.getElementById('continueBtn'), fresh = old.cloneNode(true);"
+        "fresh.onclick = function () { fresh.setAttribute('data-clicked', 'yes'); };"
+        "old.parentNode.insertBefore(fresh, old); old.style.display = 'none';")
+
+    page.click_element(CONTINUE_BUTTON)
+
+    assert lookups == [CONTINUE_BUTTON, CONTINUE_BUTTON]
+    assert page.driver.find_element(*CONTINUE_BUTTON).get_attribute("data-clicked") == "yes"
+
+
+def test_click_empties_the_cache(page, lookups):
+    page.wait_for_element_clickable(CONTINUE_BUTTON)
+    page.click_element(CONTINUE_BUTTON)
+
+    page.get_text(CONTINUE_BUTTON)
+
+    assert lookups == [CONTINUE_BUTTON, CONTINUE_BUTTON]
@@ -0,0 +1,110 @@
+"""
+Tests of the browser pool against real browsers: reuse, session reset between tests and recycling.
+Each test starts its own pool (Chrome, as in CI) and uses a page served from a local HTTP server,
+so cookies and web storage belong to a real origin.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.driver_factory import DriverPool
+
+# Seconds allowed for a pooled browser to launch
+LAUNCH_TIMEOUT = 60
+
+PAGE = b"<!DOCTYPE html><html><body><p id='page'>driver pool test</p></body></html>"
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def page_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pool():
+    pool = DriverPool("chrome", size=1, max_uses=2).start()
+    yield pool
+    pool.close()
+
+
+def _leave_session_behind(driver, url):
+    """
+    Leaves what a test leaves in the browser: a cookie, web storage and a second window.
+    """
+    driver.get(url)
+    driver.add_cookie({"name": "session", "value": "previous-test"})
+    driver.execute_script("localStorage.setItem('token', 'previous-test');")
+    driver.execute_script("sessionStorage.setItem('token', 'previous-test');")
+    driver.execute_script("window.open('about:blank');")
+    assert len(driver.window_handles) == 2
+
+
+def test_release_resets_and_reuses_the_browser(pool, page_url):
+    driver = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    _leave_session_behind(driver, page_url)
+    pool.release(driver)
+
+    reused = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    assert reused is driver
+    assert len(reused.window_handles) == 1
+    assert reused.current_url == "about:blank"
+    reused.get(page_url)
+    assert reused.get_cookies() == []
+    assert reused.execute_script("return localStorage.getItem('token');") is None
+    assert reused.execute_script("return sessionStorage.getItem('token');") is None
+    pool.release(reused)
+
+
+def test_failed_test_recycles_the_browser(pool, page_url):
+    driver = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    _leave_session_behind(driver, page_url)
+    pool.release(driver, failed=True)
+
+    replacement = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    assert replacement is not driver
+    replacement.get(page_url)
+    assert replacement.get_cookies() == []
+    pool.release(replacement)
+
+
+def test_browser_is_recycled_after_max_uses(pool):
+    first = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    pool.release(first)
+    assert pool.acquire(timeout=LAUNCH_TIMEOUT) is first
+    pool.release(first)
+
+    # Second use of a pool with max_uses=2: replaced instead of reset
+    replacement = pool.acquire(timeout=LAUNCH_TIMEOUT)
+    assert replacement is not first
+    pool.release(replacement)
+
+
+def test_launch_error_is_raised_to_the_caller():
+    pool = DriverPool("no-such-browser", size=1).start()
+    try:
+        with pytest.raises(ValueError, match="Unsupported browser"):
+            pool.acquire(timeout=LAUNCH_TIMEOUT)
+        # The pool keeps trying to launch a browser for the next caller
+        with pytest.raises(ValueError, match="Unsupported browser"):
+            pool.acquire(timeout=LAUNCH_TIMEOUT)
+    finally:
+        pool.close()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the HAR recorder: URL redaction and entries built from CDP Network events (no browser needed).
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from utils import har_recorder
+from utils.har_recorder import HarRecorder, redact_url
+
+
+def test_redact_url_replaces_query_values():
+    url, query_string = redact_url("https://sso.example.com/auth?code=abc123&state=xyz&empty=")
+
+    assert url == "https://sso.example.com/auth?code=REDACTED&state=REDACTED&empty=REDACTED"
+    assert query_string == [{"name": "code", "value": "REDACTED"}, {"name": "state", "value": "REDACTED"},
+                            {"name": "empty", "value": "REDACTED"}]
+
+
+def test_redact_url_drops_the_fragment():
+    assert redact_url("https://app.example.com/callback?code=abc#access_token=secret") == (
+        "https://app.example.com/callback?code=REDACTED", [{"name": "code", "value": "REDACTED"}])
+    assert redact_url("https://app.example.com/#/ide/token=secret")[0] == "https://app.example.com/"
+
+
+@pytest.mark.parametrize("url", [
+    "https://app.example.com/ide/projects",
+    "wss://app.example.com/hub",
+])
+def test_redact_url_without_query_string(url):
+    assert redact_url(url) == (url, [])
+
+
+@pytest.mark.parametrize("url", ["data:text/html,<p>?a=b</p>", "blob:https://app.example.com/1234", "", None])
+def test_redact_url_leaves_other_urls_alone(url):
+    assert redact_url(url) == (url, [])
+
+
+class _PerformanceLogDriver:
+    """
+    Driver whose performance log returns the CDP Network events queued with send().
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def send(self, method, **params):
+        self.events.append({"message": json.dumps({"message": {"method": method, "params": params}})})
+
+    def get_log(self, log_type):
+        events, self.events = self.events, []
+        return events
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    monkeypatch.setattr(har_recorder, "REPORTS_DIR", str(tmp_path))
+    driver = _PerformanceLogDriver()
+    return driver, HarRecorder(driver, "srv")
+
+
+def _read_har(recorder):
+    recorder.close()
+    with open(recorder.har_file) as har:
+        return json.load(har)["log"]
+
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat(timespec="milliseconds")
+
+
+def test_redirect_entry_points_to_the_next_hop(recorder):
+    driver, recorder = recorder
+    driver.send("Network.requestWillBeSent", requestId="1", timestamp=100.0, wallTime=1700000000.0,
+                request={"method": "GET", "url": "https://sso.example.com/auth?code=abc"})
+    # The next hop of the redirect reuses the requestId; Chrome does not always send its wallTime
+    driver.send("Network.requestWillBeSent", requestId="1", timestamp=100.25,
+                redirectResponse={"status": 302, "statusText": "Found"},
+                request={"method": "GET", "url": "https://app.example.com/callback?state=xyz"})
+    driver.send("Network.responseReceived", requestId="1", response={"status": 200})
+    driver.send("Network.loadingFinished", requestId="1", timestamp=100.5, encodedDataLength=10)
+    recorder.drain("03_login")
+
+    redirect, callback = _read_har(recorder)["entries"]
+
+    assert redirect["response"]["status"] == 302
+    assert redirect["response"]["redirectURL"] == "https://app.example.com/callback?state=REDACTED"
+    assert callback["response"]["redirectURL"] == ""
+    assert redirect["startedDateTime"] == _iso(1700000000.0)
+    assert callback["startedDateTime"] == _iso(1700000000.25)
+
+
+def test_request_without_any_wall_time_starts_with_its_step(recorder):
+    driver, recorder = recorder
+    driver.send("Network.requestWillBeSent", requestId="1", timestamp=100.0,
+                request={"method": "GET", "url": "https://app.example.com/api/projects"})
+    recorder.drain("06_new_project")
+
+    log = _read_har(recorder)
+
+    # Still in flight when the recorder closes: written as incomplete
+    (entry,) = log["entries"]
+    assert entry["_incomplete"] is True
+    assert entry["startedDateTime"] == log["pages"][0]["startedDateTime"]
@@ -0,0 +1,53 @@
+"""
+Unit tests for the account pool and per-concurrency statistics of the load mode (no browser needed).
+"""
+
+from utils.load import load_credentials, standin_credentials, LoadStats
+
+
+def test_load_credentials(tmp_path):
+    path = tmp_path / "accounts.csv"
+    path.write_text("# email,password\n"
+                    "user1@example.com,secret1\n"
+                    "\n"
+                    "  user2@example.com , pass,with,commas\n"
+                    "   # disabled@example.com,x\n"
+                    "incomplete@example.com\n")
+
+    assert load_credentials(str(path)) == [("user1@example.com", "secret1"), ("user2@example.com", "pass")]
+
+
+def test_standin_credentials():
+    assert standin_credentials(2) == [("vuser01@standin.local", "standin"), ("vuser02@standin.local", "standin")]
+
+
+def _steps(*outcomes):
+    return [{"name": f"0{number}_step", "duration": float(number), "outcome": outcome}
+            for number, outcome in enumerate(outcomes, start=1)]
+
+
+def test_load_stats_per_concurrency_level():
+    stats = LoadStats()
+    stats.add(2, True, 10.0, _steps("passed", "passed"))
+    stats.add(1, True, 4.0, _steps("passed", "passed"))
+    stats.add(2, False, 30.0, _steps("passed", "failed"))
+    stats.add(2, True, 20.0, _steps("passed", "passed"))
+
+    one_user, two_users = stats.summary()
+    assert one_user["users"] == 1
+    assert one_user["flow"] == {"n": 1, "errors": 0, "error_rate": 0.0, "p50": 4.0, "p95": 4.0}
+    assert two_users["users"] == 2
+    # Failed iterations count as errors and are left out of the latency
+    assert two_users["flow"] == {"n": 3, "errors": 1, "error_rate": 0.333, "p50": 15.0, "p95": 19.5}
+    assert two_users["steps"] == {
+        "01_step": {"n": 3, "errors": 0, "error_rate": 0.0, "p50": 1.0, "p95": 1.0},
+        "02_step": {"n": 3, "errors": 1, "error_rate": 0.333, "p50": 2.0, "p95": 2.0},
+    }
+
+
+def test_load_stats_without_passed_iterations():
+    stats = LoadStats()
+    stats.add(3, False, 5.0, [])
+
+    assert stats.summary() == [{"users": 3, "flow": {"n": 1, "errors": 1, "error_rate": 1.0, "p50": None,
+                                                     "p95": None}, "steps": {}}]
@@ -0,0 +1,98 @@
+"""
+Unit tests for the structured JSONL event log and its gzip rotation (no browser needed).
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import sys
+
+from utils.logger import GzipRotatingFileHandler, JsonFormatter, _DeferredQueueHandler, iter_log_events
+
+
+def _record(message, **extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_writes_one_event_per_line():
+    line = JsonFormatter().format(_record("clicked %s", server="srv", step="02_enter_email", event="action",
+                                          action="click_element", elapsed=0.25, outcome="passed"))
+
+    event = json.loads(line)
+    assert "\n" not in line
+    assert {key: event[key] for key in ("level", "server", "step", "event", "action", "elapsed", "outcome")} == {
+        "level": "INFO", "server": "srv", "step": "02_enter_email", "event": "action",
+        "action": "click_element", "elapsed": 0.25, "outcome": "passed"}
+    assert "locator" not in event
+
+
+def test_rotation_compresses_segments_and_reads_them_back_in_order(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    handler = GzipRotatingFileHandler(path, max_bytes=500, backup_count=3)
+    handler.setFormatter(JsonFormatter())
+    for number in range(100):
+        handler.emit(_record(f"event {number}", server="srv", step=None))
+    handler.close()
+
+    assert sorted(os.listdir(tmp_path)) == ["events.jsonl", "events.jsonl.1.gz", "events.jsonl.2.gz",
+                                            "events.jsonl.3.gz"]
+    for number in range(1, 4):
+        with gzip.open(f"{path}.{number}.gz", "rt", encoding="utf-8") as segment:
+            assert all(json.loads(line)["server"] == "srv" for line in segment)
+
+    # Older segments were dropped: what is left is the most recent events, oldest first
+    numbers = [int(event["message"].split()[1]) for event in iter_log_events(path)]
+    assert numbers == list(range(numbers[0], 100))
+    assert 0 < numbers[0] < 100
+
+
+def test_iter_log_events_without_rotated_segments(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"message": "first"}\n\n{"message": "second"}\n', encoding="utf-8")
+
+    assert [event["message"] for event in iter_log_events(str(path))] == ["first", "second"]
+    assert list(iter_log_events(str(tmp_path / "missing.jsonl"))) == []
+
+
+def _enqueue(record):
+    """
+    Puts the record through the async-mode handler and returns what the listener thread would get.
+    """
+    records = queue.Queue()
+    _DeferredQueueHandler(records).emit(record)
+    return records.get_nowait()
+
+
+def test_deferred_handler_formats_exceptions_on_the_calling_thread():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = _record("step failed", exc_info=sys.exc_info())
+
+    queued = _enqueue(record)
+
+    # No traceback (and no test frames) is kept alive until the listener writes the record
+    assert queued.exc_info is None
+    assert "ZeroDivisionError" in queued.exc_text
+    assert "ZeroDivisionError" in json.loads(JsonFormatter().format(queued))["exception"]
+
+
+def test_deferred_handler_freezes_mutable_arguments():
+    state = {"step": "01_open"}
+    record = _record("state %s", args=(state,))
+
+    queued = _enqueue(record)
+    state["step"] = "02_enter_email"
+
+    assert queued.getMessage() == "state {'step': '01_open'}"
+
+
+def test_deferred_handler_leaves_immutable_arguments_to_the_listener():
+    queued = _enqueue(_record("clicked %s in %.2fs", args=(("id", "continueBtn"), 0.25)))
+
+    assert queued.args == (("id", "continueBtn"), 0.25)
+    assert queued.getMessage() == "clicked ('id', 'continueBtn') in 0.25s"
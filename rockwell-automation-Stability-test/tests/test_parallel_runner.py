@@ -0,0 +1,55 @@
+"""
+Unit tests for the URL selection and worker budget of the parallel runner (no browser needed).
+"""
+
+import pytest
+
+from utils import parallel_runner
+from utils.parallel_runner import parse_url_indexes, max_workers_for_budget
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("3", [3]),
+    ("1-5", [1, 2, 3, 4, 5]),
+    ("1-3,9,12", [1, 2, 3, 9, 12]),
+    (" 2 , 1-2 ,", [2, 1]),
+    ("12-12", [12]),
+])
+def test_parse_url_indexes(spec, expected):
+    assert parse_url_indexes(spec, total=12) == expected
+
+
+@pytest.mark.parametrize("spec", ["0", "13", "1-13", "5-3", "a", "1-b", "", " , "])
+def test_parse_url_indexes_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_url_indexes(spec, total=12)
+
+
+@pytest.fixture
+def host(monkeypatch):
+    """
+    Host with 8 CPUs and 4 GB available.
+    """
+    monkeypatch.setattr(parallel_runner.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(parallel_runner, "_available_memory_mb", lambda: 4096)
+
+
+def test_max_workers_for_budget_keeps_requests_that_fit(host):
+    assert max_workers_for_budget(3, cpu_per_browser=1, memory_per_browser_mb=512) == 3
+
+
+def test_max_workers_for_budget_caps_by_cpu(host):
+    assert max_workers_for_budget(10, cpu_per_browser=2, memory_per_browser_mb=256) == 4
+
+
+def test_max_workers_for_budget_caps_by_memory(host):
+    assert max_workers_for_budget(10, cpu_per_browser=0.5, memory_per_browser_mb=1024) == 4
+
+
+def test_max_workers_for_budget_runs_at_least_one_worker(host):
+    assert max_workers_for_budget(4, cpu_per_browser=16, memory_per_browser_mb=8192) == 1
+
+
+def test_max_workers_for_budget_without_memory_info(host, monkeypatch):
+    monkeypatch.setattr(parallel_runner, "_available_memory_mb", lambda: None)
+    assert max_workers_for_budget(6, cpu_per_browser=1, memory_per_browser_mb=1024) == 6
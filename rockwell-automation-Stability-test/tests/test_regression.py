@@ -0,0 +1,77 @@
+"""
+Unit tests for the latency regression check (no browser needed).
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.regression import robust_score, check_run
+from utils.timing_store import TimingStore
+
+BASELINE = [8.0, 8.2, 7.9, 8.1, 8.0, 7.8, 8.3]
+
+
+def test_robust_score():
+    assert robust_score(8.0, BASELINE) == 0
+    assert robust_score(7.0, BASELINE) < 0
+    # median 8.0, MAD 0.1 * 1.4826
+    assert robust_score(9.0, BASELINE) == pytest.approx(1 / 0.14826)
+
+
+def test_robust_score_without_spread():
+    assert robust_score(8.5, [8.0] * 5) == float("inf")
+    assert robust_score(8.0, [8.0] * 5) == 0.0
+
+
+@pytest.fixture
+def store(tmp_path):
+    """
+    Timing store with the baseline runs of step "login" on server "srv".
+    """
+    store = TimingStore(str(tmp_path / "timings.sqlite3"))
+    start = datetime(2024, 1, 1, 8)
+    store.add_steps([_step(f"run_{number}", start + timedelta(hours=number), duration)
+                     for number, duration in enumerate(BASELINE)])
+    return store
+
+
+def _step(run_id, start, duration, outcome="passed"):
+    return {"kind": "step", "run_id": run_id, "server": "srv", "name": "login",
+            "start": start.isoformat(timespec="milliseconds"), "duration": duration, "outcome": outcome}
+
+
+def _check(store, duration, outcome="passed", **thresholds):
+    store.add_steps([_step("current", datetime(2024, 1, 2, 8), duration, outcome)])
+    return check_run(store, "current", **thresholds)
+
+
+@pytest.mark.parametrize("duration", [60.0, 12.5])
+def test_check_run_flags_slow_steps(store, duration):
+    regressions = _check(store, duration, warn_score=3.5, fail_score=6, min_ratio=1.5, min_delta=2)
+    assert [(regression.step, regression.severity) for regression in regressions] == [("login", "fail")]
+    assert regressions[0].baseline_median == 8.0
+    assert regressions[0].baseline_samples == len(BASELINE)
+
+
+def test_check_run_warns_between_the_scores(store):
+    # Score ~17.5: above the warning score, below this failure score
+    regressions = _check(store, 10.6, warn_score=3.5, fail_score=20, min_ratio=1.3, min_delta=2)
+    assert [regression.severity for regression in regressions] == ["warn"]
+
+
+@pytest.mark.parametrize("duration, thresholds", [
+    (8.4, {}),                                  # within the usual spread
+    (11.0, {"min_ratio": 1.5}),                 # unusual, but only 1.4x the median
+    (9.5, {"min_ratio": 1.0, "min_delta": 2}),  # unusual, but only 1.5s slower
+])
+def test_check_run_ignores_small_slowdowns(store, duration, thresholds):
+    assert _check(store, duration, **thresholds) == []
+
+
+def test_check_run_ignores_failed_steps(store):
+    assert _check(store, 60.0, outcome="failed") == []
+
+
+def test_check_run_needs_enough_baseline_samples(store):
+    assert _check(store, 60.0, min_samples=len(BASELINE) + 1) == []
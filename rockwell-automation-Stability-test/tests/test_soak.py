@@ -0,0 +1,68 @@
+"""
+Unit tests for the duration parsing and rolling trends of the soak mode (no browser needed).
+"""
+
+import argparse
+
+import pytest
+
+from utils.soak import parse_duration, ServerTrend, failing_servers
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("90", 90), ("30s", 30), ("15m", 900), ("8h", 28800), ("2d", 172800), ("1.5h", 5400), (" 10m ", 600),
+])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "m", "-5m", "10 m", "3w", "1h30m"])
+def test_parse_duration_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_duration(value)
+
+
+def test_server_trend_keeps_only_the_last_window():
+    trend = ServerTrend("srv", window=4)
+    for duration in [1.0, 2.0, 3.0, 4.0, 10.0, 20.0]:
+        trend.add(True, duration, {"login": duration / 2})
+
+    assert trend.iterations == 6
+    assert trend.rolling() == {"n": 4, "success_rate": 1.0, "p50": 7.0, "p95": 18.5}
+    assert trend.step_medians() == {"login": 3.5}
+
+
+def test_server_trend_keeps_the_first_full_window():
+    trend = ServerTrend("srv", window=2)
+    trend.add(True, 1.0, {"login": 0.5})
+    assert trend.first_window is None
+    trend.add(True, 3.0, {"login": 1.5})
+    trend.add(True, 9.0, {"login": 4.5})
+
+    summary = trend.summary()
+    assert summary["first_window"] == {"n": 2, "success_rate": 1.0, "p50": 2.0, "p95": 2.9}
+    assert summary["first_steps"] == {"login": 1.0}
+    assert summary["last_window"]["p50"] == 6.0
+    assert summary["last_steps"] == {"login": 3.0}
+
+
+def test_server_trend_leaves_failures_out_of_the_latency():
+    trend = ServerTrend("srv", window=4)
+    trend.add(True, 5.0, {"login": 2.0})
+    trend.add(False, 120.0, {})
+    trend.add(False, 0.0, {})
+
+    assert trend.failures == 2
+    assert trend.success_rate == pytest.approx(1 / 3)
+    assert trend.rolling() == {"n": 3, "success_rate": 0.333, "p50": 5.0, "p95": 5.0}
+
+
+def test_failing_servers():
+    healthy, flaky, idle = ServerTrend("a"), ServerTrend("b"), ServerTrend("c")
+    for passed in [True] * 19 + [False]:
+        healthy.add(passed, 1.0, {})
+    for passed in [True] * 17 + [False] * 3:
+        flaky.add(passed, 1.0, {})
+
+    assert idle.success_rate is None
+    assert failing_servers({"a": healthy, "b": flaky, "c": idle}, min_success_rate=0.95) == [flaky]
@@ -0,0 +1,63 @@
+"""
+Unit tests for the SQLite step history and its percentile report (no browser needed).
+"""
+
+import argparse
+
+import pytest
+
+from utils.timing_store import TimingStore, percentile, parse_since
+
+
+def test_percentile_interpolates_between_ranks():
+    values = [4, 1, 3, 2]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4
+    assert percentile(values, 95) == pytest.approx(3.85)
+
+
+def test_percentile_of_one_and_no_values():
+    assert percentile([7.5], 95) == 7.5
+    assert percentile([], 50) is None
+
+
+@pytest.mark.parametrize("value", ["7", "7m", "d", "1.5d", "7 d"])
+def test_parse_since_rejects_invalid_windows(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_since(value)
+
+
+def _step(run_id, server, name, start, duration, outcome="passed", kind="step"):
+    return {"kind": kind, "run_id": run_id, "server": server, "name": name, "start": start,
+            "duration": duration, "commands": 3, "outcome": outcome}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimingStore(str(tmp_path / "timings.sqlite3"))
+
+
+def test_add_steps_skips_other_records_and_duplicates(store):
+    records = [
+        _step("run_1", "srv", "01_open", "2024-01-01T08:00:00.000", 1.0),
+        _step("run_1", "srv", "click_element", "2024-01-01T08:00:00.500", 0.2, kind="action"),
+    ]
+    assert store.add_steps(records) == 1
+    # Workers may import the same timings file twice
+    assert store.add_steps(records) == 0
+    assert store.durations() == [("srv", "01_open", "2024-01-01T08:00:00.000", 1.0, "passed", "run_1")]
+
+
+def test_report_per_server_and_step(store):
+    store.add_steps([_step(f"run_{number}", "srv", "01_open", f"2024-01-0{number}T08:00:00.000", duration,
+                           outcome="failed" if number == 4 else "passed")
+                     for number, duration in enumerate([1.0, 2.0, 3.0, 10.0], start=1)])
+    store.add_steps([_step("run_1", "other", "01_open", "2024-01-01T09:00:00.000", 5.0)])
+
+    assert store.report(server="srv") == [{
+        "server": "srv", "step": "01_open", "window": "all", "count": 4, "failures": 1,
+        "p50": 2.5, "p95": 8.95, "p99": 9.79, "max": 10.0,
+    }]
+    assert [row["window"] for row in store.report(server="srv", bucket="day")] == [
+        "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
@@ -0,0 +1,224 @@
+"""
+Tests of the element waits in utils/waits.py against a real browser (the pooled browser of the
+'driver' fixture). Each test opens a small data: page and changes its DOM from a timer, as the app
+does after a backend call.
+"""
+
+import time
+from urllib.parse import quote
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils import waits
+from utils.waits import (
+    query_elements_state,
+    wait_for_element_attribute,
+    wait_for_element_state,
+    wait_for_elements_state,
+    wait_for_first_element_state,
+    wait_for_page_load,
+    wait_for_settle,
+    wait_for_text_to_be_present,
+    wait_for_url_contains,
+)
+
+PAGE = """<!DOCTYPE html>
+<html><body>
+<div id="hidden" style="display: none">hidden</div>
+<button id="disabled" disabled>disabled</button>
+</body></html>"""
+
+# The DOM changes after this delay; a wait that returns much later did not react to the change
+CHANGE_DELAY_MS = 300
+REACTION_LIMIT = 3
+
+
+def _open(driver, html=PAGE):
+    driver.get("data:text/html;charset=utf-8," + quote(html))
+
+
+def _change_later(driver, script, delay_ms=CHANGE_DELAY_MS):
+    """
+    Runs script in the page after delay_ms without blocking the test.
+    """
+    driver.execute_script("setTimeout(function () { %s }, %d);" % (script, delay_ms))
+
+
+def test_waits_for_an_element_added_later(driver):
+    _open(driver)
+    _change_later(driver, "var p = document.createElement('p'); p.id = 'late'; document.body.appendChild(p);")
+
+    started = time.monotonic()
+    element = wait_for_element_state(driver, (By.ID, "late"), "present", timeout=10)
+
+    assert element.get_attribute("id") == "late"
+    assert time.monotonic() - started < REACTION_LIMIT
+
+
+def test_waits_for_an_element_to_become_visible(driver):
+    _open(driver)
+    assert wait_for_element_state(driver, (By.ID, "hidden"), "present", timeout=1).get_attribute("id") == "hidden"
+    _change_later(driver, "document.getElementById('hidden').style.display = '';")
+
+    element = wait_for_element_state(driver, (By.ID, "hidden"), "visible", timeout=10)
+
+    assert element.is_displayed()
+
+
+def test_waits_for_a_button_to_become_clickable(driver):
+    _open(driver)
+    _change_later(driver, "document.getElementById('disabled').disabled = false;")
+
+    element = wait_for_element_state(driver, (By.ID, "disabled"), "clickable", timeout=10)
+
+    assert element.is_enabled()
+
+
+@pytest.mark.parametrize("locator", [
+    (By.XPATH, "//button[@id='disabled']"),
+    (By.CSS_SELECTOR, "body > button"),
+    (By.TAG_NAME, "button"),
+])
+def test_locator_strategies(driver, locator):
+    _open(driver)
+    assert wait_for_element_state(driver, locator, "present", timeout=1).get_attribute("id") == "disabled"
+
+
+def test_times_out_when_the_state_is_never_reached(driver):
+    _open(driver)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        wait_for_element_state(driver, (By.ID, "hidden"), "visible", timeout=1)
+    assert 1 <= time.monotonic() - started < REACTION_LIMIT
+
+
+def test_rejects_unknown_states():
+    with pytest.raises(ValueError):
+        wait_for_element_state(None, (By.ID, "hidden"), "focused", timeout=1)
+
+
+class _UnobservableDriver:
+    """
+    Driver whose script calls fail, as when the window was closed or the page blocks the injected script.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+    def execute_async_script(self, script, *args):
+        raise self.error
+
+
+@pytest.mark.parametrize("error", [
+    WebDriverException("no such window"),
+    JavascriptException("javascript error: blocked by the page"),
+])
+def test_settle_waits_out_the_timeout_instead_of_raising(error):
+    started = time.monotonic()
+
+    assert wait_for_settle(_UnobservableDriver(error), quiet_window=0.1, timeout=0.5) is False
+    assert 0.5 <= time.monotonic() - started < REACTION_LIMIT
+
+
+def test_query_elements_state_reports_each_locator(driver):
+    _open(driver)
+    hidden, disabled, missing = (By.ID, "hidden"), (By.ID, "disabled"), (By.ID, "missing")
+
+    results = query_elements_state(driver, {hidden: "present", disabled: "clickable", missing: "present"})
+
+    assert results[hidden].get_attribute("id") == "hidden"
+    assert results[disabled] is None
+    assert results[missing] is None
+
+
+def test_wait_for_elements_state_waits_for_all_of_them(driver):
+    _open(driver)
+    _change_later(driver, "document.getElementById('hidden').style.display = '';"
+                          "document.getElementById('disabled').disabled = false;")
+
+    results = wait_for_elements_state(driver, {(By.ID, "hidden"): "visible", (By.ID, "disabled"): "clickable"},
+                                      timeout=10)
+
+    assert results[(By.ID, "hidden")].is_displayed()
+    assert results[(By.ID, "disabled")].is_enabled()
+
+
+def test_wait_for_elements_state_names_the_pending_locators(driver):
+    _open(driver)
+
+    with pytest.raises(TimeoutException, match="missing"):
+        wait_for_elements_state(driver, {(By.ID, "hidden"): "present", (By.ID, "missing"): "present"}, timeout=1)
+
+
+def test_baseline_wait_helpers(driver):
+    _open(driver)
+
+    wait_for_page_load(driver, timeout=5)
+    assert wait_for_url_contains(driver, "data:text/html", timeout=1)
+    assert wait_for_text_to_be_present(driver, (By.ID, "disabled"), "disabled", timeout=1)
+    assert wait_for_element_attribute(driver, (By.ID, "hidden"), "style", "none", timeout=1)
+    assert wait_for_text_to_be_present(driver, (By.ID, "disabled"), "enabled", timeout=1) is False
+
+
+def test_wait_for_first_returns_the_candidate_that_appears(driver):
+    _open(driver)
+    _change_later(driver, "var p = document.createElement('p'); p.id = 'late'; document.body.appendChild(p);")
+
+    started = time.monotonic()
+    index, element = wait_for_first_element_state(
+        driver, [((By.ID, "never"), "present"), ((By.ID, "late"), "present")], timeout=10)
+
+    assert index == 1
+    assert element.get_attribute("id") == "late"
+    assert time.monotonic() - started < REACTION_LIMIT
+
+
+def test_wait_for_first_prefers_the_first_candidate_when_both_match(driver):
+    _open(driver)
+
+    index, element = wait_for_first_element_state(
+        driver, [((By.ID, "hidden"), "present"), ((By.ID, "disabled"), "present")], timeout=1)
+
+    assert index == 0
+    assert element.get_attribute("id") == "hidden"
+
+
+def test_wait_for_first_times_out_when_no_candidate_matches(driver):
+    _open(driver)
+
+    with pytest.raises(TimeoutException):
+        wait_for_first_element_state(driver, [((By.ID, "hidden"), "visible"), ((By.ID, "never"), "present")],
+                                     timeout=1)
+
+
+def test_wait_for_first_fallback_does_not_pay_the_implicit_wait(driver, monkeypatch):
+    # A page that blocks the injected observer sends the wait to the WebDriverWait fallback
+    monkeypatch.setattr(waits, "OBSERVE_ELEMENTS_JS", "throw new Error('blocked');")
+    _open(driver)
+    implicit_wait = driver.timeouts.implicit_wait
+
+    started = time.monotonic()
+    index, _ = wait_for_first_element_state(
+        driver, [((By.ID, "never"), "present"), ((By.ID, "disabled"), "present")], timeout=10)
+
+    assert index == 1
+    assert time.monotonic() - started < 1
+    assert driver.timeouts.implicit_wait == implicit_wait
+
+
+def test_query_elements_state_fallback_does_not_pay_the_implicit_wait(driver, monkeypatch):
+    monkeypatch.setattr(waits, "QUERY_ELEMENTS_JS", "throw new Error('blocked');")
+    _open(driver)
+    implicit_wait = driver.timeouts.implicit_wait
+
+    started = time.monotonic()
+    results = query_elements_state(driver, {(By.ID, "missing"): "present", (By.ID, "other"): "present",
+                                            (By.ID, "disabled"): "present"})
+
+    assert results[(By.ID, "disabled")].get_attribute("id") == "disabled"
+    assert results[(By.ID, "missing")] is None
+    assert time.monotonic() - started < 1
+    assert driver.timeouts.implicit_wait == implicit_wait
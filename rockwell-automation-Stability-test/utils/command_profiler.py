@@ -0,0 +1,116 @@
+"""
+WebDriver command profiler.
+Wraps the driver's command executor to count and time every WebDriver command per step, and
+reports how much of each step was spent in HTTP round trips to chromedriver, waiting inside the
+browser (async scripts) and on the client side (Python, sleeps, polling intervals).
+Per-step records go to reports/logs/<server>/commands_<timestamp>.jsonl.
+"""
+import json
+import os
+import time
+from datetime import datetime
+
+from selenium.webdriver.remote.command import Command
+
+from config.config import REPORTS_DIR
+from utils.logger import logger
+
+# Commands that block in the browser until a condition holds (MutationObserver waits, settle)
+WAIT_COMMANDS = {Command.W3C_EXECUTE_SCRIPT_ASYNC}
+# Commands outside any step (setup navigation, teardown)
+OUTSIDE_STEPS = "outside_steps"
+
+
+class CommandProfiler:
+    """
+    StepTimer listener that times each WebDriver command at the HTTP layer.
+    """
+
+    def __init__(self, driver, timer):
+        """
+        Args:
+            driver: WebDriver instance to profile
+            timer (StepTimer): Timer of the driver, used to attribute commands to steps
+        """
+        self.timer = timer
+        self.server_id = timer.server_id
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_file = os.path.join(REPORTS_DIR, "logs", self.server_id, f"commands_{timestamp}.jsonl")
+        self._file = None
+        self._stats = {}
+        self._executor = driver.command_executor
+        self._wrap_executor()
+
+    def breakdown(self, step):
+        """
+        Commands of a step grouped by command name.
+
+        Args:
+            step (str): Step name
+
+        Returns:
+            dict: Command name -> {"count", "seconds"}, slowest first
+        """
+        stats = self._stats.get(step, {})
+        ordered = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)
+        return {name: {"count": count, "seconds": round(seconds, 4)} for name, (count, seconds) in ordered}
+
+    def on_step_end(self, record):
+        self._report(record["name"], record["duration"])
+
+    def close(self):
+        """
+        Reports the commands issued outside any step, closes the output file and restores the executor.
+        """
+        if OUTSIDE_STEPS in self._stats:
+            self._report(OUTSIDE_STEPS, None)
+        if self._file:
+            self._file.close()
+            self._file = None
+        self._executor.__dict__.pop("execute", None)
+
+    def _wrap_executor(self):
+        # Per-instance attribute: other drivers sharing the RemoteConnection class are not affected
+        original_execute = self._executor.execute
+
+        def timed_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                step = self.timer.current_step or OUTSIDE_STEPS
+                stats = self._stats.setdefault(step, {}).setdefault(command, [0, 0.0])
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+
+        self._executor.execute = timed_execute
+
+    def _report(self, step, duration):
+        commands = self.breakdown(step)
+        round_trips = sum(command["count"] for command in commands.values())
+        wait_time = sum(command["seconds"] for name, command in commands.items() if name in WAIT_COMMANDS)
+        http_time = sum(command["seconds"] for name, command in commands.items() if name not in WAIT_COMMANDS)
+        client_time = max(0.0, duration - http_time - wait_time) if duration is not None else None
+        record = {
+            "server": self.server_id,
+            "run_id": self.timer.run_id,
+            "step": step,
+            "duration": duration,
+            "round_trips": round_trips,
+            "http_seconds": round(http_time, 3),
+            "browser_wait_seconds": round(wait_time, 3),
+            "client_seconds": round(client_time, 3) if client_time is not None else None,
+            "commands": commands,
+        }
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+            self._file = open(self.output_file, "a")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+        top = ", ".join(f"{name} x{command['count']} {command['seconds']:.2f}s"
+                        for name, command in list(commands.items())[:4])
+        client = f", client {client_time:.2f}s" if client_time is not None else ""
+        logger.info("📡 %s: %s round trips, HTTP %.2fs, browser wait %.2fs%s [%s]",
+                    step, round_trips, http_time, wait_time, client, top)
+        self._stats.pop(step, None)
@@ -1,89 +1,268 @@
-"""
-Configuracion de Selenium, donde llamo todos los modulos a correr
-ademas me traigo las configuracion de los diferentes drivers a correr
-Factory para crear instancias del WebDriver.
-Centraliza la creación y configuración de diferentes navegadores.
-"""
-import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-# Import webdriver_manager only if needed for Firefox/Edge or local runs
-# from webdriver_manager.chrome import ChromeDriverManager # Removed for Chrome
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-
-from config.config import IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT
-from config.browsers import get_chrome_options, get_firefox_options, get_edge_options
-from utils.logger import logger
-
-class DriverFactory:
-
-    """
-    Clase para crear y configurar instancias del WebDriver para diferentes navegadores.
-    """
-
-    @staticmethod
-    def get_driver(browser_name="chrome"):
-        """
-        Creates and configures a WebDriver instance based on the specified browser.
-
-        Args:
-            browser_name (str): Name of the browser to use. Options: "chrome", "firefox", "edge"
-
-        Returns:
-            WebDriver: Configured WebDriver instance
-
-        Raises:
-            ValueError: If an unsupported browser is specified
-        """
-        browser_name = browser_name.lower()
-
-        if browser_name == "chrome":
-            # --- Modification Start ---
-            # Rely on ChromeDriver being in the system PATH (installed by the workflow)
-            # No need to use ChromeDriverManager().install() in the GitHub Action environment
-            logger.info("Initializing Chrome driver using system PATH for ChromeDriver")
-            try:
-                # Pass executable_path=None or omit it; Selenium >= 4.6 should find it automatically
-                # If using an older Selenium, you might need Service() without arguments
-                # For Selenium 4.10+, Service() is recommended even when using PATH
-                service = ChromeService() # Selenium should find chromedriver in PATH
-                driver = webdriver.Chrome(service=service, options=get_chrome_options())
-                logger.info("Chrome driver initialized successfully using system PATH.")
-            except Exception as e:
-                logger.error(f"Error initializing Chrome driver using system PATH: {e}")
-                logger.error("Ensure ChromeDriver is installed and accessible in the system's PATH.")
-                # Optional: Add fallback for local execution if needed, but primarily rely on PATH in CI
-                # try:
-                #     logger.warning("Falling back to ChromeDriverManager for local execution.")
-                #     from webdriver_manager.chrome import ChromeDriverManager
-                #     service = ChromeService(executable_path=ChromeDriverManager().install())
-                #     driver = webdriver.Chrome(service=service, options=get_chrome_options())
-                # except Exception as fallback_e:
-                #     logger.error(f"Fallback using ChromeDriverManager also failed: {fallback_e}")
-                #     raise fallback_e # Re-raise the fallback error if it fails too
-                raise e # Re-raise the original error if no fallback or fallback fails
-            # --- Modification End ---
-
-        elif browser_name == "firefox":
-            # Use webdriver-manager for Firefox if needed
-            logger.info("Initializing Firefox driver using GeckoDriverManager")
-            service = FirefoxService(GeckoDriverManager().install())
-            driver = webdriver.Firefox(service=service, options=get_firefox_options())
-            logger.info("Firefox driver initialized successfully.")
-        elif browser_name == "edge":
-            # Use webdriver-manager for Edge if needed
-            logger.info("Initializing Edge driver using EdgeChromiumDriverManager")
-            service = EdgeService(EdgeChromiumDriverManager().install())
-            driver = webdriver.Edge(service=service, options=get_edge_options())
-            logger.info("Edge driver initialized successfully.")
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
-
-        # Configure timeouts
-        driver.implicitly_wait(IMPLICIT_WAIT)
-        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-
-        return driver
+"""
+Configuracion de Selenium, donde llamo todos los modulos a correr
+ademas me traigo las configuracion de los diferentes drivers a correr
+Factory para crear instancias del WebDriver.
+Centraliza la creación y configuración de diferentes navegadores.
+"""
+import os
+import queue
+import threading
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+# Import webdriver_manager only if needed for Firefox/Edge or local runs
+# from webdriver_manager.chrome import ChromeDriverManager # Removed for Chrome
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from config.config import IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT, SCRIPT_TIMEOUT, DRIVER_POOL_SIZE, DRIVER_POOL_MAX_USES
+from config.browsers import get_chrome_options, get_firefox_options, get_edge_options
+from utils.logger import logger
+
+class DriverFactory:
+
+    """
+    Clase para crear y configurar instancias del WebDriver para diferentes navegadores.
+    """
+
+    @staticmethod
+    def get_driver(browser_name="chrome", performance_logging=False):
+        """
+        Creates and configures a WebDriver instance based on the specified browser.
+
+        Args:
+            browser_name (str): Name of the browser to use. Options: "chrome", "firefox", "edge"
+            performance_logging (bool): Enable Chrome's performance log (CDP Network events). Chrome only.
+
+        Returns:
+            WebDriver: Configured WebDriver instance
+
+        Raises:
+            ValueError: If an unsupported browser is specified
+        """
+        browser_name = browser_name.lower()
+
+        if browser_name == "chrome":
+            # --- Modification Start ---
+            # Rely on ChromeDriver being in the system PATH (installed by the workflow)
+            # No need to use ChromeDriverManager().install() in the GitHub Action environment
+            logger.info("Initializing Chrome driver using system PATH for ChromeDriver")
+            try:
+                # Pass executable_path=None or omit it; Selenium >= 4.6 should find it automatically
+                # If using an older Selenium, you might need Service() without arguments
+                # For Selenium 4.10+, Service() is recommended even when using PATH
+                service = ChromeService() # Selenium should find chromedriver in PATH
+                driver = webdriver.Chrome(service=service, options=get_chrome_options(performance_logging))
+                logger.info("Chrome driver initialized successfully using system PATH.")
+            except Exception as e:
+                logger.error("Error initializing Chrome driver using system PATH: %s", e)
+                logger.error("Ensure ChromeDriver is installed and accessible in the system's PATH.")
+                # Optional: Add fallback for local execution if needed, but primarily rely on PATH in CI
+                # try:
+                #     logger.warning("Falling back to ChromeDriverManager for local execution.")
+                #     from webdriver_manager.chrome import ChromeDriverManager
+                #     service = ChromeService(executable_path=ChromeDriverManager().install())
+                #     driver = webdriver.Chrome(service=service, options=get_chrome_options())
+                # except Exception as fallback_e:
+                #     logger.error(f"Fallback using ChromeDriverManager also failed: {fallback_e}")
+                #     raise fallback_e # Re-raise the fallback error if it fails too
+                raise e # Re-raise the original error if no fallback or fallback fails
+            # --- Modification End ---
+
+        elif performance_logging:
+            raise ValueError(f"Performance logging is only supported on Chrome, not {browser_name}")
+        elif browser_name == "firefox":
+            # Use webdriver-manager for Firefox if needed
+            logger.info("Initializing Firefox driver using GeckoDriverManager")
+            service = FirefoxService(GeckoDriverManager().install())
+            driver = webdriver.Firefox(service=service, options=get_firefox_options())
+            logger.info("Firefox driver initialized successfully.")
+        elif browser_name == "edge":
+            # Use webdriver-manager for Edge if needed
+            logger.info("Initializing Edge driver using EdgeChromiumDriverManager")
+            service = EdgeService(EdgeChromiumDriverManager().install())
+            driver = webdriver.Edge(service=service, options=get_edge_options())
+            logger.info("Edge driver initialized successfully.")
+        else:
+            raise ValueError(f"Unsupported browser: {browser_name}")
+
+        # Configure timeouts
+        driver.implicitly_wait(IMPLICIT_WAIT)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+
+        return driver
+
+
+class DriverPool:
+    """
+    Pool de navegadores pre-lanzados y pre-calentados.
+    Evita pagar el arranque en frío de Chrome/ChromeDriver en cada test: los drivers
+    se prestan con acquire() y se devuelven con release(), que limpia la sesión
+    (cookies, storage y ventanas) o recicla el navegador tras N usos o un error.
+    """
+
+    def __init__(self, browser_name="chrome", size=DRIVER_POOL_SIZE, max_uses=DRIVER_POOL_MAX_USES,
+                 performance_logging=False):
+        """
+        Args:
+            browser_name (str): Navegador a usar. Options: "chrome", "firefox", "edge"
+            size (int): Número de navegadores que se mantienen listos
+            max_uses (int): Usos tras los cuales un navegador se cierra y se reemplaza
+            performance_logging (bool): Lanza los navegadores con el log de rendimiento activado
+        """
+        self.browser_name = browser_name
+        self.performance_logging = performance_logging
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._launchers = []
+        self._closed = False
+
+    def start(self):
+        """
+        Lanza los navegadores del pool en segundo plano.
+
+        Returns:
+            DriverPool: Returns self for method chaining
+        """
+        logger.info("Starting driver pool: %s x %s (max %s uses each)", self.size, self.browser_name, self.max_uses)
+        for _ in range(self.size):
+            self._launch_async()
+        return self
+
+    def acquire(self, timeout=None):
+        """
+        Presta un navegador listo para usar, esperando a que alguno esté disponible.
+
+        Args:
+            timeout (float, optional): Tiempo máximo de espera en segundos
+
+        Returns:
+            WebDriver: Navegador limpio y pre-calentado
+
+        Raises:
+            queue.Empty: Si no hay navegador disponible en el tiempo indicado
+            Exception: El error de arranque si el navegador no pudo lanzarse
+        """
+        item = self._idle.get(timeout=timeout)
+        if isinstance(item, Exception):
+            # Launch failed: keep the pool at its size and surface the error to the caller
+            self._launch_async()
+            raise item
+        return item
+
+    def release(self, driver, failed=False):
+        """
+        Devuelve un navegador al pool.
+        Se recicla (cierra y reemplaza) si el test falló, si alcanzó max_uses o si la limpieza falla.
+
+        Args:
+            driver (WebDriver): Navegador obtenido con acquire()
+            failed (bool, optional): True si el test que lo usó falló
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if self._closed:
+            self._retire(driver)
+            return
+        if failed or uses >= self.max_uses:
+            reason = "test failure" if failed else f"{uses} uses"
+            logger.info("Recycling browser after %s", reason)
+            self._retire(driver)
+            self._launch_async()
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning("Could not reset browser session, recycling it: %s", e)
+            self._retire(driver)
+            self._launch_async()
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        """
+        Cierra todos los navegadores del pool, incluidos los que se están lanzando.
+        """
+        self._closed = True
+        for launcher in list(self._launchers):
+            launcher.join()
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(item, Exception):
+                self._retire(item)
+        logger.info("Driver pool closed")
+
+    def _launch_async(self):
+        launcher = threading.Thread(target=self._launch, daemon=True)
+        self._launchers = [thread for thread in self._launchers if thread.is_alive()]
+        self._launchers.append(launcher)
+        launcher.start()
+
+    def _launch(self):
+        try:
+            driver = DriverFactory.get_driver(self.browser_name, self.performance_logging)
+            # Pre-warm: first navigation finishes the renderer startup before a test needs it
+            driver.get("about:blank")
+        except Exception as e:
+            logger.error("Error launching pooled browser: %s", e)
+            if not self._closed:
+                self._idle.put(e)
+            return
+        if self._closed:
+            self._retire(driver)
+            return
+        with self._lock:
+            self._uses[id(driver)] = 0
+        self._idle.put(driver)
+
+    def _reset(self, driver):
+        """
+        Deja el navegador como recién lanzado: una sola ventana, sin cookies ni storage.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium: clear storage for every origin that set cookies (app and SSO), not only the current one
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            origins = {f"https://{cookie['domain'].lstrip('.')}" for cookie in cookies}
+            current = urlparse(driver.current_url)
+            if current.scheme in ("http", "https"):
+                origins.add(f"{current.scheme}://{current.netloc}")
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.execute_script("try { localStorage.clear(); } catch (e) {}")
+            driver.delete_all_cookies()
+
+        # sessionStorage belongs to the window and Storage.clearDataForOrigin leaves it alone:
+        # swap the window for a new blank tab, which starts without it for every origin
+        driver.switch_to.new_window("tab")
+        blank = driver.current_window_handle
+        driver.switch_to.window(handles[0])
+        driver.close()
+        driver.switch_to.window(blank)
+
+    def _retire(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error closing pooled browser: %s", e)
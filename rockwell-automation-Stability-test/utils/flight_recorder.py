@@ -0,0 +1,98 @@
+"""
+Flight recorder: the lead-up to a failure without paying disk cost on green runs.
+Keeps the last N screenshots (and DOM snapshots) of a browser in memory, taken at the end of
+each step, and writes them to reports/screenshots/<server>/flight_<test>_<timestamp>/ only when
+a step or the test fails.
+"""
+import json
+import os
+import re
+from collections import deque
+from datetime import datetime
+
+from config.config import SCREENSHOTS_DIR, FLIGHT_RECORDER_SIZE, FLIGHT_RECORDER_DOM
+from utils.logger import logger
+from utils.screenshots import screenshot_writer
+
+
+class FlightRecorder:
+    """
+    StepTimer listener with a bounded ring buffer of step-boundary snapshots.
+    """
+
+    def __init__(self, driver, server_id, test_name="test", size=FLIGHT_RECORDER_SIZE, dom=FLIGHT_RECORDER_DOM):
+        """
+        Args:
+            driver: WebDriver instance to snapshot
+            server_id (str): Server identifier used to organize the output
+            test_name (str, optional): Test name used in the output directory
+            size (int, optional): Number of snapshots kept in memory
+            dom (bool, optional): Also keep the page source of each snapshot
+        """
+        self.driver = driver
+        self.server_id = server_id
+        self.test_name = re.sub(r'[<>:"/\\|?*\[\]]', '_', test_name)
+        self.dom = dom
+        self._buffer = deque(maxlen=size)
+
+    def snapshot(self, step, outcome):
+        """
+        Adds the current state of the browser to the buffer; the oldest snapshot is dropped when full.
+
+        Args:
+            step (str): Step that just ended
+            outcome (str): Outcome of that step
+        """
+        try:
+            self._buffer.append({
+                "step": step,
+                "outcome": outcome,
+                "taken_at": datetime.now().isoformat(timespec="milliseconds"),
+                "url": self.driver.current_url,
+                "png": self.driver.get_screenshot_as_png(),
+                "dom": self.driver.page_source if self.dom else None,
+            })
+        except Exception as e:
+            # The browser may already be gone; the earlier snapshots are still worth keeping
+            logger.debug("Flight recorder snapshot after %s failed: %s", step, e)
+
+    def dump(self, reason):
+        """
+        Writes the buffered snapshots (oldest first) and empties the buffer.
+
+        Args:
+            reason (str): Why the recording is written (failed step or test)
+
+        Returns:
+            str: Output directory, or None if the buffer was empty
+        """
+        if not self._buffer:
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        directory = os.path.join(SCREENSHOTS_DIR, self.server_id, f"flight_{self.test_name}_{timestamp}")
+        os.makedirs(directory, exist_ok=True)
+
+        index = []
+        for number, frame in enumerate(self._buffer, start=1):
+            name = f"{number:02d}_{frame['step']}"
+            entry = {key: frame[key] for key in ("step", "outcome", "taken_at", "url")}
+            entry["screenshot"] = os.path.basename(screenshot_writer.save(frame["png"], directory, name))
+            if frame["dom"] is not None:
+                with open(os.path.join(directory, f"{name}.html"), "w", encoding="utf-8") as dom_file:
+                    dom_file.write(frame["dom"])
+                entry["dom"] = f"{name}.html"
+            index.append(entry)
+        with open(os.path.join(directory, "index.json"), "w") as index_file:
+            json.dump({"server": self.server_id, "reason": reason, "snapshots": index}, index_file, indent=2)
+
+        logger.info("🛩️ Flight recorder (%s): %s snapshots written to %s", reason, len(index), directory)
+        self._buffer.clear()
+        return directory
+
+    def on_step_end(self, record):
+        self.snapshot(record["name"], record["outcome"])
+        if record["outcome"] != "passed":
+            self.dump(f"step {record['name']} {record['outcome']}")
+
+    def close(self):
+        self._buffer.clear()
@@ -0,0 +1,211 @@
+"""
+Network capture to HAR files from Chrome's performance log (CDP Network domain).
+Entries are written to reports/har/<server>/<test>_<timestamp>.har as soon as each request
+finishes, so memory only holds the requests still in flight.
+"""
+import json
+import os
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit, urlunsplit, quote
+
+from config.config import REPORTS_DIR
+from utils.logger import logger
+
+# Above this many requests in flight the oldest ones are written out as incomplete
+MAX_PENDING_REQUESTS = 2000
+# Replaces every query-string value: SSO/OAuth redirects carry codes, state and tokens in the URL
+REDACTED = "REDACTED"
+
+
+def redact_url(url):
+    """
+    Replaces the query-string values of a URL and drops its fragment, keeping the parameter names.
+
+    Returns:
+        tuple: (redacted URL, HAR queryString list with the redacted values)
+    """
+    if not url:
+        return url, []
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https", "ws", "wss"):
+        # data:, blob: and the like have no query string to redact
+        return url, []
+    names = [name for name, _ in parse_qsl(parts.query, keep_blank_values=True)]
+    query = "&".join(f"{quote(name, safe='')}={REDACTED}" for name in names)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, "")), \
+        [{"name": name, "value": REDACTED} for name in names]
+
+
+class HarRecorder:
+    """
+    StepTimer listener that streams the browser's network activity into a compact HAR file.
+    Headers and bodies are not stored: they are large and may contain session tokens. For the same
+    reason, query-string values are replaced in the URLs.
+    """
+
+    def __init__(self, driver, server_id, test_name="test"):
+        """
+        Args:
+            driver: Chrome WebDriver created with performance logging enabled
+            server_id (str): Server identifier used to organize the output
+            test_name (str, optional): Test name used in the file name
+        """
+        self.driver = driver
+        self.server_id = server_id
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.har_file = os.path.join(REPORTS_DIR, "har", server_id, f"{test_name}_{timestamp}.har")
+        self._pending = {}
+        self._pages = {}
+        # Wall clock minus CDP monotonic timestamp, to date requests sent without a wallTime
+        self._wall_offset = None
+        self._entry_count = 0
+        os.makedirs(os.path.dirname(self.har_file), exist_ok=True)
+        self._file = open(self.har_file, "w")
+        self._file.write('{"log": {"version": "1.2", '
+                         '"creator": {"name": "rockwell-automation-Stability-test", "version": "1.0"}, '
+                         '"entries": [\n')
+        # Discard events left in the log by a previous test on a pooled browser
+        self.driver.get_log("performance")
+
+    def drain(self, step):
+        """
+        Reads the pending performance log events and writes every finished request.
+
+        Args:
+            step (str): Step the requests are attributed to (HAR pageref)
+        """
+        if step not in self._pages:
+            self._pages[step] = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        for log_entry in self.driver.get_log("performance"):
+            message = json.loads(log_entry["message"])["message"]
+            self._handle(message.get("method"), message.get("params", {}), step)
+        self._file.flush()
+
+    def on_navigation(self, url, step):
+        self.drain(step)
+
+    def on_step_end(self, record):
+        self.drain(record["name"])
+
+    def close(self):
+        """
+        Drains the last events, writes the requests still in flight as incomplete and closes the file.
+        """
+        if self._file is None:
+            return
+        try:
+            self.drain("teardown")
+        except Exception as e:
+            logger.warning("Could not read the last performance log events: %s", e)
+        stuck = list(self._pending.values())
+        for request in stuck:
+            self._write_entry(request, incomplete=True)
+        self._pending.clear()
+
+        pages = [{"id": step, "title": step, "startedDateTime": started, "pageTimings": {}}
+                 for step, started in self._pages.items()]
+        self._file.write('\n], "pages": ' + json.dumps(pages) + "}}\n")
+        self._file.close()
+        self._file = None
+        logger.info("HAR saved: %s (%s requests, %s still in flight)", self.har_file, self._entry_count, len(stuck))
+
+    def _handle(self, method, params, step):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            redirect_response = params.get("redirectResponse")
+            if redirect_response and request_id in self._pending:
+                # Same requestId is reused for each hop of a redirect chain
+                previous = self._pending.pop(request_id)
+                previous["response"] = redirect_response
+                previous["end"] = params.get("timestamp")
+                previous["redirect_url"] = params.get("request", {}).get("url")
+                self._write_entry(previous)
+            self._pending[request_id] = {
+                "step": step,
+                "request": params.get("request", {}),
+                "type": params.get("type"),
+                "start": params.get("timestamp"),
+                "wall_time": params.get("wallTime"),
+            }
+            if self._wall_offset is None and params.get("wallTime") and params.get("timestamp") is not None:
+                self._wall_offset = params["wallTime"] - params["timestamp"]
+            if len(self._pending) > MAX_PENDING_REQUESTS:
+                oldest_id = next(iter(self._pending))
+                self._write_entry(self._pending.pop(oldest_id), incomplete=True)
+        elif method == "Network.responseReceived" and request_id in self._pending:
+            self._pending[request_id]["response"] = params.get("response", {})
+        elif method == "Network.loadingFinished" and request_id in self._pending:
+            request = self._pending.pop(request_id)
+            request["end"] = params.get("timestamp")
+            request["size"] = params.get("encodedDataLength")
+            self._write_entry(request)
+        elif method == "Network.loadingFailed" and request_id in self._pending:
+            request = self._pending.pop(request_id)
+            request["end"] = params.get("timestamp")
+            request["error"] = params.get("errorText") or ("canceled" if params.get("canceled") else "failed")
+            self._write_entry(request)
+
+    def _write_entry(self, request, incomplete=False):
+        response = request.get("response") or {}
+        timing = response.get("timing") or {}
+        start, end = request.get("start"), request.get("end")
+        total = round((end - start) * 1000, 1) if start is not None and end is not None else -1
+
+        def phase(begin_key, end_key):
+            begin, finish = timing.get(begin_key, -1), timing.get(end_key, -1)
+            return round(finish - begin, 1) if begin >= 0 and finish >= 0 else -1
+
+        wait = phase("sendEnd", "receiveHeadersEnd")
+        receive = -1
+        if timing and end is not None:
+            receive = round((end - timing["requestTime"]) * 1000 - timing.get("receiveHeadersEnd", 0), 1)
+
+        wall_time = request.get("wall_time")
+        if not wall_time and start is not None and self._wall_offset is not None:
+            wall_time = start + self._wall_offset
+        if wall_time:
+            started = datetime.fromtimestamp(wall_time, timezone.utc).isoformat(timespec="milliseconds")
+        else:
+            # startedDateTime is required in HAR 1.2: fall back to the start of the step
+            started = self._pages[request["step"]]
+        url, query_string = redact_url(request["request"].get("url"))
+        entry = {
+            "pageref": request["step"],
+            "startedDateTime": started,
+            "time": total,
+            "request": {
+                "method": request["request"].get("method"),
+                "url": url,
+                "httpVersion": response.get("protocol", ""),
+                "headers": [], "queryString": query_string, "cookies": [], "headersSize": -1, "bodySize": -1,
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": [], "cookies": [],
+                "content": {"size": request.get("size") or 0, "mimeType": response.get("mimeType", "")},
+                "redirectURL": redact_url(request.get("redirect_url"))[0] or "", "headersSize": -1, "bodySize": request.get("size") or -1,
+            },
+            "cache": {},
+            "timings": {
+                "blocked": -1,
+                "dns": phase("dnsStart", "dnsEnd"),
+                "connect": phase("connectStart", "connectEnd"),
+                "ssl": phase("sslStart", "sslEnd"),
+                # send, wait and receive cannot be -1 in HAR 1.2
+                "send": max(0, phase("sendStart", "sendEnd")),
+                "wait": max(0, wait),
+                "receive": max(0, receive),
+            },
+            "serverIPAddress": response.get("remoteIPAddress", ""),
+            "_resourceType": request.get("type"),
+        }
+        if request.get("error"):
+            entry["_error"] = request["error"]
+        if incomplete:
+            entry["_incomplete"] = True
+
+        separator = ",\n" if self._entry_count else ""
+        self._file.write(separator + json.dumps(entry))
+        self._entry_count += 1
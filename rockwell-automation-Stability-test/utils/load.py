@@ -0,0 +1,239 @@
+"""
+Load mode: K virtual users running LoginPage.complete_test at the same time against one server.
+Each virtual user is a thread with its own browser and its own account. Users start evenly spread
+over the ramp-up, then all of them keep running the flow until the hold ends. Every iteration is
+tagged with the number of users active when it started, so step latency and error rate can be
+compared across concurrency levels. Iterations are appended to
+reports/load/load_<server>_<timestamp>.jsonl.
+"""
+import csv
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from config.config import REPORTS_DIR, LOAD_THINK_TIME
+from pages.login_page import LoginPage
+from utils.logger import logger, setup_logger, get_server_id
+from utils.step_timer import StepTimer
+from utils.timing_store import percentile
+
+
+def load_credentials(path):
+    """
+    Reads the account pool: one "email,password" per line; blank lines and # comments are ignored.
+
+    Returns:
+        list: (email, password) tuples
+    """
+    with open(path, newline="") as credentials_file:
+        rows = [row for row in csv.reader(credentials_file) if row and not row[0].strip().startswith("#")]
+    return [(row[0].strip(), row[1].strip()) for row in rows if len(row) >= 2]
+
+
+def standin_credentials(count):
+    """
+    Accounts for the local stand-in, which accepts any email and password.
+    """
+    return [(f"vuser{number:02d}@standin.local", "standin") for number in range(1, count + 1)]
+
+
+def _stats(durations, iterations, errors):
+    return {
+        "n": iterations, "errors": errors,
+        "error_rate": round(errors / iterations, 3) if iterations else None,
+        "p50": round(percentile(durations, 50), 2) if durations else None,
+        "p95": round(percentile(durations, 95), 2) if durations else None,
+    }
+
+
+class LoadStats:
+    """
+    Flow and step latency and errors per concurrency level. Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._levels = defaultdict(lambda: {"durations": [], "iterations": 0, "errors": 0,
+                                            "steps": defaultdict(lambda: {"durations": [], "n": 0, "errors": 0})})
+
+    def add(self, level, passed, duration, step_records):
+        """
+        Adds one iteration.
+
+        Args:
+            level (int): Virtual users active when the iteration started
+            passed (bool): Whether the flow completed
+            duration (float): Wall time of the flow in seconds
+            step_records (list): StepTimer step records of the iteration
+        """
+        with self._lock:
+            entry = self._levels[level]
+            entry["iterations"] += 1
+            if passed:
+                entry["durations"].append(duration)
+            else:
+                entry["errors"] += 1
+            for record in step_records:
+                step = entry["steps"][record["name"]]
+                step["n"] += 1
+                if record["outcome"] == "passed":
+                    step["durations"].append(record["duration"])
+                else:
+                    step["errors"] += 1
+
+    def summary(self):
+        """
+        Returns one dict per concurrency level (lowest first) with the flow and per-step
+        n, errors, error_rate, p50 and p95 (seconds).
+        """
+        with self._lock:
+            return [{
+                "users": level,
+                "flow": _stats(entry["durations"], entry["iterations"], entry["errors"]),
+                "steps": {name: _stats(step["durations"], step["n"], step["errors"])
+                          for name, step in sorted(entry["steps"].items())},
+            } for level, entry in sorted(self._levels.items())]
+
+
+class LoadRunner:
+    """
+    Ramps up virtual users against one server, holds the load, and collects LoadStats.
+    """
+
+    def __init__(self, pool, base_url, credentials, users, ramp_up=0, hold=0, think_time=LOAD_THINK_TIME,
+                 output_file=None):
+        """
+        Args:
+            pool (DriverPool): Pool with (at least) one browser per virtual user
+            base_url (str): Base URL of the server
+            credentials (list): (email, password) per virtual user; at least `users` of them
+            users (int): Number of concurrent virtual users
+            ramp_up (float, optional): Seconds over which the users are started
+            hold (float, optional): Seconds all users keep running after the ramp-up; every user
+                runs at least one iteration
+            think_time (float, optional): Pause of each user between two iterations
+            output_file (str, optional): JSONL file of the iterations
+        """
+        if len(credentials) < users:
+            raise ValueError(f"{users} virtual users need {users} accounts, only {len(credentials)} available")
+        self.pool = pool
+        self.base_url = base_url
+        self.server_id = get_server_id(base_url)
+        self.credentials = credentials[:users]
+        self.users = users
+        self.ramp_up = ramp_up
+        self.hold = hold
+        self.think_time = think_time
+        self.output_file = output_file or os.path.join(
+            REPORTS_DIR, "load", f"load_{self.server_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        self.stats = LoadStats()
+        # Users that stopped because they could not get a browser
+        self.stopped_users = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._stop_at = None
+
+    def run(self):
+        """
+        Runs the ramp-up and hold phases and waits for the last iterations to finish.
+
+        Returns:
+            LoadStats: Results per concurrency level
+        """
+        setup_logger(self.server_id)
+        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+        self._file = open(self.output_file, "a")
+        started = time.monotonic()
+        self._stop_at = started + self.ramp_up + self.hold
+        logger.info("👥 Load on %s: %s users, %.0fs ramp-up, %.0fs hold -> %s", self.server_id, self.users,
+                    self.ramp_up, self.hold, self.output_file)
+        threads = []
+        try:
+            for number, (email, password) in enumerate(self.credentials, start=1):
+                # Users join evenly spread over the ramp-up; the first one starts right away
+                time.sleep(max(0.0, started + self.ramp_up * (number - 1) / self.users - time.monotonic()))
+                thread = threading.Thread(target=self._user, args=(number, email, password),
+                                          name=f"vuser{number:02d}", daemon=True)
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            # Users stop after their current iteration, so every started iteration is recorded
+            logger.warning("Load interrupted: waiting for %s users to finish their iteration", self._active)
+            self._stop_at = time.monotonic()
+            for thread in threads:
+                thread.join()
+        finally:
+            self._file.close()
+        logger.info("👥 Load finished in %.0fs", time.monotonic() - started)
+        return self.stats
+
+    def _user(self, number, email, password):
+        with self._lock:
+            self._active += 1
+        logger.info("👤 vuser%02d joined (%s active)", number, self._active)
+        try:
+            while True:
+                self._iterate(number, email, password)
+                if time.monotonic() + self.think_time >= self._stop_at:
+                    break
+                time.sleep(self.think_time)
+        except Exception as e:
+            # Not a result of the server under test: the user stops instead of counting errors
+            logger.error("❌ vuser%02d stopped, no browser available: %s", number, e)
+            with self._lock:
+                self.stopped_users += 1
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _iterate(self, number, email, password):
+        # Browser launch is not part of the flow's latency; a launch error ends the user (see _user)
+        driver = self.pool.acquire()
+        timer = None
+        passed, error, step_records = False, None, []
+        started_at, level = datetime.now(), self._active
+        started = time.perf_counter()
+        try:
+            timer = StepTimer.for_driver(driver, self.base_url)
+            driver.get(self.base_url)
+            timer.navigated(self.base_url)
+            LoginPage(driver, self.base_url).complete_test(email, password)
+            passed = True
+        except Exception as e:
+            message = str(e).strip().splitlines()
+            error = f"{type(e).__name__}: {message[0] if message else ''}"[:300]
+            logger.error("❌ vuser%02d failed on %s: %s", number, self.server_id, error)
+        finally:
+            if timer is not None:
+                step_records = [record for record in timer.records if record["kind"] == "step"]
+                StepTimer.release(driver)
+            self.pool.release(driver, failed=not passed)
+        duration = time.perf_counter() - started
+        self.stats.add(level, passed, duration, step_records)
+        entry = {
+            "user": number, "users_active": level, "started_at": started_at.isoformat(timespec="seconds"),
+            "outcome": "passed" if passed else "failed", "duration": round(duration, 2), "error": error,
+            "steps": {record["name"]: {"duration": round(record["duration"], 2), "outcome": record["outcome"]}
+                      for record in step_records},
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+        logger.info("👥 vuser%02d @ %s users: %s in %.1fs", number, level, entry["outcome"], duration)
+
+
+def write_summary(stats, output_file):
+    """
+    Writes the per-level summary next to the iterations file and returns its path.
+    """
+    path = re.sub(r"\.jsonl$", "", output_file) + "_summary.json"
+    with open(path, "w") as summary_file:
+        json.dump(stats.summary(), summary_file, indent=2)
+    return path
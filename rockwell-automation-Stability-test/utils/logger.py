@@ -1,76 +1,289 @@
-"""
-Configuración del sistema de logging para el framework.
-Proporciona funciones para registrar información, advertencias y errores.
-"""
-import re
-import os
-import logging
-from datetime import datetime
-from config.config import REPORTS_DIR
-
-def setup_logger(url_identifier=None):
-    """
-    Configura y retorna un logger para el framework.
-    
-    Args:
-        url_identifier (str, optional): Identificador de la URL para organizar logs
-        
-    Returns:
-        Logger: Instancia configurada del logger
-    """
-    # Crear directorio de logs si no existe
-    log_dir = os.path.join(REPORTS_DIR, "logs")
-    
-    # Si tenemos un identificador de URL, crear subdirectorio específico
-    if url_identifier:
-        # Extraer solo el nombre del servidor si es una URL completa
-        if "//" in url_identifier:
-            server_match = re.search(r'ftdspprod\d{3}', url_identifier)
-            url_identifier = server_match.group(0) if server_match else url_identifier
-        
-        log_dir = os.path.join(log_dir, url_identifier)
-    
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Formato del nombre del archivo de log con fecha y hora
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"test_run_{timestamp}.log")
-    
-    # Configurar el logger
-    logger = logging.getLogger("selenium_framework")
-    
-    # Establecer el nivel de logging a DEBUG para más detalle
-    logger.setLevel(logging.DEBUG)
-    
-    # Evitar duplicación de handlers
-    if logger.handlers:
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-    
-    # Handler para escribir en archivo (nivel DEBUG)
-    file_handler = logging.FileHandler(log_file)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(name)s - %(message)s", 
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(file_formatter)
-    file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
-    
-    # Handler para escribir en consola (nivel INFO o DEBUG)
-    console_handler = logging.StreamHandler()
-    console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
-    console_handler.setFormatter(console_formatter)
-    
-    # Establecer nivel DEBUG en la consola para mostrar todos los pasos
-    console_handler.setLevel(logging.DEBUG)
-    
-    logger.addHandler(console_handler)
-    
-    # Mensaje inicial
-    logger.info(f"=== Iniciando sesión de pruebas para {url_identifier if url_identifier else 'servidor predeterminado'} ===")
-    
-    return logger
-
-# Instancia global del logger
-logger = setup_logger()
\ No newline at end of file
+"""
+Configuración del sistema de logging para el framework.
+Proporciona funciones para registrar información, advertencias y errores.
+En modo asíncrono (LOG_ASYNC, por defecto) el hilo del test solo encola los registros;
+el formateo y la escritura a disco/consola se hacen en un hilo de fondo (QueueListener).
+"""
+import atexit
+import contextvars
+import glob
+import gzip
+import json
+import queue
+import re
+import os
+import shutil
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime
+from config.config import (REPORTS_DIR, LOG_ASYNC, LOG_CONSOLE_LEVEL, LOG_JSON, LOG_JSON_MAX_BYTES,
+                           LOG_JSON_BACKUPS)
+
+# Estado del logger: servidor y fichero actuales, y el listener del modo asíncrono
+_current_identifier = None
+_listener = None
+_output_handlers = []
+_console_level = LOG_CONSOLE_LEVEL
+# Paso en curso del test (lo fija StepTimer); se añade a cada evento del log estructurado
+current_step = contextvars.ContextVar("log_step", default=None)
+# Servidor en curso cuando un mismo log cubre varios servidores (modo soak); si no, el del fichero de log
+current_server = contextvars.ContextVar("log_server", default=None)
+# Campos estructurados que se copian al JSONL cuando se pasan en extra={...}
+EVENT_FIELDS = ("event", "action", "locator", "elapsed", "outcome")
+
+def get_server_id(url):
+    """
+    Obtiene el identificador del servidor (ftdspprod001, ...) a partir de una URL.
+
+    Args:
+        url (str): URL completa del servidor
+
+    Returns:
+        str: Identificador del servidor, o el host saneado si no es un ftdspprod
+    """
+    server_match = re.search(r'ftdspprod\d{3}', url)
+    if server_match:
+        return server_match.group(0)
+    host = url.split("//")[-1].split("/")[0]
+    return re.sub(r'[^A-Za-z0-9_-]', '_', host) or "unknown_server"
+
+# Tipos de argumento que no pueden cambiar entre el registro y la escritura del mensaje
+_IMMUTABLE_ARGS = (str, bytes, int, float, bool, type(None))
+
+
+def _is_immutable(value):
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE_ARGS)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que no formatea en el hilo que registra: el mensaje (%-style) se
+    compone en el hilo del listener, al escribirlo.
+    Solo se resuelve antes lo que no puede esperar: la traza de una excepción (exc_info
+    mantiene vivos los frames del test) y los mensajes con argumentos mutables (dict, list,
+    objetos), que podrían cambiar antes de escribirse.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        if record.args and not _is_immutable(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Añade el servidor y el paso actuales a cada registro, en el hilo que registra.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "server"):
+            record.server = current_server.get() or _current_identifier or "unknown_server"
+        if not hasattr(record, "step"):
+            record.step = current_step.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada registro como un objeto JSON por línea:
+    ts, level, server, step, message y los campos de EVENT_FIELDS presentes.
+    """
+
+    def format(self, record):
+        event = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "server": getattr(record, "server", None),
+            "step": getattr(record, "step", None),
+            "message": record.getMessage(),
+        }
+        for field in EVENT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                event[field] = value
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Ya formateada en el hilo que registró (modo asíncrono)
+            event["exception"] = record.exc_text
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+class GzipRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que comprime con gzip cada segmento rotado (events.jsonl.1.gz, ...).
+    """
+
+    def __init__(self, filename, max_bytes, backup_count):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source, dest):
+        with open(source, "rb") as plain, gzip.open(dest, "wb") as compressed:
+            shutil.copyfileobj(plain, compressed)
+        os.remove(source)
+
+
+def iter_log_events(path):
+    """
+    Lee un log estructurado y sus segmentos rotados (.N.gz), del más antiguo al más reciente.
+
+    Args:
+        path (str): Ruta del fichero events_<timestamp>.jsonl
+
+    Yields:
+        dict: Un evento por línea
+    """
+    rotated = sorted(glob.glob(f"{glob.escape(path)}.*.gz"),
+                     key=lambda name: int(name[len(path) + 1:-3]), reverse=True)
+    for segment in rotated + [path]:
+        if not os.path.exists(segment):
+            continue
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, "rt", encoding="utf-8") as events:
+            for line in events:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def setup_logger(url_identifier=None):
+    """
+    Configura y retorna un logger para el framework.
+    Las llamadas sucesivas para el mismo servidor reutilizan su fichero de log.
+    
+    Args:
+        url_identifier (str, optional): Identificador de la URL para organizar logs
+        
+    Returns:
+        Logger: Instancia configurada del logger
+    """
+    global _current_identifier, _listener, _output_handlers
+
+    # Extraer solo el nombre del servidor si es una URL completa
+    if url_identifier and "//" in url_identifier:
+        url_identifier = get_server_id(url_identifier)
+
+    logger = logging.getLogger("selenium_framework")
+    if logger.handlers and url_identifier == _current_identifier:
+        return logger
+
+    # Crear directorio de logs si no existe
+    log_dir = os.path.join(REPORTS_DIR, "logs")
+    
+    # Si tenemos un identificador de URL, crear subdirectorio específico
+    if url_identifier:
+        log_dir = os.path.join(log_dir, url_identifier)
+    
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # Formato del nombre del archivo de log con fecha y hora
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = os.path.join(log_dir, f"test_run_{timestamp}.log")
+    
+    # Establecer el nivel de logging a DEBUG para más detalle
+    logger.setLevel(logging.DEBUG)
+    if not any(isinstance(log_filter, _ContextFilter) for log_filter in logger.filters):
+        logger.addFilter(_ContextFilter())
+    
+    # Evitar duplicación de handlers (y cerrar los del servidor anterior)
+    _stop_listener()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    for handler in _output_handlers:
+        handler.close()
+    
+    # Handler para escribir en archivo (nivel DEBUG)
+    file_handler = logging.FileHandler(log_file)
+    file_formatter = logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(name)s - %(message)s", 
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    file_handler.setFormatter(file_formatter)
+    file_handler.setLevel(logging.DEBUG)
+    
+    # Handler para escribir en consola (nivel configurable con LOG_CONSOLE_LEVEL, DEBUG por defecto)
+    console_handler = logging.StreamHandler()
+    console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
+    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(_console_level)
+    
+    _output_handlers = [file_handler, console_handler]
+    if LOG_JSON:
+        # Log estructurado (un JSON por evento) con rotación por tamaño y segmentos comprimidos
+        json_handler = GzipRotatingFileHandler(os.path.join(log_dir, f"events_{timestamp}.jsonl"),
+                                               LOG_JSON_MAX_BYTES, LOG_JSON_BACKUPS)
+        json_handler.setFormatter(JsonFormatter())
+        json_handler.setLevel(logging.DEBUG)
+        _output_handlers.append(json_handler)
+    if LOG_ASYNC:
+        # El test solo encola; el listener formatea y escribe en segundo plano
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(_DeferredQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *_output_handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in _output_handlers:
+            logger.addHandler(handler)
+    _current_identifier = url_identifier
+    
+    # Mensaje inicial
+    logger.info("=== Iniciando sesión de pruebas para %s ===",
+                url_identifier if url_identifier else "servidor predeterminado")
+    
+    return logger
+
+
+def set_console_level(level):
+    """
+    Cambia el nivel de detalle de la consola (el fichero sigue registrando DEBUG).
+
+    Args:
+        level (str | int): Nivel de logging, p. ej. "INFO" o logging.WARNING
+    """
+    global _console_level
+    _console_level = level.upper() if isinstance(level, str) else level
+    for handler in _output_handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setLevel(_console_level)
+
+
+def get_output_handlers():
+    """
+    Devuelve los handlers que escriben realmente (fichero y consola), también en modo asíncrono.
+    """
+    return list(_output_handlers)
+
+
+def flush_logs():
+    """
+    Espera a que el listener haya escrito todos los registros encolados.
+    """
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
+    for handler in _output_handlers:
+        handler.flush()
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Vaciar la cola antes de salir para no perder los últimos registros
+atexit.register(_stop_listener)
+
+# Instancia global del logger
+logger = setup_logger()
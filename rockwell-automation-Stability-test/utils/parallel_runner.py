@@ -0,0 +1,182 @@
+"""
+Parallel fleet runner for the stability test.
+Runs one pytest worker process per selected server, bounded by a CPU/RAM budget.
+"""
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from config.config import BASE_URLS, BROWSER_CPU_COST, BROWSER_MEMORY_MB, REPORTS_DIR
+from utils.logger import get_server_id
+
+
+@dataclass
+class WorkerResult:
+    """
+    Outcome of one worker process (one server).
+    """
+    url_index: int
+    url: str
+    returncode: int
+    duration: float
+    output_file: str
+
+    @property
+    def passed(self) -> bool:
+        return self.returncode == 0
+
+
+def parse_url_indexes(spec: str, total: int = len(BASE_URLS)) -> List[int]:
+    """
+    Parses a 1-based URL index specification such as "3", "1-5" or "1-5,9,12".
+
+    Args:
+        spec (str): Index specification given on the command line
+        total (int, optional): Number of available URLs
+
+    Returns:
+        list: Unique 1-based indexes in the order they were given
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    indexes = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+            if start > end:
+                raise ValueError(f"Invalid range '{part}': start is greater than end.")
+            candidates = range(start, end + 1)
+        else:
+            candidates = [int(part)]
+
+        for index in candidates:
+            if not 1 <= index <= total:
+                raise ValueError(f"Index {index} out of range. Must be between 1 and {total}.")
+            if index not in indexes:
+                indexes.append(index)
+
+    if not indexes:
+        raise ValueError(f"No URL index found in '{spec}'.")
+    return indexes
+
+
+def _available_memory_mb() -> Optional[float]:
+    """
+    Returns the memory currently available to new processes, in MB, if it can be determined.
+    """
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def max_workers_for_budget(requested: int, cpu_per_browser=BROWSER_CPU_COST,
+                           memory_per_browser_mb=BROWSER_MEMORY_MB) -> int:
+    """
+    Caps the requested number of workers so that all browsers fit in the host CPU/RAM budget.
+
+    Args:
+        requested (int): Number of workers asked for on the command line
+        cpu_per_browser (float, optional): CPUs reserved for each browser
+        memory_per_browser_mb (int, optional): RAM reserved for each browser, in MB
+
+    Returns:
+        int: Number of workers to use (at least 1)
+    """
+    limit = requested
+    cpus = os.cpu_count() or 1
+    if cpu_per_browser > 0:
+        limit = min(limit, int(cpus // cpu_per_browser))
+    available_mb = _available_memory_mb()
+    if available_mb is not None and memory_per_browser_mb > 0:
+        limit = min(limit, int(available_mb // memory_per_browser_mb))
+    return max(1, limit)
+
+
+def strip_options(args: List[str], options_with_value: List[str], flags: List[str]) -> List[str]:
+    """
+    Removes the given options from a pytest argument list.
+    Handles both "--opt value" and "--opt=value" forms.
+    """
+    cleaned = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        name = arg.split("=", 1)[0]
+        if name in flags:
+            continue
+        if name in options_with_value:
+            skip_next = "=" not in arg
+            continue
+        cleaned.append(arg)
+    return cleaned
+
+
+def run_worker(url_index: int, pytest_args: List[str]) -> WorkerResult:
+    """
+    Runs pytest for a single server in its own process.
+    The worker gets its own browser and its own log file, and its console output
+    is written to reports/logs/<server>/worker_<timestamp>.out.
+
+    Args:
+        url_index (int): 1-based index of the server in BASE_URLS
+        pytest_args (list): Arguments forwarded to the worker's pytest
+
+    Returns:
+        WorkerResult: Outcome of the worker
+    """
+    url = BASE_URLS[url_index - 1]
+    log_dir = os.path.join(REPORTS_DIR, "logs", get_server_id(url))
+    os.makedirs(log_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = os.path.join(log_dir, f"worker_{timestamp}.out")
+
+    command = [sys.executable, "-m", "pytest", *pytest_args, f"--url-index={url_index}", "--workers=1"]
+    start_time = time.time()
+    with open(output_file, "w") as output:
+        returncode = subprocess.call(command, stdout=output, stderr=subprocess.STDOUT)
+    return WorkerResult(url_index, url, returncode, time.time() - start_time, output_file)
+
+
+def run_parallel(url_indexes: List[int], workers: int, pytest_args: List[str],
+                 on_result: Optional[Callable[[WorkerResult], None]] = None) -> List[WorkerResult]:
+    """
+    Runs one worker per server with at most `workers` browsers alive at the same time.
+
+    Args:
+        url_indexes (list): 1-based indexes of the servers to test
+        workers (int): Maximum number of concurrent worker processes
+        pytest_args (list): Arguments forwarded to each worker's pytest
+        on_result (callable, optional): Called with each WorkerResult as soon as it finishes
+
+    Returns:
+        list: WorkerResult for every server, in the order of `url_indexes`
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_worker, index, pytest_args): index for index in url_indexes}
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.url_index] = result
+            if on_result:
+                on_result(result)
+    return [results[index] for index in url_indexes]
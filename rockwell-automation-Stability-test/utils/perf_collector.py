@@ -0,0 +1,142 @@
+"""
+Browser performance collector.
+After each navigation and at each step boundary, pulls Navigation/Resource/Paint timing,
+long tasks, LCP and CLS from the page and writes them per server and step
+(reports/logs/<server>/perf_<timestamp>.jsonl).
+"""
+import json
+import os
+from datetime import datetime
+
+from config.config import REPORTS_DIR
+from utils.logger import logger
+
+# Installs the observers once per document and returns everything new since the previous call.
+# LCP, layout shifts and long tasks are only exposed through PerformanceObserver, so they are
+# buffered in window.__raPerf and flushed with takeRecords() on every collection.
+COLLECT_PERF_JS = """
+var state = window.__raPerf;
+if (!state) {
+    state = window.__raPerf = {lcp: null, cls: 0, longtasks: [], resourceCursor: 0,
+                               navigationReported: false, observers: []};
+    var observe = function (type, handler) {
+        try {
+            var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handler); });
+            observer.observe({type: type, buffered: true});
+            state.observers.push({observer: observer, handler: handler});
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', function (entry) {
+        state.lcp = {startTime: entry.startTime, size: entry.size, url: entry.url || null,
+                     element: entry.element ? entry.element.tagName.toLowerCase() : null};
+    });
+    observe('layout-shift', function (entry) {
+        if (!entry.hadRecentInput) state.cls += entry.value;
+    });
+    observe('longtask', function (entry) {
+        state.longtasks.push({startTime: Math.round(entry.startTime), duration: Math.round(entry.duration)});
+    });
+    if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+}
+state.observers.forEach(function (item) { item.observer.takeRecords().forEach(item.handler); });
+
+var round = function (value) { return Math.round(value * 10) / 10; };
+var phase = function (end, start) { return end > 0 && start > 0 ? round(end - start) : null; };
+
+var navigation = null;
+var navEntry = performance.getEntriesByType('navigation')[0];
+if (navEntry && !state.navigationReported) {
+    state.navigationReported = true;
+    navigation = {
+        url: navEntry.name, type: navEntry.type, redirectCount: navEntry.redirectCount,
+        redirect: phase(navEntry.redirectEnd, navEntry.redirectStart), fetchStart: round(navEntry.fetchStart),
+        dns: phase(navEntry.domainLookupEnd, navEntry.domainLookupStart),
+        connect: phase(navEntry.connectEnd, navEntry.connectStart),
+        ttfb: phase(navEntry.responseStart, navEntry.requestStart),
+        responseEnd: round(navEntry.responseEnd), domInteractive: round(navEntry.domInteractive),
+        domContentLoaded: round(navEntry.domContentLoadedEventEnd), load: round(navEntry.loadEventEnd),
+        transferSize: navEntry.transferSize, status: navEntry.responseStatus
+    };
+}
+
+var resources = performance.getEntriesByType('resource');
+var newResources = resources.slice(state.resourceCursor).map(function (entry) {
+    return {
+        url: entry.name, type: entry.initiatorType, start: round(entry.startTime), duration: round(entry.duration),
+        dns: phase(entry.domainLookupEnd, entry.domainLookupStart),
+        connect: phase(entry.connectEnd, entry.connectStart),
+        ttfb: phase(entry.responseStart, entry.requestStart),
+        transferSize: entry.transferSize, bodySize: entry.encodedBodySize, status: entry.responseStatus
+    };
+});
+state.resourceCursor = resources.length;
+
+var paint = {};
+performance.getEntriesByType('paint').forEach(function (entry) { paint[entry.name] = round(entry.startTime); });
+
+return {
+    url: location.href, navigation: navigation, paint: paint, lcp: state.lcp,
+    cls: Math.round(state.cls * 10000) / 10000, longtasks: state.longtasks.splice(0), resources: newResources
+};
+"""
+
+
+class PerformanceCollector:
+    """
+    StepTimer listener that stores browser performance entries per server and step.
+    """
+
+    def __init__(self, driver, server_id):
+        """
+        Args:
+            driver: WebDriver instance to collect from
+            server_id (str): Server identifier used to organize the output
+        """
+        self.driver = driver
+        self.server_id = server_id
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_file = os.path.join(REPORTS_DIR, "logs", server_id, f"perf_{timestamp}.jsonl")
+        self._file = None
+
+    def collect(self, step, reason):
+        """
+        Pulls the new performance entries from the page and appends them to the output file.
+
+        Args:
+            step (str): Step the entries belong to
+            reason (str): "navigation" or "step_end"
+
+        Returns:
+            dict: Collected entries
+        """
+        entries = self.driver.execute_script(COLLECT_PERF_JS)
+        record = {
+            "server": self.server_id,
+            "step": step,
+            "reason": reason,
+            "collected_at": datetime.now().isoformat(timespec="milliseconds"),
+            **entries,
+        }
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+            self._file = open(self.output_file, "a")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+        navigation = entries.get("navigation") or {}
+        lcp = entries.get("lcp") or {}
+        logger.debug("Perf [%s/%s]: %s resources, TTFB %s ms, LCP %s ms, CLS %s, %s long tasks",
+                     step, reason, len(entries.get("resources", [])), navigation.get("ttfb"),
+                     lcp.get("startTime"), entries.get("cls"), len(entries.get("longtasks", [])))
+        return record
+
+    def on_navigation(self, url, step):
+        self.collect(step, "navigation")
+
+    def on_step_end(self, record):
+        self.collect(record["name"], "step_end")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,249 @@
+"""
+Pre-flight health probe of the servers under test.
+Before any browser is launched, every selected server is checked concurrently (asyncio): DNS
+resolution, TCP connect, TLS handshake, time to first byte of GET <base URL> and HTTP status.
+Results are cached for PREFLIGHT_CACHE_TTL seconds in reports/preflight.json, so parallel workers
+and back-to-back runs do not probe the same server again. Check servers by hand with:
+
+    python -m utils.preflight --all-urls
+    python -m utils.preflight http://127.0.0.1:8765/
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import ssl
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from config.config import BASE_URLS, PREFLIGHT_TIMEOUT, PREFLIGHT_CACHE_TTL, PREFLIGHT_CACHE
+from utils.logger import logger, get_server_id
+
+# Phases timed by the probe, in order; each one is recorded as a preflight_<phase> step
+PHASES = ("dns", "connect", "tls", "ttfb")
+
+
+@dataclass
+class ProbeResult:
+    """
+    Outcome of probing one server. Durations are in seconds, None if the phase was not reached.
+    """
+    url: str
+    server: str
+    checked_at: float
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+    # Last phase started; tells where an unreachable server failed
+    phase: str = "dns"
+    cached: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 500
+
+    def describe(self) -> str:
+        timings = ", ".join(f"{phase} {getattr(self, phase) * 1000:.0f}ms"
+                            for phase in PHASES if getattr(self, phase) is not None)
+        outcome = f"HTTP {self.status}" if self.error is None else self.error
+        return f"{outcome} ({timings})" if timings else outcome
+
+    def step_records(self) -> List[dict]:
+        """
+        Returns the probe phases as StepTimer step records, for the timing store.
+        """
+        started = datetime.fromtimestamp(self.checked_at)
+        run_id = f"preflight_{self.server}_{started.strftime('%Y%m%d_%H%M%S')}"
+        return [{
+            "kind": "step", "run_id": run_id, "server": self.server, "name": f"preflight_{phase}",
+            "start": started.isoformat(timespec="milliseconds"), "duration": getattr(self, phase),
+            "outcome": "passed" if self.healthy else "failed",
+        } for phase in PHASES if getattr(self, phase) is not None]
+
+
+async def probe(url: str, timeout: float = PREFLIGHT_TIMEOUT) -> ProbeResult:
+    """
+    Probes one server. Never raises: failures are reported in ProbeResult.error.
+
+    Args:
+        url (str): Base URL of the server
+        timeout (float, optional): Seconds allowed for the whole probe
+
+    Returns:
+        ProbeResult: Timings and status of the server
+    """
+    result = ProbeResult(url=url, server=get_server_id(url), checked_at=time.time())
+    try:
+        await asyncio.wait_for(_measure(result, timeout), timeout)
+    except asyncio.TimeoutError:
+        result.error = f"{result.phase}: timed out after {timeout:g}s"
+    except socket.gaierror as e:
+        result.error = f"dns: {e}"
+    except (OSError, ValueError) as e:
+        # ssl.SSLError and connection errors are OSErrors; ValueError covers malformed responses
+        result.error = f"{result.phase}: {e}"
+    return result
+
+
+async def _measure(result, timeout):
+    parts = urlsplit(result.url)
+    secure = parts.scheme == "https"
+    host, port = parts.hostname, parts.port or (443 if secure else 80)
+    loop = asyncio.get_running_loop()
+
+    started = time.perf_counter()
+    addresses = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    result.dns = time.perf_counter() - started
+
+    result.phase = "connect"
+    started = time.perf_counter()
+    sock = await _connect(loop, addresses, timeout)
+    result.connect = time.perf_counter() - started
+    try:
+        result.phase = "tls" if secure else "ttfb"
+        started = time.perf_counter()
+        reader, writer = await asyncio.open_connection(
+            sock=sock, ssl=ssl.create_default_context() if secure else None,
+            server_hostname=host if secure else None)
+    except BaseException:
+        sock.close()
+        raise
+    if secure:
+        result.tls = time.perf_counter() - started
+        result.phase = "ttfb"
+    try:
+        path = parts.path or "/"
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nUser-Agent: stability-test-preflight\r\n"
+                     f"Accept: text/html\r\nConnection: close\r\n\r\n".encode())
+        started = time.perf_counter()
+        await writer.drain()
+        status_line = await reader.readline()
+        result.ttfb = time.perf_counter() - started
+        fields = status_line.decode("latin-1").split()
+        if len(fields) < 2 or not fields[0].startswith("HTTP/"):
+            raise ValueError(f"unexpected response {status_line[:60]!r}")
+        result.status = int(fields[1])
+        result.phase = "done"
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            # The server may drop the connection first (Connection: close); the transport is closed anyway
+            pass
+
+
+async def _connect(loop, addresses, timeout):
+    """
+    Connects to the resolved addresses in turn (like the browser does), so an unreachable first
+    address (e.g. IPv6 without a route) does not make a healthy server look down.
+    """
+    addresses = list(dict.fromkeys(addresses))
+    # A silently dropped address must not use up the whole probe timeout
+    attempt_timeout = timeout / len(addresses)
+    error = None
+    for family, socket_type, proto, _, address in addresses:
+        sock = socket.socket(family, socket_type, proto)
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, address), attempt_timeout)
+            return sock
+        except (OSError, asyncio.TimeoutError) as e:
+            sock.close()
+            error = e if isinstance(e, OSError) else OSError(f"{address[0]} timed out after {attempt_timeout:g}s")
+        except BaseException:
+            sock.close()
+            raise
+    raise error
+
+
+async def probe_all(urls: List[str], timeout: float = PREFLIGHT_TIMEOUT) -> List[ProbeResult]:
+    """
+    Probes several servers concurrently.
+    """
+    return list(await asyncio.gather(*(probe(url, timeout) for url in urls)))
+
+
+def _load_cache(path, ttl):
+    try:
+        with open(path) as cache_file:
+            entries = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    results = {}
+    for url, entry in entries.items() if isinstance(entries, dict) else ():
+        # A stale or hand-edited entry is a cache miss, not an error
+        try:
+            if now - entry["checked_at"] < ttl:
+                results[url] = ProbeResult(**{**entry, "cached": True})
+        except (TypeError, KeyError):
+            continue
+    return results
+
+
+def _save_cache(path, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Parallel workers may write at the same time: each writes its own file and replaces atomically
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as cache_file:
+        json.dump({url: asdict(result) for url, result in results.items()}, cache_file, indent=2)
+    os.replace(temporary, path)
+
+
+def check_servers(urls: List[str], timeout: float = PREFLIGHT_TIMEOUT, ttl: float = PREFLIGHT_CACHE_TTL,
+                  cache_path: str = PREFLIGHT_CACHE) -> Dict[str, ProbeResult]:
+    """
+    Returns the health of each server, probing only those without a recent cached result.
+
+    Args:
+        urls (list): Base URLs to check
+        timeout (float, optional): Seconds allowed per probe
+        ttl (float, optional): Seconds a cached result is reused; 0 always probes
+        cache_path (str, optional): JSON file shared by runs and workers
+
+    Returns:
+        dict: ProbeResult per URL (cached results have cached=True)
+    """
+    cache = _load_cache(cache_path, ttl) if ttl > 0 else {}
+    pending = [url for url in dict.fromkeys(urls) if url not in cache]
+    if pending:
+        for result in asyncio.run(probe_all(pending, timeout)):
+            cache[result.url] = result
+        _save_cache(cache_path, cache)
+    results = {url: cache[url] for url in urls}
+    for result in results.values():
+        log = logger.info if result.healthy else logger.warning
+        log("%s Pre-flight %s: %s%s", "✅" if result.healthy else "⛔", result.server, result.describe(),
+            " [cached]" if result.cached else "")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-flight health probe of the servers under test.")
+    parser.add_argument("urls", nargs="*", help="Base URLs to probe (default: the first BASE_URLS entry)")
+    parser.add_argument("--all-urls", action="store_true", help="Probe every BASE_URLS entry")
+    parser.add_argument("--timeout", type=float, default=PREFLIGHT_TIMEOUT, help="Seconds per probe")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore recent cached results")
+    args = parser.parse_args(argv)
+
+    urls = BASE_URLS if args.all_urls else args.urls or BASE_URLS[:1]
+    results = check_servers(urls, args.timeout, ttl=0 if args.no_cache else PREFLIGHT_CACHE_TTL)
+    print(f"{'server':<22} {'status':>6} " + " ".join(f"{phase:>8}" for phase in PHASES) + "  error")
+    for result in results.values():
+        timings = " ".join(f"{getattr(result, phase) * 1000:>6.0f}ms" if getattr(result, phase) is not None
+                           else f"{'-':>8}" for phase in PHASES)
+        print(f"{result.server:<22} {result.status or '-':>6} {timings}  {result.error or ''}")
+    return 0 if all(result.healthy for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Latency regression detection.
+Compares the step durations of a run with a rolling baseline of earlier passed runs of the
+same server and step (from the timing store) using the median and the median absolute
+deviation, so a step that usually takes 8s and now takes 60s is flagged even if it passes.
+"""
+import statistics
+from dataclasses import dataclass
+from typing import List
+
+from config.config import (REGRESSION_BASELINE_RUNS, REGRESSION_MIN_SAMPLES, REGRESSION_WARN_SCORE,
+                           REGRESSION_FAIL_SCORE, REGRESSION_MIN_RATIO, REGRESSION_MIN_DELTA)
+
+# Scales the MAD so it estimates the standard deviation of normally distributed data
+MAD_SCALE = 1.4826
+
+
+@dataclass
+class Regression:
+    """
+    Step of a run that is significantly slower than its baseline.
+    """
+    server: str
+    step: str
+    run_id: str
+    duration: float
+    baseline_median: float
+    baseline_samples: int
+    score: float
+    severity: str
+
+    @property
+    def ratio(self) -> float:
+        return self.duration / self.baseline_median if self.baseline_median else float("inf")
+
+    def __str__(self) -> str:
+        return (f"{self.server} {self.step}: {self.duration:.1f}s vs baseline median "
+                f"{self.baseline_median:.1f}s ({self.ratio:.1f}x, score {self.score:.1f}, "
+                f"n={self.baseline_samples}) [{self.severity}]")
+
+
+def robust_score(value: float, baseline: List[float]) -> float:
+    """
+    Number of (MAD-based) standard deviations `value` lies above the baseline median.
+
+    Args:
+        value (float): Duration to score
+        baseline (list): Earlier durations of the same step
+
+    Returns:
+        float: Robust z-score; infinite if the baseline has no spread and value is above it
+    """
+    median = statistics.median(baseline)
+    mad = statistics.median(abs(sample - median) for sample in baseline) * MAD_SCALE
+    if mad == 0:
+        return float("inf") if value > median else 0.0
+    return (value - median) / mad
+
+
+def check_run(store, run_id: str, baseline_runs: int = REGRESSION_BASELINE_RUNS,
+              min_samples: int = REGRESSION_MIN_SAMPLES, warn_score: float = REGRESSION_WARN_SCORE,
+              fail_score: float = REGRESSION_FAIL_SCORE, min_ratio: float = REGRESSION_MIN_RATIO,
+              min_delta: float = REGRESSION_MIN_DELTA) -> List[Regression]:
+    """
+    Checks every passed step of a run against the last passed runs of the same server and step.
+    A step is flagged only when it is both statistically unusual (score) and materially slower
+    (ratio and absolute delta), so noisy steps of a few hundred milliseconds are not reported.
+
+    Args:
+        store (TimingStore): Historical timing store the run was written to
+        run_id (str): Run to check
+        baseline_runs (int, optional): Number of earlier runs in the rolling baseline
+        min_samples (int, optional): Minimum baseline size to judge a step
+        warn_score (float, optional): Score from which a slowdown is a warning
+        fail_score (float, optional): Score from which a slowdown is a failure
+        min_ratio (float, optional): Minimum duration / baseline median to flag
+        min_delta (float, optional): Minimum seconds above the baseline median to flag
+
+    Returns:
+        list: Regression for each flagged step, in execution order
+    """
+    regressions = []
+    for server, step, started_at, duration, outcome, _ in store.durations(run_id=run_id):
+        # Failed steps stop early or time out; their duration says nothing about latency
+        if outcome != "passed":
+            continue
+        history = store.durations(server=server, step=step, exclude_run=run_id,
+                                  outcome="passed", until=started_at)
+        baseline = [row[3] for row in history[-baseline_runs:]]
+        if len(baseline) < min_samples:
+            continue
+
+        median = statistics.median(baseline)
+        score = robust_score(duration, baseline)
+        if score < warn_score or duration < median * min_ratio or duration - median < min_delta:
+            continue
+        severity = "fail" if score >= fail_score else "warn"
+        regressions.append(Regression(server, step, run_id, duration, median, len(baseline),
+                                      score, severity))
+    return regressions
@@ -0,0 +1,127 @@
+"""
+Low frame rate screencast of a test run (Chrome only).
+Streams frames with the CDP Page.startScreencast command over the driver's DevTools connection
+(driver.bidi_connection) on a background thread, so the test thread never waits for them. Frames
+arrive already JPEG-encoded from the browser and are stored as they come in
+reports/screencast/<server>/<test>_<timestamp>.zip, with frames.jsonl mapping each frame to its
+time and test step. Turn an archive into a video with e.g.:
+
+    unzip run.zip -d run && ffmpeg -framerate 2 -pattern_type glob -i 'run/*.jpg' run.mp4
+"""
+import base64
+import json
+import os
+import re
+import threading
+import time
+import zipfile
+from datetime import datetime
+
+import trio
+
+from config.config import REPORTS_DIR, SCREENCAST_FPS, SCREENCAST_QUALITY, SCREENCAST_MAX_WIDTH
+from utils.logger import logger
+
+# How often the recording thread checks whether it has been asked to stop
+STOP_POLL_INTERVAL = 0.2
+
+
+class ScreencastRecorder:
+    """
+    StepTimer listener that records the browser's screen into a frame archive while the test runs.
+    """
+
+    def __init__(self, driver, timer, test_name="test", fps=SCREENCAST_FPS, quality=SCREENCAST_QUALITY,
+                 max_width=SCREENCAST_MAX_WIDTH):
+        """
+        Args:
+            driver: Chrome WebDriver instance
+            timer (StepTimer): Timer of the driver, used to tag frames with the current step
+            test_name (str, optional): Test name used in the file name
+            fps (float, optional): Maximum frames per second
+            quality (int, optional): JPEG quality of the frames (0-100)
+            max_width (int, optional): Maximum frame width in pixels
+        """
+        self.driver = driver
+        self.timer = timer
+        self.fps = fps
+        self.quality = quality
+        self.max_width = max_width
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_name = re.sub(r'[<>:"/\\|?*\[\]]', '_', test_name)
+        self.output_file = os.path.join(REPORTS_DIR, "screencast", timer.server_id, f"{safe_name}_{timestamp}.zip")
+        self.frame_count = 0
+        self._archive = None
+        self._index = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"screencast_{timer.server_id}", daemon=True)
+
+    def start(self):
+        """
+        Starts recording in the background.
+
+        Returns:
+            ScreencastRecorder: Returns self for method chaining
+        """
+        self._thread.start()
+        return self
+
+    def close(self):
+        """
+        Stops the screencast and finishes the archive.
+        """
+        self._stop.set()
+        self._thread.join(timeout=10)
+        if self._thread.is_alive():
+            logger.warning("Screencast of %s did not stop in time", self.timer.server_id)
+            return
+        if self._archive:
+            logger.info("🎞️ Screencast: %s frames written to %s", self.frame_count, self.output_file)
+
+    def _run(self):
+        try:
+            trio.run(self._record)
+        except Exception as e:
+            logger.warning("Screencast recording stopped: %s", e)
+        finally:
+            if self._archive:
+                self._archive.writestr("frames.jsonl", "".join(json.dumps(frame) + "\n" for frame in self._index))
+                self._archive.close()
+
+    async def _record(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            frames = session.listen(devtools.page.ScreencastFrame)
+            await session.execute(devtools.page.start_screencast(
+                format_="jpeg", quality=self.quality, max_width=self.max_width, max_height=self.max_width))
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(self._wait_for_stop, nursery.cancel_scope)
+                async for frame in frames:
+                    received = time.monotonic()
+                    self._write_frame(frame)
+                    # Chrome sends the next frame only after the ack: delaying it caps the frame rate
+                    await trio.sleep(max(0.0, 1 / self.fps - (time.monotonic() - received)))
+                    await session.execute(devtools.page.screencast_frame_ack(frame.session_id))
+            with trio.move_on_after(2):
+                await session.execute(devtools.page.stop_screencast())
+
+    async def _wait_for_stop(self, cancel_scope):
+        while not self._stop.is_set():
+            await trio.sleep(STOP_POLL_INTERVAL)
+        cancel_scope.cancel()
+
+    def _write_frame(self, frame):
+        if self._archive is None:
+            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+            # Frames are already JPEG: storing them avoids spending CPU on recompression
+            self._archive = zipfile.ZipFile(self.output_file, "w", compression=zipfile.ZIP_STORED)
+        self.frame_count += 1
+        name = f"{self.frame_count:06d}.jpg"
+        self._archive.writestr(name, base64.b64decode(frame.data))
+        timestamp = frame.metadata.timestamp
+        self._index.append({
+            "frame": name,
+            "time": datetime.fromtimestamp(float(timestamp) if timestamp else time.time())
+                            .isoformat(timespec="milliseconds"),
+            "step": self.timer.current_step,
+        })
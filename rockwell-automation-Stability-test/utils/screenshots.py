@@ -0,0 +1,144 @@
+"""
+Asynchronous screenshot pipeline.
+The test thread only asks the browser for the PNG bytes; encoding and disk writes run on a
+small thread pool. Screenshots can optionally be downscaled (SCREENSHOT_SCALE) and re-encoded
+as WebP or JPEG (SCREENSHOT_FORMAT) to shrink the artifacts uploaded by CI. Re-encoding needs
+Pillow; without it screenshots are written as the original PNG.
+"""
+import atexit
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import (SCREENSHOT_ASYNC, SCREENSHOT_FORMAT, SCREENSHOT_SCALE, SCREENSHOT_QUALITY,
+                           SCREENSHOT_WORKERS)
+from utils.logger import logger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: only needed to downscale or re-encode
+    Image = None
+
+EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+
+class ScreenshotWriter:
+    """
+    Encodes and writes screenshots in background threads.
+    """
+
+    def __init__(self, image_format=SCREENSHOT_FORMAT, scale=SCREENSHOT_SCALE, quality=SCREENSHOT_QUALITY,
+                 workers=SCREENSHOT_WORKERS, asynchronous=SCREENSHOT_ASYNC):
+        """
+        Args:
+            image_format (str, optional): "png", "jpeg" or "webp"
+            scale (float, optional): Resize factor (1.0 keeps the browser resolution)
+            quality (int, optional): JPEG/WebP quality (1-100)
+            workers (int, optional): Writer threads
+            asynchronous (bool, optional): False writes on the calling thread
+        """
+        image_format = image_format.lower().replace("jpg", "jpeg")
+        if image_format not in EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format '{image_format}'. Use one of {sorted(EXTENSIONS)}.")
+        if Image is None and (image_format != "png" or scale != 1):
+            logger.warning("Pillow is not installed: screenshots are written as PNG at full size")
+            image_format, scale = "png", 1
+        self.image_format = image_format
+        self.scale = scale
+        self.quality = quality
+        self.workers = workers
+        self.asynchronous = asynchronous
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    @property
+    def extension(self):
+        return EXTENSIONS[self.image_format]
+
+    def capture(self, driver, directory, name):
+        """
+        Grabs the screenshot as bytes and queues it to be written as <directory>/<name><extension>.
+
+        Args:
+            driver: WebDriver instance
+            directory (str): Output directory (created if needed)
+            name (str): File name without extension
+
+        Returns:
+            str: Path the screenshot will be written to
+        """
+        return self.save(driver.get_screenshot_as_png(), directory, name)
+
+    def save(self, png, directory, name):
+        """
+        Queues PNG bytes already taken from the browser to be written as <directory>/<name><extension>.
+
+        Args:
+            png (bytes): Screenshot as returned by get_screenshot_as_png()
+            directory (str): Output directory (created if needed)
+            name (str): File name without extension
+
+        Returns:
+            str: Path the screenshot will be written to
+        """
+        filename = os.path.join(directory, name + self.extension)
+        if not self.asynchronous:
+            self._write(png, filename)
+            return filename
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="screenshot_writer")
+            future = self._executor.submit(self._write, png, filename)
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return filename
+
+    def flush(self):
+        """
+        Waits until every queued screenshot has been written.
+        """
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.exception()
+
+    def close(self):
+        """
+        Writes the queued screenshots and stops the writer threads.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        if future.exception():
+            logger.error("Failed to write screenshot: %s", future.exception())
+
+    def _write(self, png, filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        data = self._encode(png) if self.image_format != "png" or self.scale != 1 else png
+        with open(filename, "wb") as screenshot_file:
+            screenshot_file.write(data)
+
+    def _encode(self, png):
+        image = Image.open(io.BytesIO(png))
+        if self.scale != 1:
+            size = (max(1, round(image.width * self.scale)), max(1, round(image.height * self.scale)))
+            image = image.resize(size, Image.LANCZOS)
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        options = {"optimize": True} if self.image_format == "png" else {"quality": self.quality}
+        image.save(output, format=self.image_format.upper(), **options)
+        return output.getvalue()
+
+
+screenshot_writer = ScreenshotWriter()
+atexit.register(screenshot_writer.close)
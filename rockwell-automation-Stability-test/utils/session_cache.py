@@ -0,0 +1,203 @@
+"""
+Authenticated session cache.
+After a successful login, the browser's cookies (every domain, including the SSO provider's) and
+the app's localStorage/sessionStorage are saved per server and user with an expiry. A later run
+restores them into a fresh browser so LoginPage can skip the SSO login after one quick check.
+Files contain session tokens: they live in SESSION_CACHE_DIR (.sessions/, outside the reports
+uploaded by CI) and are readable only by the current user.
+"""
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+from config.config import REUSE_SESSION, SESSION_CACHE_DIR, SESSION_TTL_HOURS
+from utils.logger import logger, get_server_id
+
+# Fields of CDP Network.Cookie accepted back by Network.setCookies
+COOKIE_PARAMS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority",
+                 "sourceScheme", "sourcePort")
+
+STORAGE_DUMP_JS = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) items[storage.key(i)] = storage.getItem(storage.key(i));
+    return items;
+}
+return {origin: location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Runs before the app's own scripts on every new document of the saved origin
+STORAGE_RESTORE_JS = """
+(function (origin, local, session) {
+    if (location.origin !== origin) return;
+    Object.keys(local).forEach(function (key) { localStorage.setItem(key, local[key]); });
+    Object.keys(session).forEach(function (key) { sessionStorage.setItem(key, session[key]); });
+})(%s, %s, %s);
+"""
+
+_reuse_session = REUSE_SESSION
+
+
+def set_session_reuse(enabled):
+    """
+    Enables or disables the session cache used by default by LoginPage (--reuse-session).
+    """
+    global _reuse_session
+    _reuse_session = enabled
+
+
+def default_session_cache():
+    """
+    Returns a SessionCache if session reuse is enabled, None otherwise.
+    """
+    return SessionCache() if _reuse_session else None
+
+
+class SessionCache:
+    """
+    Saved authenticated sessions, one JSON file per server and user.
+    """
+
+    def __init__(self, directory=SESSION_CACHE_DIR, ttl_hours=SESSION_TTL_HOURS):
+        """
+        Args:
+            directory (str, optional): Directory of the session files
+            ttl_hours (float, optional): Hours a saved session is trusted
+        """
+        self.directory = directory
+        self.ttl = ttl_hours * 3600
+
+    def path(self, base_url, user):
+        # The user name is hashed: file names end up in logs
+        user_hash = hashlib.sha256(user.strip().lower().encode()).hexdigest()[:12]
+        return os.path.join(self.directory, f"{get_server_id(base_url)}_{user_hash}.json")
+
+    def save(self, driver, base_url, user):
+        """
+        Saves the cookies and web storage of the logged-in browser.
+
+        Args:
+            driver: WebDriver on a page of the app, after login
+            base_url (str): Base URL of the server
+            user (str): User the session belongs to
+        """
+        storage = driver.execute_script(STORAGE_DUMP_JS)
+        entry = {
+            "server": get_server_id(base_url),
+            "saved_at": time.time(),
+            "expires_at": time.time() + self.ttl,
+            "origin": storage["origin"],
+            "cookies": self._get_cookies(driver),
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+        }
+        path = self.path(base_url, user)
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as session_file:
+            json.dump(entry, session_file)
+        os.replace(temporary, path)
+        logger.info("💾 Session saved for %s (%s cookies, valid %.0fh)", entry["server"], len(entry["cookies"]),
+                    self.ttl / 3600)
+
+    def load(self, base_url, user):
+        """
+        Returns the saved session of a server and user, or None if there is none or it expired.
+        """
+        path = self.path(base_url, user)
+        try:
+            with open(path) as session_file:
+                entry = json.load(session_file)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            logger.info("Saved session for %s expired", entry.get("server"))
+            self.invalidate(base_url, user)
+            return None
+        return entry
+
+    def invalidate(self, base_url, user):
+        try:
+            os.remove(self.path(base_url, user))
+        except FileNotFoundError:
+            pass
+
+    def discard(self, driver, base_url, user):
+        """
+        Deletes a saved session that is no longer valid and removes what restore() put in the browser:
+        the cookies of every domain and the web storage of the saved origin, so the login starts clean.
+        The storage script added by restore() is already removed once the first document has loaded.
+
+        Args:
+            driver: WebDriver the session was restored into
+            base_url (str): Base URL of the server
+            user (str): User the session belongs to
+        """
+        entry = self.load(base_url, user) or {}
+        self.invalidate(base_url, user)
+        # sessionStorage belongs to the tab: only the open document can clear it
+        driver.execute_script("try { sessionStorage.clear(); } catch (e) {}")
+        if hasattr(driver, "execute_cdp_cmd"):
+            base = urlsplit(entry.get("origin") or base_url)
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": f"{base.scheme}://{base.netloc}", "storageTypes": "all"})
+            # Network.setCookies wrote cookies for the SSO provider too, not only for the current domain
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.execute_script("try { localStorage.clear(); } catch (e) {}")
+            driver.delete_all_cookies()
+
+    def restore(self, driver, base_url, user, navigate):
+        """
+        Puts a saved session into a fresh browser and opens the app.
+
+        Args:
+            driver: WebDriver without a session for this server
+            base_url (str): Base URL of the server
+            user (str): User the session belongs to
+            navigate (callable): Opens the base URL (e.g. BasePage.open)
+
+        Returns:
+            bool: False if there was no valid saved session
+        """
+        entry = self.load(base_url, user)
+        if entry is None:
+            return False
+        args = [json.dumps(entry["origin"]), json.dumps(entry["local_storage"]), json.dumps(entry["session_storage"])]
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": entry["cookies"]})
+            script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                            {"source": STORAGE_RESTORE_JS % tuple(args)})
+            try:
+                navigate()
+            finally:
+                # Only the first document gets the saved storage; later ones keep what the app writes (and
+                # discard() can clear it for good)
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                       {"identifier": script["identifier"]})
+        else:
+            # Without CDP cookies can only be set for the current domain, and storage after the page loads
+            navigate()
+            domain = urlsplit(driver.current_url).hostname or ""
+            for cookie in entry["cookies"]:
+                if domain.endswith(cookie["domain"].lstrip(".")):
+                    driver.add_cookie({key: cookie[key] for key in ("name", "value", "path", "secure", "httpOnly")
+                                       if key in cookie})
+            driver.execute_script(STORAGE_RESTORE_JS % tuple(args))
+            navigate()
+        logger.info("🔑 Session restored for %s (saved %.1fh ago)", entry["server"],
+                    (time.time() - entry["saved_at"]) / 3600)
+        return True
+
+    @staticmethod
+    def _get_cookies(driver):
+        if hasattr(driver, "execute_cdp_cmd"):
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            return [{key: cookie[key] for key in COOKIE_PARAMS
+                     if key in cookie and not (key == "expires" and cookie.get("session"))}
+                    for cookie in cookies]
+        return [{"name": cookie["name"], "value": cookie["value"], "domain": cookie.get("domain", ""),
+                 "path": cookie.get("path", "/"), "secure": cookie.get("secure", False),
+                 "httpOnly": cookie.get("httpOnly", False)} for cookie in driver.get_cookies()]
@@ -0,0 +1,278 @@
+"""
+Soak mode: runs LoginPage.complete_test over and over against the selected servers.
+Each round runs the flow once per server with a browser from the DriverPool, which reuses it or
+recycles it by its usual policy (after a failure, after max_uses, or if resetting it fails). Only
+fixed-size windows of recent results are kept in memory; every iteration is appended to
+reports/soak/soak_<timestamp>.jsonl with the rolling success rate and latency of its server, and
+the process memory, so a long soak can be followed with tail -f and its trends plotted afterwards.
+"""
+import argparse
+import json
+import os
+import re
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+from config.config import REPORTS_DIR, SOAK_WINDOW, SOAK_MIN_SUCCESS_RATE
+from pages.login_page import LoginPage
+from utils.flight_recorder import FlightRecorder
+from utils.logger import logger, setup_logger, get_server_id, current_server
+from utils.preflight import check_servers
+from utils.step_timer import StepTimer
+from utils.timing_store import TimingStoreRecorder, percentile
+
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value):
+    """
+    Converts a duration such as "90", "30s", "15m", "8h" or "2d" into seconds.
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd]?)", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid duration '{value}'. Use e.g. 90s, 15m, 8h or 2d.")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+def _rss_mb():
+    # Resident memory of this process, to check that it stays flat over the soak
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _window_stats(outcomes, durations):
+    return {
+        "n": len(outcomes),
+        "success_rate": round(sum(outcomes) / len(outcomes), 3) if outcomes else None,
+        "p50": round(percentile(durations, 50), 2) if durations else None,
+        "p95": round(percentile(durations, 95), 2) if durations else None,
+    }
+
+
+class ServerTrend:
+    """
+    Rolling success rate and latency of one server over the last `window` iterations.
+    The first full window is kept as the baseline the latest window is compared with.
+    """
+
+    def __init__(self, server, window=SOAK_WINDOW):
+        self.server = server
+        self.window = window
+        self.iterations = 0
+        self.failures = 0
+        self.first_window = None
+        self.first_steps = None
+        self._outcomes = deque(maxlen=window)
+        # Durations of passed iterations only: failures end at arbitrary points or timeouts
+        self._durations = deque(maxlen=window)
+        self._steps = defaultdict(lambda: deque(maxlen=window))
+
+    @property
+    def success_rate(self):
+        return 1 - self.failures / self.iterations if self.iterations else None
+
+    def add(self, passed, duration, steps):
+        """
+        Adds one iteration.
+
+        Args:
+            passed (bool): Whether the flow completed
+            duration (float): Wall time of the iteration in seconds
+            steps (dict): Duration of each completed step
+        """
+        self.iterations += 1
+        self._outcomes.append(passed)
+        if passed:
+            self._durations.append(duration)
+            for name, step_duration in steps.items():
+                self._steps[name].append(step_duration)
+        else:
+            self.failures += 1
+        if self.first_window is None and self.iterations >= self.window:
+            self.first_window = self.rolling()
+            self.first_steps = self.step_medians()
+
+    def rolling(self):
+        """
+        Returns n, success_rate, p50 and p95 (seconds) of the current window.
+        """
+        return _window_stats(self._outcomes, self._durations)
+
+    def step_medians(self):
+        return {name: round(percentile(values, 50), 2) for name, values in sorted(self._steps.items()) if values}
+
+    def summary(self):
+        """
+        Returns the totals, the first and the latest window, and the step medians of both.
+        """
+        return {
+            "server": self.server, "iterations": self.iterations, "failures": self.failures,
+            "success_rate": round(self.success_rate, 3) if self.iterations else None,
+            "first_window": self.first_window, "last_window": self.rolling(),
+            "first_steps": self.first_steps, "last_steps": self.step_medians(),
+        }
+
+
+class SoakRunner:
+    """
+    Runs the flow in rounds (one iteration per server) until the iteration count or the time budget
+    is reached, whichever comes first.
+    """
+
+    def __init__(self, pool, urls, username, password, iterations=None, duration=None, interval=0,
+                 window=SOAK_WINDOW, store=None, preflight="fail", flight_recorder=False, output_file=None):
+        """
+        Args:
+            pool (DriverPool): Pool the browsers are borrowed from and recycled by
+            urls (list): Base URLs of the servers
+            username (str): User of the flow
+            password (str): Password of the flow
+            iterations (int, optional): Rounds to run
+            duration (float, optional): Time budget in seconds; no new round starts after it
+            interval (float, optional): Minimum seconds between the starts of two rounds
+            window (int, optional): Iterations per server in the rolling trends
+            store (TimingStore, optional): Historical store the steps are added to
+            preflight (str, optional): "fail" counts an unreachable server as a failed iteration,
+                "skip" leaves it out of the round, "off" does not check
+            flight_recorder (bool, optional): Write the last screenshots of failed iterations
+            output_file (str, optional): JSONL file of the iterations
+        """
+        if not iterations and not duration:
+            raise ValueError("A soak needs a number of iterations, a duration or both")
+        self.pool = pool
+        self.urls = urls
+        self.username = username
+        self.password = password
+        self.iterations = iterations
+        self.duration = duration
+        self.interval = interval
+        self.store = store
+        self.preflight = preflight
+        self.flight_recorder = flight_recorder
+        self.output_file = output_file or os.path.join(
+            REPORTS_DIR, "soak", f"soak_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        self.trends = {url: ServerTrend(get_server_id(url), window) for url in urls}
+        self.rounds = 0
+        self._file = None
+
+    def run(self):
+        """
+        Runs the soak. Ctrl+C stops it after the current iteration and still returns the trends.
+
+        Returns:
+            dict: ServerTrend per URL
+        """
+        # One log for the whole soak: switching loggers per server would open new files on every switch
+        servers = {trend.server for trend in self.trends.values()}
+        setup_logger(servers.pop() if len(servers) == 1 else "soak")
+        started = time.monotonic()
+        deadline = started + self.duration if self.duration else None
+        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+        self._file = open(self.output_file, "a")
+        logger.info("🔁 Soak of %s server(s): %s iterations, %s budget, %ss interval -> %s", len(self.urls),
+                    self.iterations or "unlimited", f"{self.duration:.0f}s" if self.duration else "no time",
+                    self.interval, self.output_file)
+        try:
+            while not (self.iterations and self.rounds >= self.iterations) and \
+                    not (deadline and time.monotonic() >= deadline):
+                round_started = time.monotonic()
+                self.rounds += 1
+                self._run_round()
+                wait = round_started + self.interval - time.monotonic()
+                if deadline:
+                    wait = min(wait, deadline - time.monotonic())
+                if wait > 0:
+                    time.sleep(wait)
+        except KeyboardInterrupt:
+            logger.warning("Soak interrupted after %s rounds", self.rounds)
+        finally:
+            self._file.close()
+        logger.info("🔁 Soak finished: %s rounds in %.0fs", self.rounds, time.monotonic() - started)
+        return self.trends
+
+    def _run_round(self):
+        health = check_servers(self.urls) if self.preflight != "off" else {}
+        for url in self.urls:
+            result = health.get(url)
+            if result is not None and not result.healthy:
+                if self.preflight == "fail":
+                    self._record(url, datetime.now(), False, 0.0, {}, f"unreachable: {result.describe()}")
+                continue
+            self._iterate(url)
+
+    def _iterate(self, url):
+        server = get_server_id(url)
+        # Records of this iteration carry its server in the structured log
+        server_token = current_server.set(server)
+        started_at = datetime.now()
+        started = time.perf_counter()
+        driver = timer = recorder = None
+        passed, error, steps = False, None, {}
+        try:
+            driver = self.pool.acquire()
+            timer = StepTimer.for_driver(driver, url)
+            if self.store is not None:
+                timer.add_listener(TimingStoreRecorder(self.store))
+            if self.flight_recorder:
+                recorder = FlightRecorder(driver, server, f"soak_{self.rounds}")
+                timer.add_listener(recorder)
+            driver.get(url)
+            timer.navigated(url)
+            LoginPage(driver, url).complete_test(self.username, self.password)
+            passed = True
+        except Exception as e:
+            message = str(e).strip().splitlines()
+            error = f"{type(e).__name__}: {message[0] if message else ''}"[:300]
+            logger.error("❌ Soak iteration %s on %s failed: %s", self.rounds, server, error)
+        finally:
+            if recorder is not None and not passed:
+                recorder.dump("soak iteration failed")
+            if timer is not None:
+                steps = {record["name"]: record["duration"] for record in timer.records
+                         if record["kind"] == "step" and record["outcome"] == "passed"}
+                StepTimer.release(driver)
+            if driver is not None:
+                self.pool.release(driver, failed=not passed)
+            current_server.reset(server_token)
+        self._record(url, started_at, passed, time.perf_counter() - started, steps, error)
+
+    def _record(self, url, started_at, passed, duration, steps, error):
+        trend = self.trends[url]
+        trend.add(passed, duration, steps)
+        rolling = trend.rolling()
+        rss = _rss_mb()
+        entry = {
+            "round": self.rounds, "server": trend.server, "started_at": started_at.isoformat(timespec="seconds"),
+            "outcome": "passed" if passed else "failed", "duration": round(duration, 2), "error": error,
+            "steps": {name: round(value, 2) for name, value in steps.items()},
+            "rolling": rolling, "rss_mb": round(rss, 1) if rss else None,
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        logger.info("📈 [%s] round %s %s in %.1fs | last %s: %.0f%% ok, p50 %s, p95 %s | rss %s",
+                    trend.server, self.rounds, entry["outcome"], duration, rolling["n"],
+                    rolling["success_rate"] * 100,
+                    f"{rolling['p50']:.1f}s" if rolling["p50"] is not None else "-",
+                    f"{rolling['p95']:.1f}s" if rolling["p95"] is not None else "-",
+                    f"{rss:.0f} MB" if rss else "-", extra={"server": trend.server})
+
+
+def failing_servers(trends, min_success_rate=SOAK_MIN_SUCCESS_RATE):
+    """
+    Returns the trends of the servers whose success rate over the whole soak is below `min_success_rate`.
+    """
+    return [trend for trend in trends.values() if trend.iterations and trend.success_rate < min_success_rate]
+
+
+def write_summary(trends, output_file):
+    """
+    Writes the per-server summary next to the iterations file and returns its path.
+    """
+    path = re.sub(r"\.jsonl$", "", output_file) + "_summary.json"
+    with open(path, "w") as summary_file:
+        json.dump([trend.summary() for trend in trends.values()], summary_file, indent=2)
+    return path
@@ -0,0 +1,220 @@
+"""
+Per-step timing instrumentation.
+Records wall time, WebDriver command count and outcome of each test step and page action,
+and writes them as JSONL next to the logs (reports/logs/<server>/timings_<timestamp>.jsonl).
+"""
+import functools
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from config.config import REPORTS_DIR
+from utils.logger import logger, get_server_id, current_step
+
+
+class StepTimer:
+    """
+    Times the steps of a test run on one browser.
+    There is one timer per driver; page objects share it through StepTimer.for_driver().
+    """
+
+    _timers = {}
+
+    def __init__(self, driver, base_url=None):
+        """
+        Args:
+            driver: WebDriver instance whose commands are counted
+            base_url (str, optional): Base URL of the server under test
+        """
+        self.driver = driver
+        self.base_url = base_url or ""
+        self.server_id = get_server_id(self.base_url) if self.base_url else "unknown_server"
+        self.run_started = datetime.now()
+        # Identifies this run in the historical timing store
+        self.run_id = f"{self.server_id}_{self.run_started.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.records = []
+        self.command_count = 0
+        self._stack = []
+        self._listeners = []
+        self._file = None
+        self.timings_file = os.path.join(
+            REPORTS_DIR, "logs", self.server_id,
+            f"timings_{self.run_started.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        )
+        self._wrap_driver()
+
+    @classmethod
+    def for_driver(cls, driver, base_url=None):
+        """
+        Returns the timer attached to a driver, creating it on first use.
+
+        Args:
+            driver: WebDriver instance
+            base_url (str, optional): Base URL of the server under test
+
+        Returns:
+            StepTimer: Timer for this driver
+        """
+        timer = cls._timers.get(driver)
+        if timer is None:
+            timer = cls(driver, base_url)
+            cls._timers[driver] = timer
+        return timer
+
+    @classmethod
+    def release(cls, driver):
+        """
+        Closes and detaches the timer of a driver (e.g. before the driver goes back to the pool).
+        """
+        timer = cls._timers.pop(driver, None)
+        if timer:
+            timer.close()
+
+    def add_listener(self, listener):
+        """
+        Registers an object notified at step boundaries and navigations.
+        Listeners may implement on_step_end(record), on_navigation(url, step) and close().
+
+        Args:
+            listener: Collector or recorder to notify
+
+        Returns:
+            StepTimer: Returns self for method chaining
+        """
+        self._listeners.append(listener)
+        return self
+
+    def navigated(self, url):
+        """
+        Notifies the listeners that the browser navigated to a new document.
+
+        Args:
+            url (str): URL that was loaded
+        """
+        self._notify("on_navigation", url, self.current_step or "setup")
+
+    @property
+    def current_step(self):
+        """
+        Name of the innermost step being timed, or None.
+        """
+        steps = [entry["name"] for entry in self._stack if entry["kind"] == "step"]
+        return steps[-1] if steps else None
+
+    @contextmanager
+    def step(self, name, kind="step", target=None):
+        """
+        Times a block of code.
+        Actions nested inside another action are not recorded to avoid counting them twice.
+
+        Args:
+            name (str): Step or action name
+            kind (str, optional): "step" for test steps, "action" for page object actions
+            target (str, optional): Locator or URL the action works on
+        """
+        if kind == "action" and self._stack and self._stack[-1]["kind"] == "action":
+            yield
+            return
+
+        entry = {"name": name, "kind": kind, "parent": self.current_step}
+        self._stack.append(entry)
+        step_token = current_step.set(name) if kind == "step" else None
+        start_commands = self.command_count
+        start_time = time.time()
+        outcome, error = "passed", None
+        try:
+            yield
+        except BaseException as e:
+            message = str(e).strip().splitlines()
+            outcome, error = "failed", f"{type(e).__name__}: {message[0] if message else ''}"
+            raise
+        finally:
+            self._stack.pop()
+            if step_token is not None:
+                current_step.reset(step_token)
+            record = {
+                "server": self.server_id,
+                "run_id": self.run_id,
+                "run_started": self.run_started.isoformat(timespec="seconds"),
+                "kind": kind,
+                "name": name,
+                "parent": entry["parent"],
+                "target": target,
+                "start": datetime.fromtimestamp(start_time).isoformat(timespec="milliseconds"),
+                "duration": round(time.time() - start_time, 3),
+                "commands": self.command_count - start_commands,
+                "outcome": outcome,
+                "error": error,
+            }
+            self._write(record)
+            logger.debug("%s %s: %.3fs, %s commands, %s", kind, name, record["duration"], record["commands"], outcome,
+                         extra={"event": kind, "action": name, "step": name if kind == "step" else entry["parent"],
+                                "locator": target, "elapsed": record["duration"], "outcome": outcome})
+            if kind == "step":
+                self._notify("on_step_end", record)
+
+    def close(self):
+        """
+        Logs a summary of the steps, closes the timings file and stops counting commands.
+        """
+        steps = [record for record in self.records if record["kind"] == "step"]
+        if steps:
+            logger.info("⏱️ Step timings for %s (%s):", self.server_id, self.timings_file)
+            for record in steps:
+                logger.info("   %-28s %8.2fs  %5d cmds  %s",
+                            record["name"], record["duration"], record["commands"], record["outcome"])
+        if self._file:
+            self._file.close()
+            self._file = None
+        self._notify("close")
+        self._unwrap_driver()
+
+    def _notify(self, event, *args):
+        # Instrumentation must never break the test it is observing
+        for listener in self._listeners:
+            handler = getattr(listener, event, None)
+            if handler is None:
+                continue
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.warning("%s.%s failed: %s", type(listener).__name__, event, e)
+
+    def _write(self, record):
+        self.records.append(record)
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.timings_file), exist_ok=True)
+            self._file = open(self.timings_file, "a")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _wrap_driver(self):
+        # Every WebDriver command goes through driver.execute; count them on this instance only
+        original_execute = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.command_count += 1
+            return original_execute(driver_command, params)
+
+        self.driver.execute = counting_execute
+
+    def _unwrap_driver(self):
+        self.driver.__dict__.pop("execute", None)
+
+
+def timed_action(method):
+    """
+    Decorator for page object methods: times the call as an "action" of the current step.
+    The first argument is recorded as the target when it is a locator or a string.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        target = args[0] if args and isinstance(args[0], (tuple, str)) else None
+        if isinstance(target, tuple):
+            target = f"{target[0]}={target[1]}"
+        with self.timer.step(method.__name__, kind="action", target=target):
+            return method(self, *args, **kwargs)
+    return wrapper
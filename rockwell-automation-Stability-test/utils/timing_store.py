@@ -0,0 +1,243 @@
+"""
+Historical store of step durations (SQLite) and percentile reports across runs.
+
+Every test run appends its step timings to reports/timings.sqlite3 (TIMINGS_DB).
+Report p50/p95/p99 per server and step with:
+
+    python -m utils.timing_store report --since 7d
+    python -m utils.timing_store report --server ftdspprod003 --bucket day
+    python -m utils.timing_store import reports/logs/*/timings_*.jsonl
+"""
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from config.config import TIMINGS_DB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS step_timings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    server TEXT NOT NULL,
+    step TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration REAL NOT NULL,
+    commands INTEGER,
+    outcome TEXT NOT NULL,
+    UNIQUE (run_id, step)
+);
+CREATE INDEX IF NOT EXISTS idx_step_timings_lookup ON step_timings (server, step, started_at);
+"""
+
+BUCKET_FORMATS = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+    "week": "%G-W%V",
+}
+
+
+def percentile(values, q):
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Args:
+        values (list): Numbers to summarize (need not be sorted)
+        q (float): Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def parse_since(value):
+    """
+    Converts a relative window such as "24h", "7d" or "2w" into a start datetime.
+    """
+    match = re.fullmatch(r"(\d+)([hdw])", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid window '{value}'. Use e.g. 24h, 7d or 2w.")
+    amount, unit = int(match.group(1)), match.group(2)
+    delta = {"h": timedelta(hours=amount), "d": timedelta(days=amount), "w": timedelta(weeks=amount)}[unit]
+    return datetime.now() - delta
+
+
+class TimingStore:
+    """
+    Embedded store of step durations per run, server and step.
+    Connections are opened per operation so the store can be shared by threads and processes.
+    """
+
+    def __init__(self, path=TIMINGS_DB):
+        """
+        Args:
+            path (str, optional): Path of the SQLite database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # Parallel workers append to the same file: wait for locks instead of failing
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def add_steps(self, records):
+        """
+        Appends step records as produced by StepTimer (records of other kinds are ignored).
+
+        Args:
+            records (list): StepTimer records
+
+        Returns:
+            int: Number of rows inserted
+        """
+        rows = [
+            (record["run_id"], record["server"], record["name"], record["start"],
+             record["duration"], record.get("commands"), record["outcome"])
+            for record in records
+            if record.get("kind") == "step"
+        ]
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO step_timings "
+                "(run_id, server, step, started_at, duration, commands, outcome) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def durations(self, server=None, step=None, since=None, until=None, run_id=None, exclude_run=None,
+                  outcome=None):
+        """
+        Returns (server, step, started_at, duration, outcome, run_id) rows matching the filters,
+        oldest first. `since` and `until` accept datetimes or ISO strings.
+        """
+        query = "SELECT server, step, started_at, duration, outcome, run_id FROM step_timings WHERE 1 = 1"
+        params = []
+        since = since.isoformat() if isinstance(since, datetime) else since
+        until = until.isoformat() if isinstance(until, datetime) else until
+        for column, operator, value in (("server", "=", server), ("step", "=", step),
+                                        ("started_at", ">=", since), ("started_at", "<", until),
+                                        ("run_id", "=", run_id), ("run_id", "!=", exclude_run),
+                                        ("outcome", "=", outcome)):
+            if value is not None:
+                query += f" AND {column} {operator} ?"
+                params.append(value)
+        query += " ORDER BY started_at"
+        with self._connect() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def report(self, server=None, step=None, since=None, bucket=None):
+        """
+        Summarizes durations per server, step and (optionally) time bucket.
+
+        Args:
+            server (str, optional): Only this server
+            step (str, optional): Only this step
+            since (datetime, optional): Only runs started after this moment
+            bucket (str, optional): "hour", "day" or "week" to split the report over time
+
+        Returns:
+            list: One dict per group with count, failures, p50, p95, p99 and max (seconds)
+        """
+        groups = defaultdict(lambda: {"durations": [], "failures": 0})
+        for row_server, row_step, started_at, duration, outcome, _ in self.durations(server, step, since):
+            window = datetime.fromisoformat(started_at).strftime(BUCKET_FORMATS[bucket]) if bucket else "all"
+            group = groups[(row_server, row_step, window)]
+            group["durations"].append(duration)
+            if outcome != "passed":
+                group["failures"] += 1
+
+        summary = []
+        for (row_server, row_step, window), group in sorted(groups.items()):
+            values = group["durations"]
+            summary.append({
+                "server": row_server, "step": row_step, "window": window,
+                "count": len(values), "failures": group["failures"],
+                "p50": round(percentile(values, 50), 3), "p95": round(percentile(values, 95), 3),
+                "p99": round(percentile(values, 99), 3), "max": max(values),
+            })
+        return summary
+
+
+class TimingStoreRecorder:
+    """
+    StepTimer listener that appends each finished step to the timing store.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def on_step_end(self, record):
+        self.store.add_steps([record])
+
+
+def _import_files(store, patterns):
+    inserted = 0
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            with open(path) as timings_file:
+                records = [json.loads(line) for line in timings_file if line.strip()]
+            inserted += store.add_steps([record for record in records if "run_id" in record])
+    return inserted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Step latency history of the stability test.")
+    parser.add_argument("--db", default=TIMINGS_DB, help="SQLite database (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="p50/p95/p99 per server and step")
+    report.add_argument("--server", help="Only this server (e.g. ftdspprod003)")
+    report.add_argument("--step", help="Only this step (e.g. 09_gitlab_and_copilot)")
+    report.add_argument("--since", type=parse_since, help="Time window: 24h, 7d, 2w...")
+    report.add_argument("--bucket", choices=sorted(BUCKET_FORMATS), help="Split the report by hour, day or week")
+    report.add_argument("--csv", action="store_true", help="Write CSV instead of a table")
+
+    importer = commands.add_parser("import", help="Load timings_*.jsonl files (e.g. downloaded CI artifacts)")
+    importer.add_argument("files", nargs="+", help="Files or glob patterns")
+
+    args = parser.parse_args(argv)
+    store = TimingStore(args.db)
+
+    if args.command == "import":
+        print(f"Imported {_import_files(store, args.files)} step timings into {args.db}")
+        return 0
+
+    rows = store.report(args.server, args.step, args.since, args.bucket)
+    columns = ["server", "step", "window", "count", "failures", "p50", "p95", "p99", "max"]
+    if args.csv:
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+        return 0
+
+    if not rows:
+        print("No step timings found.")
+        return 0
+    print(f"{'server':<14} {'step':<24} {'window':<16} {'n':>5} {'fail':>5} "
+          f"{'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for row in rows:
+        print(f"{row['server']:<14} {row['step']:<24} {row['window']:<16} {row['count']:>5} {row['failures']:>5} "
+              f"{row['p50']:>8.1f}s {row['p95']:>8.1f}s {row['p99']:>8.1f}s {row['max']:>8.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
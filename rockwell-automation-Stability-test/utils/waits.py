@@ -1,103 +1,508 @@
-"""
-Utilidades para implementar estrategias de espera personalizadas.
-Permite esperar a que se cumplan condiciones específicas en la página.
-"""
-
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.remote.webdriver import WebDriver
-
-from utils.logger import logger
-from config.config import DEFAULT_TIMEOUT
-
-def wait_for_page_load(driver: WebDriver, timeout=DEFAULT_TIMEOUT):
-    """
-    Espera a que la página termine de cargar (document.readyState === 'complete').
-    
-    Args:
-        driver (WebDriver): Instancia del WebDriver
-        timeout (int, optional): Tiempo máximo de espera en segundos
-    """
-    logger.debug("Esperando a que la página termine de cargar")
-    old_page = driver.find_element_by_tag_name('html')
-    
-    def check_page_loaded(driver):
-        new_page = driver.find_element_by_tag_name('html')
-        return new_page.id != old_page.id
-    
-    try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
-    except TimeoutException:
-        logger.error(f"Página no cargó completamente después de {timeout} segundos")
-        raise
-
-def wait_for_url_contains(driver: WebDriver, partial_url: str, timeout=DEFAULT_TIMEOUT):
-    """
-    Espera a que la URL actual contenga una subcadena específica.
-    
-    Args:
-        driver (WebDriver): Instancia del WebDriver
-        partial_url (str): Subcadena que debe contener la URL
-        timeout (int, optional): Tiempo máximo de espera en segundos
-        
-    Returns:
-        bool: True si la URL contiene la subcadena, False en caso contrario
-    """
-    logger.debug(f"Esperando a que la URL contenga: {partial_url}")
-    try:
-        return WebDriverWait(driver, timeout).until(
-            EC.url_contains(partial_url)
-        )
-    except TimeoutException:
-        logger.warning(f"La URL no contiene '{partial_url}' después de {timeout} segundos")
-        current_url = driver.current_url
-        logger.warning(f"URL actual: {current_url}")
-        return False
-
-def wait_for_text_to_be_present(driver: WebDriver, locator, text: str, timeout=DEFAULT_TIMEOUT):
-    """
-    Espera a que un elemento contenga un texto específico.
-    
-    Args:
-        driver (WebDriver): Instancia del WebDriver
-        locator (tuple): Tuple que contiene el tipo y valor del localizador
-        text (str): Texto que debe contener el elemento
-        timeout (int, optional): Tiempo máximo de espera en segundos
-        
-    Returns:
-        bool: True si el elemento contiene el texto, False en caso contrario
-    """
-    logger.debug(f"Esperando a que el elemento {locator} contenga el texto: {text}")
-    try:
-        return WebDriverWait(driver, timeout).until(
-            EC.text_to_be_present_in_element(locator, text)
-        )
-    except TimeoutException:
-        logger.warning(f"El elemento {locator} no contiene el texto '{text}' después de {timeout} segundos")
-        return False
-
-def wait_for_element_attribute(driver: WebDriver, locator, attribute: str, value: str, timeout=DEFAULT_TIMEOUT):
-    """
-    Espera a que un elemento tenga un atributo con un valor específico.
-    
-    Args:
-        driver (WebDriver): Instancia del WebDriver
-        locator (tuple): Tuple que contiene el tipo y valor del localizador
-        attribute (str): Nombre del atributo
-        value (str): Valor esperado del atributo
-        timeout (int, optional): Tiempo máximo de espera en segundos
-        
-    Returns:
-        bool: True si el elemento tiene el atributo con el valor especificado, False en caso contrario
-    """
-    logger.debug(f"Esperando a que el elemento {locator} tenga el atributo {attribute}={value}")
-    try:
-        return WebDriverWait(driver, timeout).until(
-            EC.text_to_be_present_in_element_attribute(locator, attribute, value)
-        )
-    except TimeoutException:
-        logger.warning(f"El elemento {locator} no tiene el atributo {attribute}={value} después de {timeout} segundos")
-        return False
\ No newline at end of file
+"""
+Utilidades para implementar estrategias de espera personalizadas.
+Permite esperar a que se cumplan condiciones específicas en la página.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Tuple
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, JavascriptException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.logger import logger
+from config.config import (DEFAULT_TIMEOUT, SCRIPT_TIMEOUT, SETTLE_QUIET_WINDOW, SETTLE_TIMEOUT,
+                           SETTLE_MAX_REQUEST_AGE)
+
+# Cada llamada a execute_async_script observa como máximo este tiempo (por debajo de SCRIPT_TIMEOUT)
+OBSERVER_SLICE = max(1, SCRIPT_TIMEOUT - 5)
+# Intervalo entre consultas de query_elements_state (igual que WebDriverWait)
+POLL_FREQUENCY = 0.5
+
+# Condiciones de Selenium equivalentes, usadas si no se puede inyectar el observer
+ELEMENT_STATES = {
+    "present": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
+# Funciones JS compartidas: localizan un elemento como lo haría Selenium y comprueban su estado
+ELEMENT_STATE_JS = """
+function locate(by, value) {
+    var node = null;
+    switch (by) {
+        case 'id': node = document.getElementById(value); break;
+        case 'css selector': node = document.querySelector(value); break;
+        case 'xpath':
+            node = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            break;
+        case 'name': node = document.getElementsByName(value)[0]; break;
+        case 'class name': node = document.getElementsByClassName(value)[0]; break;
+        case 'tag name': node = document.getElementsByTagName(value)[0]; break;
+        case 'link text':
+        case 'partial link text':
+            node = Array.prototype.find.call(document.links, function (link) {
+                var text = link.textContent.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+            break;
+        default: throw new Error('Unsupported locator strategy: ' + by);
+    }
+    return node && node.nodeType === 1 ? node : null;
+}
+
+function hasSize(el) {
+    var rect = el.getBoundingClientRect();
+    if (rect.width > 0 && rect.height > 0) return true;
+    return Array.prototype.some.call(el.children, hasSize);
+}
+
+function isVisible(el) {
+    if (!el.isConnected) return false;
+    var style = getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') return false;
+    for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+        var nodeStyle = node === el ? style : getComputedStyle(node);
+        if (nodeStyle.display === 'none' || parseFloat(nodeStyle.opacity) === 0) return false;
+    }
+    return hasSize(el);
+}
+
+function matches(el, state) {
+    if (state === 'present') return true;
+    if (!isVisible(el)) return false;
+    return state !== 'clickable' || !el.disabled;
+}
+"""
+
+# Localiza los elementos candidatos y comprueba su estado en el navegador; vuelve a comprobar en
+# cada mutación del DOM (agrupadas por requestAnimationFrame) y, como red de seguridad para
+# transiciones CSS o pestañas en segundo plano, cada 250 ms sin salir del navegador.
+# Devuelve [índice, elemento] del primer candidato (por orden) que cumple su estado.
+OBSERVE_ELEMENTS_JS = ELEMENT_STATE_JS + """
+var specs = arguments[0], sliceMs = arguments[1];
+var done = arguments[arguments.length - 1];
+
+var deadline = Date.now() + sliceMs;
+var finished = false, scheduled = false, observer = null, timer = null;
+
+function firstMatch() {
+    for (var i = 0; i < specs.length; i++) {
+        var el = locate(specs[i][0], specs[i][1]);
+        if (el && matches(el, specs[i][2])) return [i, el];
+    }
+    return null;
+}
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(timer);
+    done(result);
+}
+
+function check() {
+    scheduled = false;
+    try {
+        var match = firstMatch();
+        if (match) return finish(match);
+    } catch (e) {
+        return finish({error: String(e && e.message || e)});
+    }
+    if (Date.now() >= deadline) finish(null);
+}
+
+function schedule() {
+    if (!scheduled) {
+        scheduled = true;
+        requestAnimationFrame(check);
+    }
+}
+
+var first = firstMatch();
+if (first) {
+    finish(first);
+} else if (sliceMs <= 0) {
+    finish(null);
+} else {
+    observer = new MutationObserver(schedule);
+    observer.observe(document.documentElement || document,
+                     {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setInterval(check, 250);
+}
+"""
+
+# Evalúa varios localizadores en una sola llamada: devuelve, por cada [by, value, state],
+# el elemento si cumple el estado o null en caso contrario.
+QUERY_ELEMENTS_JS = ELEMENT_STATE_JS + """
+return arguments[0].map(function (spec) {
+    var el = locate(spec[0], spec[1]);
+    return el && matches(el, spec[2]) ? el : null;
+});
+"""
+
+# Instala (una vez por documento) un contador de fetch/XHR pendientes y un MutationObserver,
+# y espera dentro del navegador a que no haya actividad durante quietMs. Solo cuentan nodos y textos
+# nuevos: los spinners y animaciones del IDE cambian atributos (class, style) sin parar.
+SETTLE_JS = """
+var quietMs = arguments[0], sliceMs = arguments[1], maxRequestAgeMs = arguments[2];
+var done = arguments[arguments.length - 1];
+
+var tracker = window.__raSettle;
+if (!tracker) {
+    tracker = window.__raSettle = {pending: {}, nextId: 0, lastActivity: Date.now(), resources: 0};
+    var touch = function () { tracker.lastActivity = Date.now(); };
+    var begin = function () { var id = tracker.nextId++; tracker.pending[id] = Date.now(); touch(); return id; };
+    var end = function (id) { delete tracker.pending[id]; touch(); };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            var id = begin();
+            try {
+                return originalFetch.apply(this, arguments).finally(function () { end(id); });
+            } catch (e) {
+                end(id);
+                throw e;
+            }
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var id = begin();
+        this.addEventListener('loadend', function () { end(id); });
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            end(id);
+            throw e;
+        }
+    };
+    new MutationObserver(touch).observe(document.documentElement || document,
+        {childList: true, subtree: true, characterData: true});
+}
+
+var deadline = Date.now() + sliceMs;
+var timer = setInterval(function () {
+    var now = Date.now();
+    // Requests started before the tracker was installed still show up as new resource entries
+    var resources = performance.getEntriesByType('resource').length;
+    if (resources !== tracker.resources) {
+        tracker.resources = resources;
+        tracker.lastActivity = now;
+    }
+    var busy = Object.keys(tracker.pending).some(function (id) {
+        return now - tracker.pending[id] < maxRequestAgeMs;
+    });
+    if (!busy && now - tracker.lastActivity >= quietMs) {
+        clearInterval(timer);
+        done(true);
+    } else if (now >= deadline) {
+        clearInterval(timer);
+        done(false);
+    }
+}, 100);
+"""
+
+
+def wait_for_page_load(driver: WebDriver, timeout=DEFAULT_TIMEOUT):
+    """
+    Espera a que la página termine de cargar (document.readyState === 'complete').
+    
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        timeout (int, optional): Tiempo máximo de espera en segundos
+    """
+    logger.debug("Esperando a que la página termine de cargar")
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+    except TimeoutException:
+        logger.error(f"Página no cargó completamente después de {timeout} segundos")
+        raise
+
+def wait_for_url_contains(driver: WebDriver, partial_url: str, timeout=DEFAULT_TIMEOUT):
+    """
+    Espera a que la URL actual contenga una subcadena específica.
+    
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        partial_url (str): Subcadena que debe contener la URL
+        timeout (int, optional): Tiempo máximo de espera en segundos
+        
+    Returns:
+        bool: True si la URL contiene la subcadena, False en caso contrario
+    """
+    logger.debug(f"Esperando a que la URL contenga: {partial_url}")
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.url_contains(partial_url)
+        )
+    except TimeoutException:
+        logger.warning(f"La URL no contiene '{partial_url}' después de {timeout} segundos")
+        current_url = driver.current_url
+        logger.warning(f"URL actual: {current_url}")
+        return False
+
+def wait_for_text_to_be_present(driver: WebDriver, locator, text: str, timeout=DEFAULT_TIMEOUT):
+    """
+    Espera a que un elemento contenga un texto específico.
+    
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        locator (tuple): Tuple que contiene el tipo y valor del localizador
+        text (str): Texto que debe contener el elemento
+        timeout (int, optional): Tiempo máximo de espera en segundos
+        
+    Returns:
+        bool: True si el elemento contiene el texto, False en caso contrario
+    """
+    logger.debug(f"Esperando a que el elemento {locator} contenga el texto: {text}")
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.text_to_be_present_in_element(locator, text)
+        )
+    except TimeoutException:
+        logger.warning(f"El elemento {locator} no contiene el texto '{text}' después de {timeout} segundos")
+        return False
+
+def wait_for_element_attribute(driver: WebDriver, locator, attribute: str, value: str, timeout=DEFAULT_TIMEOUT):
+    """
+    Espera a que un elemento tenga un atributo con un valor específico.
+    
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        locator (tuple): Tuple que contiene el tipo y valor del localizador
+        attribute (str): Nombre del atributo
+        value (str): Valor esperado del atributo
+        timeout (int, optional): Tiempo máximo de espera en segundos
+        
+    Returns:
+        bool: True si el elemento tiene el atributo con el valor especificado, False en caso contrario
+    """
+    logger.debug(f"Esperando a que el elemento {locator} tenga el atributo {attribute}={value}")
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.text_to_be_present_in_element_attribute(locator, attribute, value)
+        )
+    except TimeoutException:
+        logger.warning(f"El elemento {locator} no tiene el atributo {attribute}={value} después de {timeout} segundos")
+        return False
+
+
+def wait_for_element_state(driver: WebDriver, locator, state="present", timeout=DEFAULT_TIMEOUT) -> WebElement:
+    """
+    Espera a que un elemento alcance un estado usando un MutationObserver inyectado en la página.
+    Devuelve en cuanto el DOM cambia y el localizador cumple el estado, en lugar de sondear por
+    HTTP cada 500 ms. Si el observer no se puede inyectar, recurre a WebDriverWait.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        locator (tuple): Tuple que contiene el tipo y valor del localizador
+        state (str, optional): "present", "visible" o "clickable"
+        timeout (int, optional): Tiempo máximo de espera en segundos
+
+    Returns:
+        WebElement: Elemento en el estado solicitado
+
+    Raises:
+        TimeoutException: Si el elemento no alcanza el estado en el tiempo especificado
+    """
+    _, element = wait_for_first_element_state(driver, [(locator, state)], timeout)
+    return element
+
+
+def wait_for_first_element_state(driver: WebDriver, candidates, timeout=DEFAULT_TIMEOUT) -> Tuple[int, WebElement]:
+    """
+    Espera a la vez a varios localizadores alternativos y devuelve el primero que alcanza su estado.
+    Permite decidir entre "aparece A o aparece B" sin agotar el timeout de uno antes de probar el otro.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        candidates (list): Lista de (localizador, estado); si varios cumplen a la vez gana el primero
+        timeout (int, optional): Tiempo máximo de espera en segundos
+
+    Returns:
+        tuple: (índice del candidato ganador, WebElement)
+
+    Raises:
+        TimeoutException: Si ningún candidato alcanza su estado en el tiempo especificado
+    """
+    for _, state in candidates:
+        if state not in ELEMENT_STATES:
+            raise ValueError(f"Unsupported element state: {state}")
+    specs = [[locator[0], locator[1], state] for locator, state in candidates]
+
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        slice_ms = int(max(0, min(remaining, OBSERVER_SLICE)) * 1000)
+        try:
+            result = driver.execute_async_script(OBSERVE_ELEMENTS_JS, specs, slice_ms)
+        except TimeoutException:
+            result = None
+        except JavascriptException as e:
+            if "unloaded" not in str(e):
+                return _poll_for_first_element_state(driver, candidates, deadline, e)
+            # The page navigated while observing: inject again into the new document
+            result = None
+        except WebDriverException as e:
+            return _poll_for_first_element_state(driver, candidates, deadline, e)
+
+        if isinstance(result, list):
+            return result[0], result[1]
+        if isinstance(result, dict) and "error" in result:
+            return _poll_for_first_element_state(driver, candidates, deadline, result["error"])
+        if time.monotonic() >= deadline:
+            expected = " or ".join(f"{locator} {state}" for locator, state in candidates)
+            raise TimeoutException(f"Timed out after {timeout} seconds waiting for {expected}")
+
+
+def _poll_for_first_element_state(driver: WebDriver, candidates, deadline, reason) -> Tuple[int, WebElement]:
+    """
+    Espera clásica con WebDriverWait para el tiempo restante, usada cuando el observer falla.
+    """
+    logger.debug("MutationObserver no disponible para %s (%s); usando WebDriverWait", [locator for locator, _ in candidates], reason)
+    remaining = max(0, deadline - time.monotonic())
+
+    def first_match(current_driver):
+        for index, (locator, state) in enumerate(candidates):
+            element = _check_element_state(current_driver, locator, state)
+            if element:
+                return index, element
+        return False
+
+    # Each missing candidate would otherwise block for the implicit wait before the next one is checked
+    with _no_implicit_wait(driver):
+        return WebDriverWait(driver, remaining).until(first_match)
+
+
+def wait_for_settle(driver: WebDriver, quiet_window=SETTLE_QUIET_WINDOW, timeout=SETTLE_TIMEOUT) -> bool:
+    """
+    Espera a que la aplicación esté en reposo: sin fetch/XHR pendientes y sin nodos ni textos nuevos
+    en el DOM durante `quiet_window` segundos (los cambios de atributos no cuentan). Sustituye a los
+    sleeps fijos entre pasos, con `timeout` como máximo.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        quiet_window (float, optional): Segundos sin actividad para considerar la app en reposo
+        timeout (float, optional): Tiempo máximo de espera en segundos
+
+    Returns:
+        bool: True si la app quedó en reposo, False si se alcanzó el tiempo máximo o no se pudo
+        observar la página (nunca lanza excepción)
+    """
+    logger.debug("Esperando a que la aplicación quede en reposo (%ss sin actividad)", quiet_window)
+    start_time = time.monotonic()
+    deadline = start_time + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        slice_ms = int(max(0, min(remaining, OBSERVER_SLICE)) * 1000)
+        try:
+            settled = driver.execute_async_script(
+                SETTLE_JS, int(quiet_window * 1000), slice_ms, int(SETTLE_MAX_REQUEST_AGE * 1000)
+            )
+        except TimeoutException:
+            settled = False
+        except WebDriverException as e:
+            if not (isinstance(e, JavascriptException) and "unloaded" in str(e)):
+                # Without the observer there is nothing to measure: wait out the timeout like the old fixed sleep
+                logger.debug("No se pudo observar la actividad de la aplicación (%s); esperando %ss", e, timeout)
+                time.sleep(max(0, deadline - time.monotonic()))
+                return False
+            # A navigation resets the page activity; start observing the new document
+            settled = False
+
+        if settled:
+            logger.debug("Aplicación en reposo tras %.2f segundos", time.monotonic() - start_time)
+            return True
+        if time.monotonic() >= deadline:
+            logger.warning("La aplicación no quedó en reposo después de %s segundos", timeout)
+            return False
+
+
+def query_elements_state(driver: WebDriver, locator_states: dict) -> dict:
+    """
+    Evalúa varios localizadores en una única llamada a execute_script.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        locator_states (dict): Localizador -> estado esperado ("present", "visible" o "clickable")
+
+    Returns:
+        dict: Localizador -> WebElement si cumple el estado, None en caso contrario
+    """
+    locators = list(locator_states)
+    specs = [[locator[0], locator[1], locator_states[locator]] for locator in locators]
+    try:
+        results = driver.execute_script(QUERY_ELEMENTS_JS, specs)
+    except JavascriptException as e:
+        if "unloaded" in str(e):
+            return dict.fromkeys(locators)
+        logger.debug("Consulta por lotes no disponible (%s); comprobando localizadores uno a uno", e)
+        # One by one, each missing locator would otherwise block for the implicit wait
+        with _no_implicit_wait(driver):
+            results = [_check_element_state(driver, locator, locator_states[locator]) for locator in locators]
+    return dict(zip(locators, results))
+
+
+def wait_for_elements_state(driver: WebDriver, locator_states: dict, timeout=DEFAULT_TIMEOUT) -> dict:
+    """
+    Espera a que todos los localizadores alcancen su estado, con una sola llamada a
+    execute_script por sondeo en lugar de una espera independiente por elemento.
+
+    Args:
+        driver (WebDriver): Instancia del WebDriver
+        locator_states (dict): Localizador -> estado esperado ("present", "visible" o "clickable")
+        timeout (int, optional): Tiempo máximo de espera en segundos
+
+    Returns:
+        dict: Localizador -> WebElement en el estado solicitado
+
+    Raises:
+        TimeoutException: Si algún localizador no alcanza su estado en el tiempo especificado
+    """
+    for state in locator_states.values():
+        if state not in ELEMENT_STATES:
+            raise ValueError(f"Unsupported element state: {state}")
+
+    deadline = time.monotonic() + timeout
+    while True:
+        results = query_elements_state(driver, locator_states)
+        pending = [locator for locator, element in results.items() if element is None]
+        if not pending:
+            return results
+        if time.monotonic() >= deadline:
+            raise TimeoutException(
+                f"Elements not in the expected state after {timeout} seconds: "
+                + ", ".join(f"{locator} ({locator_states[locator]})" for locator in pending)
+            )
+        time.sleep(POLL_FREQUENCY)
+
+
+def _check_element_state(driver: WebDriver, locator, state):
+    """
+    Comprueba una sola vez el estado de un elemento con las condiciones de Selenium.
+    """
+    try:
+        return ELEMENT_STATES[state](locator)(driver) or None
+    except WebDriverException:
+        return None
+
+
+@contextmanager
+def _no_implicit_wait(driver: WebDriver):
+    """
+    Desactiva la espera implícita del driver mientras dura el bloque y restaura el valor anterior.
+    """
+    previous = driver.timeouts.implicit_wait
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(previous)